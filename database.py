@@ -12,14 +12,32 @@ class DatabaseManager:
     def __init__(self):
         self.conn = None
         self.cursor = None
+        self._tank_level = None  # Lazy in-memory cache of tank_state
+        self._pump_reading = None  # Lazy in-memory cache of the pump counter
         self.connect()
         self.create_tables()
     
     def connect(self):
         """Connect to database"""
         try:
-            self.conn = sqlite3.connect(DB_PATH)
+            # Larger statement cache so hot queries skip re-parsing
+            self.conn = sqlite3.connect(DB_PATH, cached_statements=256)
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # WAL keeps readers and the writer from blocking each other and
+            # synchronous=NORMAL halves the fsync cost per commit
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            # Read-heavy paths: sort/temp tables in RAM, a 64MB page cache
+            # and 256MB of memory-mapped I/O so history scans skip read()
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            self.conn.execute("PRAGMA cache_size = -65536")
+            self.conn.execute("PRAGMA mmap_size = 268435456")
+            # SQLite's NOCASE folds ASCII only; Greek search terms need a
+            # Unicode-aware casefold, registered once per connection
+            self.conn.create_function(
+                "casefold", 1,
+                lambda s: s.casefold() if isinstance(s, str) else s,
+                deterministic=True)
             self.cursor = self.conn.cursor()
             logging.info("Database connected successfully")
         except Exception as e:
@@ -102,6 +120,15 @@ class DatabaseManager:
                 )
             """)
             
+            # Tank state - single-row cache of the current tank level,
+            # maintained incrementally so reads never scan the tank history
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tank_state (
+                    id INTEGER PRIMARY KEY CHECK(id = 1),
+                    current_level REAL NOT NULL DEFAULT 0
+                )
+            """)
+
             # Pump table - για τον μετρητή της αντλίας
             self.cursor.execute("""
                 CREATE TABLE IF NOT EXISTS pump (
@@ -206,12 +233,25 @@ class DatabaseManager:
         """Create database indexes for better performance"""
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_movements_date ON movements(date)",
+            "CREATE INDEX IF NOT EXISTS idx_movements_date_vehicle ON movements(date, vehicle_id, end_km, start_km)",
+            "CREATE INDEX IF NOT EXISTS idx_movements_complete ON movements(vehicle_id, date, end_km, start_km) WHERE end_km IS NOT NULL",
+            "CREATE INDEX IF NOT EXISTS idx_fuel_date_vehicle ON fuel(date, vehicle_id, liters)",
             "CREATE INDEX IF NOT EXISTS idx_movements_vehicle ON movements(vehicle_id)",
+            "CREATE INDEX IF NOT EXISTS idx_movements_vehicle_km ON movements(vehicle_id, COALESCE(end_km, start_km) DESC)",
             "CREATE INDEX IF NOT EXISTS idx_movements_driver ON movements(driver_id)",
+            "CREATE INDEX IF NOT EXISTS idx_movements_driver_date ON movements(driver_id, date)",
+            "CREATE INDEX IF NOT EXISTS idx_fuel_driver_date ON fuel(driver_id, date)",
             "CREATE INDEX IF NOT EXISTS idx_fuel_date ON fuel(date)",
+            "CREATE INDEX IF NOT EXISTS idx_fuel_date_id ON fuel(date DESC, id DESC)",
             "CREATE INDEX IF NOT EXISTS idx_fuel_vehicle ON fuel(vehicle_id)",
+            "CREATE INDEX IF NOT EXISTS idx_fuel_vehicle_date ON fuel(vehicle_id, date)",
+            "CREATE INDEX IF NOT EXISTS idx_vehicles_plate ON vehicles(plate)",
+            "CREATE INDEX IF NOT EXISTS idx_drivers_name_surname ON drivers(name, surname)",
             "CREATE INDEX IF NOT EXISTS idx_tank_date ON tank(date)",
+            "CREATE INDEX IF NOT EXISTS idx_tank_date_type ON tank(date, type)",
+            "CREATE INDEX IF NOT EXISTS idx_tank_type_liters ON tank(type, liters)",
             "CREATE INDEX IF NOT EXISTS idx_pump_date ON pump(date)",
+            "CREATE INDEX IF NOT EXISTS idx_pump_date_id ON pump(date DESC, id DESC)",
             "CREATE INDEX IF NOT EXISTS idx_pump_reading ON pump(reading)",
             "CREATE INDEX IF NOT EXISTS idx_purposes_name ON purposes(name)",
             "CREATE INDEX IF NOT EXISTS idx_purposes_category ON purposes(category)",
@@ -224,6 +264,19 @@ class DatabaseManager:
             except sqlite3.OperationalError:
                 pass  # Index might already exist
 
+        # Dropped: LIKE ignores COLLATE on a bound pattern and a NOCASE
+        # index can never serve a leading-wildcard %term% search anyway
+        try:
+            self.cursor.execute("DROP INDEX IF EXISTS idx_vehicles_plate_nocase")
+        except sqlite3.OperationalError:
+            pass
+
+        # Refresh planner statistics so new indexes are actually chosen
+        try:
+            self.cursor.execute("ANALYZE")
+        except sqlite3.OperationalError:
+            pass
+
     def _run_migrations(self):
         """Apply simple schema migrations (idempotent)"""
         try:
@@ -253,11 +306,96 @@ class DatabaseManager:
                 else:
                     self.cursor.execute("ALTER TABLE movements ADD COLUMN purpose TEXT")
 
+            # Foreign keys: rebuild child tables created before the
+            # ON DELETE CASCADE declarations existed
+            self._ensure_cascade_deletes()
+
+            # Tank state: seed the cached level from the tank history once
+            self.cursor.execute("SELECT COUNT(*) FROM tank_state")
+            if self.cursor.fetchone()[0] == 0:
+                # Two per-type sums instead of one CASE expression so each
+                # half is an index-only scan of idx_tank_type_liters
+                self.cursor.execute("""
+                    INSERT INTO tank_state (id, current_level)
+                    SELECT 1,
+                        (SELECT COALESCE(SUM(liters), 0) FROM tank WHERE type = 'fill')
+                        - (SELECT COALESCE(SUM(liters), 0) FROM tank WHERE type != 'fill')
+                """)
+
             self.conn.commit()
             logging.info("Migrations applied (purpose column ensured).")
         except Exception as e:
             logging.error(f"Migration error: {e}")
     
+    def _ensure_cascade_deletes(self):
+        """Rebuild movements/fuel tables that predate the FK cascade clauses
+
+        SQLite bakes foreign keys into the table definition, so old
+        databases never cascade on vehicle/driver delete and a single
+        DELETE would leave orphaned rows. Idempotent: tables that already
+        report foreign keys are left untouched.
+        """
+        rebuilds = {
+            'movements': """
+                CREATE TABLE movements_rebuild (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    movement_number INTEGER UNIQUE,
+                    vehicle_id INTEGER NOT NULL,
+                    driver_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    start_km INTEGER NOT NULL,
+                    end_km INTEGER,
+                    route TEXT,
+                    purpose TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY(vehicle_id) REFERENCES vehicles(id) ON DELETE CASCADE,
+                    FOREIGN KEY(driver_id) REFERENCES drivers(id) ON DELETE CASCADE
+                )
+            """,
+            'fuel': """
+                CREATE TABLE fuel_rebuild (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    vehicle_id INTEGER NOT NULL,
+                    driver_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    liters REAL NOT NULL,
+                    mileage INTEGER,
+                    cost REAL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY(vehicle_id) REFERENCES vehicles(id) ON DELETE CASCADE,
+                    FOREIGN KEY(driver_id) REFERENCES drivers(id) ON DELETE CASCADE
+                )
+            """,
+        }
+
+        rebuilt = False
+        for table, create_sql in rebuilds.items():
+            self.cursor.execute(f"PRAGMA foreign_key_list({table})")
+            if self.cursor.fetchall():
+                continue  # Already has foreign keys
+            rebuilt = True
+
+            logging.info(f"Rebuilding {table} table with ON DELETE CASCADE")
+            self.cursor.execute("PRAGMA foreign_keys = OFF")
+            try:
+                self.cursor.execute(create_sql)
+                self.cursor.execute(f"PRAGMA table_info({table})")
+                cols = ", ".join(r[1] for r in self.cursor.fetchall())
+                self.cursor.execute(
+                    f"INSERT INTO {table}_rebuild ({cols}) SELECT {cols} FROM {table}"
+                )
+                self.cursor.execute(f"DROP TABLE {table}")
+                self.cursor.execute(f"ALTER TABLE {table}_rebuild RENAME TO {table}")
+                self.conn.commit()
+            finally:
+                self.cursor.execute("PRAGMA foreign_keys = ON")
+
+        if rebuilt:
+            # Dropping the old tables removed their indexes as well
+            self._create_indexes()
+            self.conn.commit()
+
     def get_setting(self, setting_name, default_value=""):
         """Get a system setting value"""
         try:
@@ -302,36 +440,113 @@ class DatabaseManager:
             logging.error(f"Backup error: {e}")
             return False
 
+    def backup_database_online(self, backup_path, progress=None):
+        """Online backup via the SQLite backup API (safe while in use)
+
+        Opens its own source connection so it can run off the UI thread,
+        and copies 64 pages per step so concurrent writers are never
+        blocked for long. ``progress(remaining, total)`` is called between
+        steps when given. Raises on failure.
+        """
+        src = sqlite3.connect(DB_PATH)
+        try:
+            dest = sqlite3.connect(backup_path)
+            try:
+                if progress is not None:
+                    src.backup(dest, pages=64,
+                               progress=lambda status, remaining, total:
+                                   progress(remaining, total))
+                else:
+                    src.backup(dest, pages=64)
+            finally:
+                dest.close()
+        finally:
+            src.close()
+        logging.info(f"Database backed up to {backup_path}")
+
+    def get_tank_level(self):
+        """Get current tank level (in-memory cache over the tank_state row)"""
+        if self._tank_level is not None:
+            return self._tank_level
+        try:
+            self.cursor.execute("SELECT current_level FROM tank_state WHERE id = 1")
+            result = self.cursor.fetchone()
+            self._tank_level = result[0] if result else 0.0
+        except Exception as e:
+            logging.error(f"Error getting tank level: {e}")
+            return 0.0
+        return self._tank_level
+
+    def adjust_tank_level(self, delta):
+        """Apply a +/- liters delta to the cached tank level
+
+        Runs inside the caller's transaction; the caller commits. The
+        in-memory cache moves with the row, so readers stay O(1).
+        """
+        self.cursor.execute(
+            "UPDATE tank_state SET current_level = current_level + ? WHERE id = 1",
+            (delta,)
+        )
+        if self._tank_level is not None:
+            self._tank_level += delta
+
+    def invalidate_tank_level(self):
+        """Drop the in-memory tank level (e.g. after a rolled-back write)"""
+        self._tank_level = None
+
+    def invalidate_pump_reading(self):
+        """Drop the in-memory pump reading (e.g. after a rolled-back write)"""
+        self._pump_reading = None
+
     def get_pump_reading(self):
-        """Get current pump reading"""
+        """Get current pump reading (in-memory cache over the setting row)"""
+        if self._pump_reading is not None:
+            return self._pump_reading
         try:
-            return float(self.get_setting('pump_current_reading', '0'))
+            self._pump_reading = float(self.get_setting('pump_current_reading', '0'))
         except:
             return 0.0
+        return self._pump_reading
 
     def update_pump_reading(self, new_reading, liters_dispensed, vehicle_plate="", driver_name="", notes=""):
         """Update pump reading and log the transaction"""
         try:
             current_reading = self.get_pump_reading()
-            
-            # Log pump transaction
-            self.cursor.execute("""
-                INSERT INTO pump (date, reading, liters_dispensed, vehicle_plate, driver_name, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), new_reading, liters_dispensed, 
-                  vehicle_plate, driver_name, notes))
-            
-            # Update current reading setting
-            self.set_setting('pump_current_reading', str(new_reading))
-            self.conn.commit()
-            
+
+            # Log transaction and bump the current-reading setting in one
+            # commit (= one fsync). When the caller already has a
+            # transaction open (e.g. _add_fuel's BEGIN IMMEDIATE), execute
+            # inside it instead: `with self.conn` would commit or roll
+            # back the caller's whole transaction, not just these rows
+            if self.conn.in_transaction:
+                self._execute_pump_update(new_reading, liters_dispensed,
+                                          vehicle_plate, driver_name, notes)
+            else:
+                with self.conn:
+                    self._execute_pump_update(new_reading, liters_dispensed,
+                                              vehicle_plate, driver_name, notes)
+            self._pump_reading = float(new_reading)
+
             logging.info(f"Pump reading updated: {current_reading} -> {new_reading} (+{liters_dispensed}L)")
             return True
-            
+
         except Exception as e:
+            self._pump_reading = None
             logging.error(f"Error updating pump reading: {e}")
             return False
 
+    def _execute_pump_update(self, new_reading, liters_dispensed, vehicle_plate, driver_name, notes):
+        """Execute the two pump-update statements (no commit here)"""
+        self.conn.execute("""
+            INSERT INTO pump (date, reading, liters_dispensed, vehicle_plate, driver_name, notes)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), new_reading, liters_dispensed,
+              vehicle_plate, driver_name, notes))
+        self.conn.execute("""
+            INSERT OR REPLACE INTO system_settings (setting_name, setting_value, notes, updated_at)
+            VALUES ('pump_current_reading', ?, '', ?)
+        """, (str(new_reading), datetime.now().isoformat()))
+
     def get_pump_history(self, limit=50):
         """Get pump transaction history"""
         try:
@@ -376,19 +591,26 @@ class DatabaseManager:
     
     # ===== PURPOSE MANAGEMENT METHODS =====
     
-    def get_purposes(self, category=None, active_only=True):
-        """Get all purposes, optionally filtered by category"""
+    def get_purposes(self, category=None, active_only=True, search_term=None):
+        """Get all purposes, optionally filtered by category and search term"""
         try:
             query = "SELECT id, name, description, category, active FROM purposes"
             params = []
-            
+
             conditions = []
             if active_only:
                 conditions.append("active = 1")
             if category:
                 conditions.append("category = ?")
                 params.append(category)
-            
+            if search_term:
+                # casefold() (registered in connect) folds Greek too,
+                # which COLLATE NOCASE does not
+                conditions.append(
+                    "(casefold(name) LIKE ? OR casefold(COALESCE(description, '')) LIKE ?)")
+                pattern = f"%{search_term.casefold()}%"
+                params.extend([pattern, pattern])
+
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
             
@@ -500,54 +722,39 @@ class DatabaseManager:
             analytics['driver_name'] = driver_info[1]  # name field
             analytics['driver_id'] = driver_id
             
-            # Date filter condition
+            # Date filter condition (numbered params so the scalar
+            # subqueries below can share one bound parameter list)
             date_condition = ""
             date_params = [driver_id]
-            
+
             if start_date and end_date:
-                date_condition = " AND date BETWEEN ? AND ?"
+                date_condition = " AND date BETWEEN ?2 AND ?3"
                 date_params.extend([start_date, end_date])
             elif start_date:
-                date_condition = " AND date >= ?"
+                date_condition = " AND date >= ?2"
                 date_params.append(start_date)
             elif end_date:
-                date_condition = " AND date <= ?"
+                date_condition = " AND date <= ?2"
                 date_params.append(end_date)
-            
-            # Total movements
-            self.cursor.execute(f"""
-                SELECT COUNT(*) FROM movements 
-                WHERE driver_id = ?{date_condition}
-            """, date_params)
-            analytics['total_movements'] = self.cursor.fetchone()[0]
-            
-            # Total kilometers
-            self.cursor.execute(f"""
-                SELECT SUM(end_km - start_km) as total_km
-                FROM movements 
-                WHERE driver_id = ? AND end_km IS NOT NULL{date_condition}
-            """, date_params)
-            result = self.cursor.fetchone()[0]
-            analytics['total_kilometers'] = result if result else 0
-            
-            # Total fuel consumed
-            self.cursor.execute(f"""
-                SELECT SUM(liters) as total_fuel
-                FROM fuel 
-                WHERE driver_id = ?{date_condition}
-            """, date_params)
-            result = self.cursor.fetchone()[0]
-            analytics['total_fuel_liters'] = result if result else 0
-            
-            # Total fuel cost
+
+            # All four totals in one round-trip; COALESCE replaces the
+            # Python "if result else 0" fix-ups
             self.cursor.execute(f"""
-                SELECT SUM(cost) as total_cost
-                FROM fuel 
-                WHERE driver_id = ?{date_condition}
+                SELECT
+                    (SELECT COUNT(*) FROM movements
+                     WHERE driver_id = ?1{date_condition}),
+                    (SELECT COALESCE(SUM(end_km - start_km), 0) FROM movements
+                     WHERE driver_id = ?1 AND end_km IS NOT NULL{date_condition}),
+                    (SELECT COALESCE(SUM(liters), 0) FROM fuel
+                     WHERE driver_id = ?1{date_condition}),
+                    (SELECT COALESCE(SUM(cost), 0) FROM fuel
+                     WHERE driver_id = ?1{date_condition})
             """, date_params)
-            result = self.cursor.fetchone()[0]
-            analytics['total_fuel_cost'] = result if result else 0
-            
+            (analytics['total_movements'],
+             analytics['total_kilometers'],
+             analytics['total_fuel_liters'],
+             analytics['total_fuel_cost']) = self.cursor.fetchone()
+
             # Average consumption (km per liter)
             if analytics['total_fuel_liters'] > 0:
                 analytics['avg_consumption_km_per_liter'] = round(
@@ -566,60 +773,73 @@ class DatabaseManager:
             
             # Most used vehicles
             self.cursor.execute(f"""
-                SELECT v.plate, COUNT(*) as usage_count, SUM(m.end_km - m.start_km) as total_km
+                SELECT v.plate, COUNT(*) as usage_count,
+                       COALESCE(SUM(m.end_km - m.start_km), 0) as total_km
                 FROM movements m
                 JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE m.driver_id = ? AND m.end_km IS NOT NULL{date_condition}
+                WHERE m.driver_id = ?1 AND m.end_km IS NOT NULL{date_condition}
                 GROUP BY v.id, v.plate
                 ORDER BY usage_count DESC
                 LIMIT 5
             """, date_params)
             analytics['most_used_vehicles'] = [
-                {
-                    'plate': row[0], 
-                    'usage_count': row[1], 
-                    'total_km': row[2] if row[2] else 0
-                }
+                {'plate': row[0], 'usage_count': row[1], 'total_km': row[2]}
                 for row in self.cursor.fetchall()
             ]
-            
-            # Monthly breakdown
+
+            # Monthly breakdown: both tables pre-aggregated per month and
+            # joined, instead of a correlated strftime subquery that
+            # re-scanned the fuel table for every month row
             self.cursor.execute(f"""
-                SELECT 
-                    strftime('%Y-%m', date) as month,
-                    COUNT(*) as movements,
-                    SUM(end_km - start_km) as km,
-                    (SELECT SUM(liters) FROM fuel f WHERE f.driver_id = m.driver_id 
-                     AND strftime('%Y-%m', f.date) = strftime('%Y-%m', m.date)) as fuel
-                FROM movements m
-                WHERE driver_id = ? AND end_km IS NOT NULL{date_condition}
-                GROUP BY strftime('%Y-%m', date)
-                ORDER BY month DESC
+                WITH mov AS (
+                    SELECT strftime('%Y-%m', date) as month,
+                           COUNT(*) as movements,
+                           COALESCE(SUM(end_km - start_km), 0) as km
+                    FROM movements
+                    WHERE driver_id = ?1 AND end_km IS NOT NULL{date_condition}
+                    GROUP BY month
+                ),
+                fu AS (
+                    SELECT strftime('%Y-%m', date) as month,
+                           SUM(liters) as fuel
+                    FROM fuel
+                    WHERE driver_id = ?1{date_condition}
+                    GROUP BY month
+                )
+                SELECT mov.month, mov.movements, mov.km, COALESCE(fu.fuel, 0)
+                FROM mov
+                LEFT JOIN fu ON fu.month = mov.month
+                ORDER BY mov.month DESC
                 LIMIT 12
             """, date_params)
             analytics['monthly_breakdown'] = [
                 {
                     'month': row[0],
                     'movements': row[1],
-                    'kilometers': row[2] if row[2] else 0,
-                    'fuel_liters': row[3] if row[3] else 0
+                    'kilometers': row[2],
+                    'fuel_liters': row[3]
                 }
                 for row in self.cursor.fetchall()
             ]
-            
-            # Purpose breakdown
+
+            # Purpose breakdown, with the share computed by a window
+            # function instead of a client-side total
             self.cursor.execute(f"""
-                SELECT purpose, COUNT(*) as count, SUM(end_km - start_km) as total_km
-                FROM movements 
-                WHERE driver_id = ? AND end_km IS NOT NULL{date_condition}
-                GROUP BY purpose
+                SELECT COALESCE(NULLIF(purpose, ''), 'Άλλο') as purpose,
+                       COUNT(*) as count,
+                       COALESCE(SUM(end_km - start_km), 0) as total_km,
+                       100.0 * COUNT(*) / SUM(COUNT(*)) OVER () as percentage
+                FROM movements
+                WHERE driver_id = ?1 AND end_km IS NOT NULL{date_condition}
+                GROUP BY 1
                 ORDER BY count DESC
             """, date_params)
             analytics['purpose_breakdown'] = [
                 {
-                    'purpose': row[0] if row[0] else 'Άλλο',
+                    'purpose': row[0],
                     'count': row[1],
-                    'total_km': row[2] if row[2] else 0
+                    'total_km': row[2],
+                    'percentage': row[3]
                 }
                 for row in self.cursor.fetchall()
             ]
@@ -639,30 +859,66 @@ class DatabaseManager:
             return None
     
     def get_all_drivers_summary(self, start_date=None, end_date=None):
-        """Get summary analytics for all drivers"""
+        """Get summary analytics for all drivers
+
+        One grouped query per table joined against drivers, instead of
+        re-running the full per-driver analytics for every driver.
+        """
         try:
-            drivers = self.get_all_drivers()
+            date_condition = ""
+            date_params = []
+
+            if start_date and end_date:
+                date_condition = " AND date BETWEEN ?1 AND ?2"
+                date_params = [start_date, end_date]
+            elif start_date:
+                date_condition = " AND date >= ?1"
+                date_params = [start_date]
+            elif end_date:
+                date_condition = " AND date <= ?1"
+                date_params = [end_date]
+
+            self.cursor.execute(f"""
+                SELECT d.id, d.name,
+                       COALESCE(mv.total_movements, 0),
+                       COALESCE(mv.total_km, 0),
+                       COALESCE(fu.total_liters, 0),
+                       COALESCE(fu.total_cost, 0)
+                FROM drivers d
+                LEFT JOIN (
+                    SELECT driver_id,
+                           COUNT(*) as total_movements,
+                           SUM(CASE WHEN end_km IS NOT NULL
+                                    THEN end_km - start_km END) as total_km
+                    FROM movements
+                    WHERE 1=1{date_condition}
+                    GROUP BY driver_id
+                ) mv ON mv.driver_id = d.id
+                LEFT JOIN (
+                    SELECT driver_id,
+                           SUM(liters) as total_liters,
+                           SUM(cost) as total_cost
+                    FROM fuel
+                    WHERE 1=1{date_condition}
+                    GROUP BY driver_id
+                ) fu ON fu.driver_id = d.id
+                ORDER BY COALESCE(mv.total_km, 0) DESC
+            """, date_params)
+
             summary = []
-            
-            for driver in drivers:
-                driver_id = driver[0]
-                analytics = self.get_driver_analytics(driver_id, start_date, end_date)
-                if analytics:
-                    summary.append({
-                        'driver_id': driver_id,
-                        'driver_name': analytics['driver_name'],
-                        'total_movements': analytics['total_movements'],
-                        'total_kilometers': analytics['total_kilometers'],
-                        'total_fuel_liters': analytics['total_fuel_liters'],
-                        'total_fuel_cost': analytics['total_fuel_cost'],
-                        'avg_consumption': analytics['avg_consumption_km_per_liter'],
-                        'avg_cost_per_km': analytics['avg_cost_per_km']
-                    })
-            
-            # Sort by total kilometers descending
-            summary.sort(key=lambda x: x['total_kilometers'], reverse=True)
+            for driver_id, name, movements, km, liters, cost in self.cursor.fetchall():
+                summary.append({
+                    'driver_id': driver_id,
+                    'driver_name': name,
+                    'total_movements': movements,
+                    'total_kilometers': km,
+                    'total_fuel_liters': liters,
+                    'total_fuel_cost': cost,
+                    'avg_consumption': round(km / liters, 2) if liters > 0 else 0,
+                    'avg_cost_per_km': round(cost / km, 3) if km > 0 else 0
+                })
             return summary
-            
+
         except Exception as e:
             logging.error(f"Error getting drivers summary: {e}")
             return []
@@ -14,12 +14,20 @@ Key improvements:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import font as tkfont
 import sqlite3
-from datetime import datetime
+from collections import namedtuple
+from datetime import date, datetime
 import os
 import sys
 import logging
 import csv
+import queue
+import shutil
+import subprocess
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 # Import custom modules
 from database import DatabaseManager
@@ -35,7 +43,7 @@ from utils import (
 from config import (
     THEMES, BUTTON_STYLES, FONT_BIG, FONT_NORMAL, FONT_SMALL,
     FONT_TITLE, FONT_SUBTITLE, IMAGES_DIR, TANK_MIN_LEVEL,
-    TANK_CAPACITY, DEFAULT_PASSWORD, LOGGING_CONFIG
+    TANK_CAPACITY, DEFAULT_PASSWORD, LOGGING_CONFIG, DB_PATH
 )
 
 # Configure logging
@@ -56,9 +64,310 @@ except ImportError:
     EXCEL_AVAILABLE = False
     logging.warning("openpyxl not available - Excel export disabled")
 
+# Hot-path SQL hoisted to module level so the same statement strings (and
+# SQLite's cached query plans) are reused on every call
+_SQL_INSERT_FUEL = """
+    INSERT INTO fuel (vehicle_id, driver_id, date, liters, mileage, cost)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_TANK_CONSUME = """
+    INSERT INTO tank (date, liters, type, notes)
+    VALUES (?, ?, 'consume', ?)
+"""
+_SQL_INSERT_TANK_FILL = """
+    INSERT INTO tank (date, liters, type, notes)
+    VALUES (?, ?, 'fill', ?)
+"""
+
+# Hot-path SQL lifted to module constants: passing the identical string
+# object on every call guarantees sqlite3 statement-cache hits instead of
+# re-parsing freshly built literals
+_SQL_MONTHLY_VEHICLE_DATA = """
+    WITH mov AS (
+        SELECT vehicle_id,
+               COUNT(id) AS total_movements,
+               SUM(end_km - start_km) AS total_km,
+               MIN(start_km) AS min_km,
+               MAX(end_km) AS max_km
+        FROM movements
+        WHERE date >= ? AND date < ? AND end_km IS NOT NULL
+        GROUP BY vehicle_id
+    ),
+    fu AS (
+        SELECT vehicle_id,
+               SUM(liters) AS total_fuel,
+               COUNT(id) AS fuel_refills,
+               AVG(liters) AS avg_fuel_per_refill
+        FROM fuel
+        WHERE date >= ? AND date < ?
+        GROUP BY vehicle_id
+    )
+    SELECT v.plate, v.brand, v.vtype,
+           COALESCE(mov.total_movements, 0),
+           COALESCE(mov.total_km, 0),
+           COALESCE(mov.min_km, 0),
+           COALESCE(mov.max_km, 0),
+           COALESCE(fu.total_fuel, 0),
+           COALESCE(fu.fuel_refills, 0),
+           COALESCE(fu.avg_fuel_per_refill, 0)
+    FROM vehicles v
+    LEFT JOIN mov ON mov.vehicle_id = v.id
+    LEFT JOIN fu ON fu.vehicle_id = v.id
+    ORDER BY v.plate
+"""
+
+_SQL_STATS_SCALARS = """
+    SELECT (SELECT COUNT(*) FROM vehicles),
+           (SELECT COUNT(*) FROM drivers),
+           (SELECT COUNT(*) FROM movements
+             WHERE date >= ?1 AND date < ?2 AND end_km IS NOT NULL),
+           (SELECT COALESCE(SUM(end_km - start_km), 0)
+              FROM movements
+             WHERE date >= ?1 AND date < ?2 AND end_km IS NOT NULL),
+           (SELECT COALESCE(SUM(liters), 0) FROM fuel
+             WHERE date >= ?1 AND date < ?2),
+           (SELECT COUNT(*) FROM movements WHERE end_km IS NULL),
+           COALESCE((SELECT current_level FROM tank_state WHERE id = 1), 0)
+"""
+
+# Aggregate only the month's movement rows, pick the top 5, then join the
+# plates back — the old LEFT JOIN grouped over every vehicle in the fleet
+_SQL_STATS_TOP5 = """
+    SELECT v.plate, x.total_km
+    FROM (
+        SELECT vehicle_id, SUM(end_km - start_km) AS total_km
+        FROM movements
+        WHERE date >= ? AND date < ? AND end_km IS NOT NULL
+        GROUP BY vehicle_id
+        ORDER BY total_km DESC
+        LIMIT 5
+    ) x
+    JOIN vehicles v ON v.id = x.vehicle_id
+    ORDER BY x.total_km DESC
+"""
+
+# Display formatting happens in SQL: printf/CASE run in SQLite's C core,
+# so the Python side just forwards ready-made tuples to the tree
+_SQL_VEHICLE_MOVEMENTS = """
+    SELECT m.date, d.name || ' ' || d.surname,
+           CASE WHEN COALESCE(m.movement_number, 0) > 0
+                THEN printf('%04d', m.movement_number) ELSE '---' END,
+           CASE WHEN COALESCE(m.start_km, 0) != 0
+                THEN printf('%.0f', m.start_km) ELSE '' END,
+           CASE WHEN COALESCE(m.end_km, 0) != 0
+                THEN printf('%.0f', m.end_km) ELSE 'Δεν επέστρεψε' END,
+           CASE WHEN (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) > 0
+                THEN printf('%.1f', COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0))
+                ELSE '' END,
+           COALESCE(m.route, ''), COALESCE(m.purpose, '')
+    FROM movements m
+    JOIN drivers d ON m.driver_id = d.id
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE v.plate = ?
+    ORDER BY m.date DESC, m.id DESC
+"""
+
+_SQL_VEHICLE_MOVEMENT_TOTALS = """
+    SELECT COUNT(*) as total_movements,
+           COALESCE(SUM(end_km - start_km), 0) as total_km,
+           COALESCE(AVG(end_km - start_km), 0) as avg_km
+    FROM movements m
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE v.plate = ? AND m.end_km IS NOT NULL
+"""
+
+_SQL_VEHICLE_FUEL = """
+    SELECT f.date, d.name || ' ' || d.surname,
+           printf('%.1f', f.liters),
+           CASE WHEN COALESCE(f.mileage, 0) != 0
+                THEN printf('%.0f', f.mileage) ELSE '' END,
+           CASE WHEN COALESCE(f.cost, 0) != 0
+                THEN printf('%.2f €', f.cost) ELSE '0.00 €' END
+    FROM fuel f
+    JOIN drivers d ON f.driver_id = d.id
+    JOIN vehicles v ON f.vehicle_id = v.id
+    WHERE v.plate = ?
+    ORDER BY f.date DESC
+"""
+
+_SQL_VEHICLE_FUEL_TOTALS = """
+    SELECT COALESCE(SUM(f.liters), 0), COALESCE(SUM(f.cost), 0)
+    FROM fuel f
+    JOIN vehicles v ON f.vehicle_id = v.id
+    WHERE v.plate = ?
+"""
+
+_SQL_VEHICLE_STATS = """
+    SELECT COUNT(*) as total_movements,
+           COALESCE(SUM(end_km - start_km), 0) as total_km,
+           COALESCE(AVG(end_km - start_km), 0) as avg_km,
+           COALESCE(MIN(start_km), 0) as min_km,
+           COALESCE(MAX(end_km), 0) as max_km
+    FROM movements m
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE v.plate = ? AND m.end_km IS NOT NULL
+"""
+
+_SQL_VEHICLE_ACTIVE_COUNT = """
+    SELECT COUNT(*) FROM movements m
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE v.plate = ? AND m.end_km IS NULL
+"""
+
+_SQL_EXPORT_MOVEMENTS = """
+    SELECT m.date, d.name || ' ' || d.surname, v.plate,
+           m.start_km, m.end_km, m.route, m.purpose,
+           (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)),
+           COALESCE(m.movement_number, 0)
+    FROM movements m
+    JOIN drivers d ON m.driver_id = d.id
+    JOIN vehicles v ON m.vehicle_id = v.id
+    ORDER BY m.date DESC
+"""
+
+_SQL_EXPORT_FUEL = """
+    SELECT f.date, d.name || ' ' || d.surname, v.plate, f.liters, f.mileage, f.cost
+    FROM fuel f
+    JOIN drivers d ON f.driver_id = d.id
+    JOIN vehicles v ON f.vehicle_id = v.id
+    ORDER BY f.date DESC
+"""
+
+# Movement hot-path statements: one literal per query keeps them pinned
+# in the connection's statement cache, so repeat calls skip the prepare
+_SQL_INSERT_MOVEMENT = """
+    INSERT INTO movements (movement_number, vehicle_id, driver_id, date, start_km, route, purpose)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_CLAIM_MOVEMENT_COUNTER = """
+    INSERT OR REPLACE INTO system_settings (setting_name, setting_value, notes, updated_at)
+    VALUES ('movement_counter', ?, '', ?)
+"""
+
+_SQL_ACTIVE_AND_NEXT_NUMBER = """
+    SELECT EXISTS(SELECT 1 FROM movements WHERE vehicle_id = ? AND end_km IS NULL),
+           COALESCE((SELECT CAST(setting_value AS INTEGER) FROM system_settings
+                     WHERE setting_name = 'movement_counter'), 0) + 1
+"""
+
+_SQL_LAST_KM = """
+    SELECT COALESCE(end_km, start_km)
+    FROM movements
+    WHERE vehicle_id = ?
+    ORDER BY COALESCE(end_km, start_km) DESC
+    LIMIT 1
+"""
+
+_SQL_ACTIVE_MOVEMENTS = """
+    SELECT m.id,
+           CASE WHEN COALESCE(m.movement_number, 0) > 0
+                THEN printf('%04d', m.movement_number) ELSE '---' END,
+           m.date,
+           d.name || ' ' || d.surname as driver, v.plate,
+           m.start_km, m.route, m.purpose
+    FROM movements m
+    JOIN drivers d ON m.driver_id = d.id
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE m.end_km IS NULL
+"""
+
+_SQL_COMPLETED_TODAY = """
+    SELECT m.id,
+           CASE WHEN COALESCE(m.movement_number, 0) > 0
+                THEN printf('%04d', m.movement_number) ELSE '---' END,
+           m.date,
+           d.name || ' ' || d.surname as driver, v.plate,
+           m.start_km, m.end_km, m.route, m.purpose,
+           (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) as total_km
+    FROM movements m
+    JOIN drivers d ON m.driver_id = d.id
+    JOIN vehicles v ON m.vehicle_id = v.id
+    WHERE m.end_km IS NOT NULL AND m.date = ?
+"""
+
+# casefold() is registered in DatabaseManager.connect; unlike COLLATE
+# NOCASE it also folds Greek, matching the old Python .lower() filter
+_SQL_MOVEMENT_SEARCH = """ AND casefold(m.date || ' ' || d.name || ' ' || d.surname || ' ' ||
+           v.plate || ' ' || COALESCE(m.route, '') || ' ' ||
+           COALESCE(m.purpose, '')) LIKE ?"""
+
+_SQL_CLOSE_MOVEMENT = "UPDATE movements SET end_km = ? WHERE id = ?"
+
+# Movement document template, built once at import; only the variable
+# fields are formatted per document
+_MOVEMENT_DOC_TMPL = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    ΕΓΓΡΑΦΟ ΚΙΝΗΣΗΣ ΟΧΗΜΑΤΟΣ                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+ ΑΡΙΘΜΟΣ ΚΙΝΗΣΗΣ: {movement_number:04d}
+📅 ΗΜΕΡΟΜΗΝΙΑ: {formatted_date}
+👤 ΟΔΗΓΟΣ: {driver}
+🚗 ΟΧΗΜΑ: {vehicle}
+️ ΧΙΛΙΟΜΕΤΡΑ ΑΝΑΧΩΡΗΣΗΣ: {start_km:,} χλμ
+🗺️ ΔΙΑΔΡΟΜΗ: {route}
+ ΣΚΟΠΟΣ: {purpose}
+
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              ΥΠΟΓΡΑΦΕΣ                                     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+👤 Υπογραφή Οδηγού: _________________    📅 Ημερομηνία: _________________
+
+ Υπογραφή Υπευθύνου: _________________    📅 Ημερομηνία: _________________
+
+══════════════════════════════════════════════════════════════════════════════════
+
+📋 ΣΗΜΕΙΩΣΕΙΣ:
+• Το παρόν έγγραφο πρέπει να συμπληρωθεί κατά την επιστροφή του οχήματος
+• Χιλιόμετρα επιστροφής: _________________ χλμ
+• Συνολικά χιλιόμετρα: _________________ χλμ
+• Καύσιμα που καταναλώθηκε: _________________ L
+
+══════════════════════════════════════════════════════════════════════════════════
+
+📅 Δημιουργήθηκε: {created}
+🖥️ Εφαρμογή: Fleet Management System v2.0
+"""
+
+# Greek month names, indexed by month number - 1
+_GREEK_MONTHS = (
+    "Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος",
+    "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"
+)
+
+# Combobox value tuples built once at import instead of per tab build
+_MONTHS = tuple(str(i) for i in range(1, 13))
+_YEAR_RANGE = tuple(str(y) for y in range(2020, datetime.now().year + 5))
+
+# Monthly report row: slots-based attribute access is cheaper and leaner
+# than an 11-key dict per vehicle
+VehicleMonthRow = namedtuple("VehicleMonthRow", (
+    "plate", "brand", "type", "total_movements", "total_km", "min_km",
+    "max_km", "total_fuel", "fuel_refills", "avg_fuel_per_refill",
+    "efficiency_km_per_liter"))
+
+def _month_bounds(year, month):
+    """Half-open [start, end) ISO-date range covering one month
+
+    Range predicates let SQLite seek the date indexes; a LIKE 'YYYY-MM%'
+    pattern on the same column forces a scan.
+    """
+    start = f"{year}-{month:02d}-01"
+    if month == 12:
+        end = f"{year + 1}-01-01"
+    else:
+        end = f"{year}-{month + 1:02d}-01"
+    return start, end
+
 class FleetManagerImproved(ValidationMixin):
     """Improved Fleet Management System with better UX and code organization"""
-    
+
+    # Movement-tree rows inserted per UI breath; larger fills continue in
+    # after_idle slices (see _fill_movement_tree)
+    _FILL_CHUNK = 300
+
     def __init__(self, root):
         self.root = root
         # Load saved theme preference
@@ -66,7 +375,30 @@ class FleetManagerImproved(ValidationMixin):
         self.current_theme = load_user_setting("theme", "light")
         self.db = None
         self.tooltip_manager = TooltipManager()
-        
+        # Small pool for file I/O (photo copies etc.) so it never blocks the UI
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Month folders already created this session, so the document
+        # writer calls os.makedirs once per month instead of per document
+        self._created_month_dirs = set()
+        # Monthly report/statistics caches, keyed by (month, year, generation);
+        # the generation counter bumps on every movements/fuel/tank write so
+        # stale entries can never be served
+        self._db_generation = 0
+        self._monthly_cache = {}
+        self._stats_cache = None
+        self._last_km_cache = {}
+        # Dedicated writer thread: Tk callbacks enqueue write batches and
+        # return immediately instead of waiting on the commit fsync
+        self._db_write_queue = queue.Queue()
+        self._last_claimed_movement_number = 0
+        self._db_writer_thread = threading.Thread(
+            target=self._db_writer_loop, daemon=True)
+        self._db_writer_thread.start()
+        # Themeable widgets found by the first theme walk; later theme
+        # switches iterate this set directly instead of re-walking the
+        # whole tree. WeakSet so destroyed widgets drop out on their own
+        self._themed_widgets = weakref.WeakSet()
+
         # Initialize application
         self._setup_window()
         self._setup_database()
@@ -500,7 +832,8 @@ class FleetManagerImproved(ValidationMixin):
         # Configure ttk styles
         style = ttk.Style()
         style.theme_use('clam')
-        
+        self._configure_fleet_styles()
+
         # Configure tab styling with soft colors
         style.configure('TNotebook', 
                        background=THEMES[self.current_theme]["bg"],
@@ -699,7 +1032,7 @@ class FleetManagerImproved(ValidationMixin):
                 bg=THEMES[self.current_theme]["frame_bg"], 
                 fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0, sticky="w", padx=5, pady=8)
         
-        self.mov_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self.mov_date_var = tk.StringVar(value=date.today().isoformat())
         self.mov_date_entry = tk.Entry(
             form_container, 
             textvariable=self.mov_date_var, 
@@ -1143,8 +1476,11 @@ class FleetManagerImproved(ValidationMixin):
         # Add scrollbars
         v_scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=self.tree_vehicles.yview)
         h_scrollbar = ttk.Scrollbar(tree_container, orient="horizontal", command=self.tree_vehicles.xview)
-        self.tree_vehicles.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
+        # Route the vertical scroll through our handler so more rows can be
+        # lazy-loaded when the user approaches the bottom of the list
+        self.vehicles_v_scrollbar = v_scrollbar
+        self.tree_vehicles.configure(yscrollcommand=self._on_vehicle_scroll, xscrollcommand=h_scrollbar.set)
+
         self.tree_vehicles.pack(side="left", fill="both", expand=True)
         v_scrollbar.pack(side="right", fill="y")
         h_scrollbar.pack(side="bottom", fill="x")
@@ -1548,7 +1884,7 @@ class FleetManagerImproved(ValidationMixin):
                 bg=THEMES[self.current_theme]["frame_bg"], 
                 fg=THEMES[self.current_theme]["fg"]).pack(side="left")
         
-        self.fuel_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self.fuel_date_var = tk.StringVar(value=date.today().isoformat())
         self.fuel_date_entry = tk.Entry(
             date_frame, 
             textvariable=self.fuel_date_var, 
@@ -1743,9 +2079,10 @@ class FleetManagerImproved(ValidationMixin):
         main_canvas.pack(side="left", fill="both", expand=True, padx=10)
         scrollbar.pack(side="right", fill="y", padx=(0, 10))
 
-        # Load initial data
-        self._load_fuel()
+        # Combos are small and needed by the form right away; the fuel table
+        # itself can be large, so defer it until the tab has painted
         self._load_fuel_combos()
+        self.root.after_idle(self._load_fuel)
     
     def _build_purposes_tab(self):
         """Build purposes management tab with two-column layout"""
@@ -1956,48 +2293,56 @@ class FleetManagerImproved(ValidationMixin):
     
     def _build_reports_tab(self):
         """Build improved reports tab"""
+        # Hoist the theme lookups out of the widget-construction loop
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+        frame_bg = theme["frame_bg"]
+        accent = theme["accent"]
+        entry_bg = theme["entry_bg"]
+
         # Main container
-        main_frame = tk.Frame(self.tab_reports, bg=THEMES[self.current_theme]["bg"])
+        main_frame = tk.Frame(self.tab_reports, bg=bg)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Title
-        title_label = tk.Label(main_frame, text="📊 Αναφορές & Εξαγωγές", 
-                              font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["bg"])
+        title_label = tk.Label(main_frame, text="📊 Αναφορές & Εξαγωγές",
+                              font=FONT_TITLE, fg=accent,
+                              bg=bg)
         title_label.pack(pady=(0, 20))
-        
+
         # Monthly Reports Section
-        monthly_frame = ModernFrame(main_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        monthly_frame = ModernFrame(main_frame, bg=frame_bg)
         monthly_frame.pack(fill="x", pady=(0, 20))
-        
-        monthly_title = tk.Label(monthly_frame, text="📅 Μηνιαίες Αναφορές", 
-                                font=FONT_SUBTITLE, fg=THEMES[self.current_theme]["accent"],
-                                bg=THEMES[self.current_theme]["frame_bg"])
+
+        monthly_title = tk.Label(monthly_frame, text="📅 Μηνιαίες Αναφορές",
+                                font=FONT_SUBTITLE, fg=accent,
+                                bg=frame_bg)
         monthly_title.pack(pady=(15, 15))
-        
+
         # Month/Year selection
-        date_frame = tk.Frame(monthly_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        date_frame = tk.Frame(monthly_frame, bg=frame_bg)
         date_frame.pack(pady=10)
-        
+
         tk.Label(date_frame, text="Μήνας:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["frame_bg"], 
-                fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0, padx=5)
+                bg=frame_bg,
+                fg=fg).grid(row=0, column=0, padx=5)
         self.month_var = tk.StringVar(value=str(datetime.now().month))
-        month_combo = ttk.Combobox(date_frame, textvariable=self.month_var, values=list(range(1, 13)), 
+        month_combo = ttk.Combobox(date_frame, textvariable=self.month_var, values=_MONTHS,
                                   width=10, state="readonly")
         month_combo.grid(row=0, column=1, padx=5)
         
         tk.Label(date_frame, text="Έτος:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["frame_bg"], 
-                fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=2, padx=5)
+                bg=frame_bg,
+                fg=fg).grid(row=0, column=2, padx=5)
         self.year_var = tk.StringVar(value=str(datetime.now().year))
-        year_combo = ttk.Combobox(date_frame, textvariable=self.year_var, 
-                                 values=list(range(2020, datetime.now().year + 5)), 
+        year_combo = ttk.Combobox(date_frame, textvariable=self.year_var,
+                                 values=_YEAR_RANGE,
                                  width=10, state="readonly")
         year_combo.grid(row=0, column=3, padx=5)
         
         # Monthly export buttons
-        btn_frame_monthly = tk.Frame(monthly_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        btn_frame_monthly = tk.Frame(monthly_frame, bg=frame_bg)
         btn_frame_monthly.pack(pady=15)
         
         ModernButton(btn_frame_monthly, text="📄 Εξαγωγή CSV", style="primary", 
@@ -2008,15 +2353,15 @@ class FleetManagerImproved(ValidationMixin):
                         command=self._export_monthly_report_excel).pack(side="left", padx=5)
         
         # General Reports Section
-        general_frame = ModernFrame(main_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        general_frame = ModernFrame(main_frame, bg=frame_bg)
         general_frame.pack(fill="x", pady=(0, 20))
-        
-        general_title = tk.Label(general_frame, text="📋 Γενικές Εξαγωγές", 
-                                font=FONT_SUBTITLE, fg=THEMES[self.current_theme]["accent"],
-                                bg=THEMES[self.current_theme]["frame_bg"])
+
+        general_title = tk.Label(general_frame, text="📋 Γενικές Εξαγωγές",
+                                font=FONT_SUBTITLE, fg=accent,
+                                bg=frame_bg)
         general_title.pack(pady=(15, 15))
-        
-        btn_frame_general = tk.Frame(general_frame, bg=THEMES[self.current_theme]["frame_bg"])
+
+        btn_frame_general = tk.Frame(general_frame, bg=frame_bg)
         btn_frame_general.pack(pady=10)
         
         ModernButton(btn_frame_general, text="🚗 Εξαγωγή Κινήσεων", style="primary", 
@@ -2030,21 +2375,21 @@ class FleetManagerImproved(ValidationMixin):
                         command=self._export_excel).pack(side="left", padx=5)
         
         # Statistics Section
-        stats_frame = ModernFrame(main_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        stats_frame = ModernFrame(main_frame, bg=frame_bg)
         stats_frame.pack(fill="both", expand=True)
-        
-        stats_title = tk.Label(stats_frame, text="📈 Στατιστικά", 
-                              font=FONT_SUBTITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["frame_bg"])
+
+        stats_title = tk.Label(stats_frame, text="📈 Στατιστικά",
+                              font=FONT_SUBTITLE, fg=accent,
+                              bg=frame_bg)
         stats_title.pack(pady=(15, 15))
-        
+
         # Text widget for statistics
-        stats_container = tk.Frame(stats_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        stats_container = tk.Frame(stats_frame, bg=frame_bg)
         stats_container.pack(fill="both", expand=True, padx=15, pady=10)
-        
+
         self.stats_text = tk.Text(stats_container, height=12, font=FONT_SMALL, wrap=tk.WORD,
-                                 bg=THEMES[self.current_theme]["entry_bg"], 
-                                 fg=THEMES[self.current_theme]["fg"],
+                                 bg=entry_bg,
+                                 fg=fg,
                                  relief="flat", borderwidth=1)
         self.stats_text.pack(side="left", fill="both", expand=True)
         
@@ -2054,7 +2399,7 @@ class FleetManagerImproved(ValidationMixin):
         stats_scrollbar.pack(side="right", fill="y")
         
         # Refresh button
-        refresh_btn_frame = tk.Frame(stats_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        refresh_btn_frame = tk.Frame(stats_frame, bg=frame_bg)
         refresh_btn_frame.pack(pady=10)
         ModernButton(refresh_btn_frame, text="🔄 Ανανέωση Στατιστικών", style="info", 
                     command=self._update_statistics).pack()
@@ -2170,6 +2515,9 @@ class FleetManagerImproved(ValidationMixin):
             try:
                 self.db.cursor.execute("DELETE FROM vehicles WHERE plate = ?", (plate,))
                 self.db.conn.commit()
+                # The cascade also removed the vehicle's movements/fuel,
+                # so the monthly/stats caches must not serve this generation
+                self._bump_db_generation()
                 self._clear_vehicle_form()
                 self._load_vehicles()
                 self._refresh_movement_combos()
@@ -2221,31 +2569,80 @@ class FleetManagerImproved(ValidationMixin):
             except Exception as e:
                 logging.error(f"Error getting photo path: {e}")
 
+    # Rows inserted into the vehicles tree per batch; the rest stay in
+    # self._vehicles_cache and are appended between Tk events (and
+    # immediately when the user scrolls near the bottom)
+    VEHICLES_CHUNK_SIZE = 500
+
     def _load_vehicles(self):
         """Load vehicles into tree with search filtering"""
-        for item in self.tree_vehicles.get_children():
-            self.tree_vehicles.delete(item)
-        
-        search_term = self.vehicles_search_var.get().upper() if hasattr(self, 'vehicles_search_var') else ""
-        
+        children = self.tree_vehicles.get_children()
+        if children:
+            self.tree_vehicles.delete(*children)
+
+        search_term = self.vehicles_search_var.get().strip() if hasattr(self, 'vehicles_search_var') else ""
+
         try:
             query = "SELECT plate, brand, vtype, purpose FROM vehicles"
             params = ()
-            
+
             if search_term:
-                query += " WHERE UPPER(plate) LIKE ?"
-                params = (f"%{search_term}%",)
-            
+                # Plates are stored uppercase (normalize_plate), so upper()
+                # the term in Python; it folds Greek too. No COLLATE here —
+                # LIKE ignores collation on a bound pattern anyway
+                query += " WHERE plate LIKE ?"
+                params = (f"%{search_term.upper()}%",)
+
             query += " ORDER BY plate"
-            
-            self.db.cursor.execute(query, params)
-            for row in self.db.cursor.fetchall():
-                self.tree_vehicles.insert("", "end", values=row)
-                
+
+            # conn.execute creates its implicit cursor in C; keep the full
+            # result cached and only render the first chunk, the rest follows
+            # on idle or when scrolling near the bottom
+            self._vehicles_cache = self.db.conn.execute(query, params).fetchall()
+            self._insert_vehicle_chunk()
+
         except Exception as e:
             logging.error(f"Error loading vehicles: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη φόρτωση οχημάτων: {str(e)}")
 
+    @staticmethod
+    def _bulk_insert_rows(tree, rows):
+        """Insert many rows with one direct Tcl call each and no scrollbar churn"""
+        scroll_cmd = tree['yscrollcommand']
+        tree.configure(yscrollcommand='')
+        tk_call = tree.tk.call
+        widget = tree._w
+        try:
+            for row in rows:
+                tk_call(widget, 'insert', '', 'end', '-values', row)
+        finally:
+            tree.configure(yscrollcommand=scroll_cmd)
+            # One scrollbar sync for the whole batch
+            tree.yview_moveto(tree.yview()[0])
+
+    def _insert_vehicle_chunk(self):
+        """Append the next cached chunk of vehicle rows to the tree"""
+        chunk = self._vehicles_cache[:self.VEHICLES_CHUNK_SIZE]
+        del self._vehicles_cache[:self.VEHICLES_CHUNK_SIZE]
+        self._bulk_insert_rows(self.tree_vehicles, chunk)
+        # Keep draining the cache whenever the event loop goes idle so the
+        # full list appears without ever blocking scroll or typing
+        if self._vehicles_cache and not getattr(self, '_vehicles_chunk_pending', False):
+            self._vehicles_chunk_pending = True
+            self.root.after_idle(self._insert_next_vehicle_chunk)
+
+    def _insert_next_vehicle_chunk(self):
+        """after_idle continuation of the chunked vehicle fill"""
+        self._vehicles_chunk_pending = False
+        if getattr(self, '_vehicles_cache', None):
+            self._insert_vehicle_chunk()
+
+    def _on_vehicle_scroll(self, first, last):
+        """Keep the scrollbar in sync and lazy-load rows near the bottom"""
+        self.vehicles_v_scrollbar.set(first, last)
+        if float(last) > 0.9 and getattr(self, '_vehicles_cache', None):
+            self._insert_vehicle_chunk()
+
     def _select_photo(self):
         """Select photo for vehicle"""
         file_path = filedialog.askopenfilename(
@@ -2259,15 +2656,40 @@ class FleetManagerImproved(ValidationMixin):
             filename = os.path.basename(file_path)
             dest_path = os.path.join(IMAGES_DIR, filename)
             
-            try:
-                import shutil
-                shutil.copy2(file_path, dest_path)
-                self.photo_path_var.set(dest_path)
-                self.photo_label.config(text=filename)
-                self.status_bar.set_status("Φωτογραφία επιλέχθηκε επιτυχώς")
-            except Exception as e:
-                logging.error(f"Error copying photo: {e}")
-                messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την αντιγραφή: {str(e)}")
+            # Copy in the background so large photos do not freeze the UI
+            self.status_bar.set_status("Αντιγραφή φωτογραφίας...")
+            future = self._io_pool.submit(shutil.copy2, file_path, dest_path)
+            self.root.after(50, lambda: self._photo_copy_done(future, dest_path, filename))
+
+    def _photo_copy_done(self, future, dest_path, filename):
+        """Poll the background photo copy and update the UI when it finishes"""
+        if not future.done():
+            self.root.after(50, lambda: self._photo_copy_done(future, dest_path, filename))
+            return
+
+        try:
+            future.result()
+            self.photo_path_var.set(dest_path)
+            self.photo_label.config(text=filename)
+            self.status_bar.set_status("Φωτογραφία επιλέχθηκε επιτυχώς")
+            # Pre-render the viewer-sized thumbnail so _view_photo opens instantly
+            if PIL_AVAILABLE:
+                self._io_pool.submit(self._make_photo_thumbnail, dest_path)
+        except Exception as e:
+            logging.error(f"Error copying photo: {e}")
+            messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την αντιγραφή: {str(e)}")
+
+    @staticmethod
+    def _make_photo_thumbnail(photo_path):
+        """Save a 600x400 JPEG thumbnail next to the original photo"""
+        try:
+            img = Image.open(photo_path)
+            img.thumbnail((600, 400), Image.Resampling.LANCZOS)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            img.save(photo_path + ".thumb.jpg", "JPEG", quality=85)
+        except Exception as e:
+            logging.error(f"Error creating photo thumbnail: {e}")
 
     def _view_photo(self):
         """View selected photo"""
@@ -2283,10 +2705,13 @@ class FleetManagerImproved(ValidationMixin):
                 photo_window.title("Προβολή Φωτογραφίας")
                 photo_window.configure(bg=THEMES[self.current_theme]["bg"])
                 
-                # Load and resize image
-                from PIL import Image, ImageTk
-                pil_image = Image.open(photo_path)
-                pil_image.thumbnail((600, 400), Image.Resampling.LANCZOS)
+                # Prefer the pre-rendered thumbnail; decode/resize only if missing
+                thumb_path = photo_path + ".thumb.jpg"
+                if os.path.exists(thumb_path):
+                    pil_image = Image.open(thumb_path)
+                else:
+                    pil_image = Image.open(photo_path)
+                    pil_image.thumbnail((600, 400), Image.Resampling.LANCZOS)
                 photo = ImageTk.PhotoImage(pil_image)
                 
                 label = tk.Label(photo_window, image=photo, bg=THEMES[self.current_theme]["bg"])
@@ -2411,6 +2836,9 @@ class FleetManagerImproved(ValidationMixin):
             try:
                 self.db.cursor.execute("DELETE FROM drivers WHERE name = ? AND surname = ?", (values[0], values[1]))
                 self.db.conn.commit()
+                # Cascade delete touches movements/fuel too: invalidate the
+                # generation-keyed caches
+                self._bump_db_generation()
                 self._clear_driver_form()
                 self._load_drivers()
                 self._refresh_movement_combos()
@@ -2445,25 +2873,25 @@ class FleetManagerImproved(ValidationMixin):
 
     def _load_drivers(self):
         """Load drivers into tree with search filtering"""
-        for item in self.tree_drivers.get_children():
-            self.tree_drivers.delete(item)
-        
-        search_term = self.drivers_search_var.get().upper() if hasattr(self, 'drivers_search_var') else ""
+        children = self.tree_drivers.get_children()
+        if children:
+            self.tree_drivers.delete(*children)
         
+        search_term = self.drivers_search_var.get().strip() if hasattr(self, 'drivers_search_var') else ""
+
         try:
             query = "SELECT name, surname, notes FROM drivers"
             params = ()
-            
+
             if search_term:
-                query += " WHERE UPPER(name || ' ' || surname) LIKE ?"
+                query += " WHERE (name || ' ' || surname) LIKE ? COLLATE NOCASE"
                 params = (f"%{search_term}%",)
             
             query += " ORDER BY name, surname"
             
-            self.db.cursor.execute(query, params)
-            for row in self.db.cursor.fetchall():
-                self.tree_drivers.insert("", "end", values=row)
-                
+            # Stream straight off the implicit cursor; no row list is built
+            self._bulk_insert_rows(self.tree_drivers, self.db.conn.execute(query, params))
+
         except Exception as e:
             logging.error(f"Error loading drivers: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη φόρτωση οδηγών: {str(e)}")
@@ -2536,9 +2964,8 @@ class FleetManagerImproved(ValidationMixin):
                 messagebox.showerror("❌ Σφάλμα", "Μη έγκυρο όχημα!")
                 return
             
-            # Check tank level
-            self.db.cursor.execute("SELECT SUM(CASE WHEN type = 'fill' THEN liters ELSE -liters END) FROM tank")
-            current_level = self.db.cursor.fetchone()[0] or 0
+            # Check tank level (O(1) read of the cached state row)
+            current_level = self.db.get_tank_level()
             
             if current_level < liters:
                 if not ConfirmDialog(
@@ -2548,36 +2975,39 @@ class FleetManagerImproved(ValidationMixin):
                 ).show():
                     return
             
+            # Group the fuel/tank/pump writes in one transaction so the
+            # whole user action costs a single fsync
+            self.db.conn.execute("BEGIN IMMEDIATE")
+
             # Add fuel record
-            self.db.cursor.execute("""
-                INSERT INTO fuel (vehicle_id, driver_id, date, liters, mileage, cost)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (vehicle_id, driver_id, date, liters, mileage, cost))
-            
-            # Update tank
-            self.db.cursor.execute("""
-                INSERT INTO tank (date, liters, type, notes)
-                VALUES (?, ?, 'consume', ?)
-            """, (date, liters, f"Ανεφοδιασμός {vehicle}"))
+            self.db.cursor.execute(_SQL_INSERT_FUEL,
+                                   (vehicle_id, driver_id, date, liters, mileage, cost))
+
+            # Update tank and keep the cached level in sync
+            self.db.cursor.execute(_SQL_INSERT_TANK_CONSUME,
+                                   (date, liters, f"Ανεφοδιασμός {vehicle}"))
+            self.db.adjust_tank_level(-liters)
             
             # Update pump reading if provided
+            pump_update_failed = False
             if pump_reading_str:
                 try:
                     new_pump_reading = float(pump_reading_str)
                     current_pump_reading = self.db.get_pump_reading()
-                    
+
                     if new_pump_reading >= current_pump_reading:
                         calculated_liters = new_pump_reading - current_pump_reading
-                        
+
                         # Check if pump liters match fuel liters (with small tolerance)
                         if abs(calculated_liters - liters) <= 1.0:  # 1L tolerance
-                            self.db.update_pump_reading(
-                                new_pump_reading, 
+                            if not self.db.update_pump_reading(
+                                new_pump_reading,
                                 calculated_liters,
-                                vehicle, 
+                                vehicle,
                                 driver,
                                 f"Ανεφοδιασμός {vehicle} - {liters:.1f}L"
-                            )
+                            ):
+                                pump_update_failed = True
                         else:
                             logging.warning(f"Pump reading mismatch: pump={calculated_liters:.1f}L, fuel={liters:.1f}L")
                     else:
@@ -2587,15 +3017,24 @@ class FleetManagerImproved(ValidationMixin):
                     logging.warning(f"Invalid pump reading: {pump_reading_str}")
             
             self.db.conn.commit()
+            self._bump_db_generation()
             self._clear_fuel_form()
             self._load_fuel()
             self._update_tank_level()
             
             self.status_bar.set_status(f"Καύσιμο καταχωρήθηκε: {liters:.1f}L για {vehicle}")
             log_user_action("Fuel added", f"Vehicle: {vehicle}, Liters: {liters:.1f}")
-            messagebox.showinfo("✅ Επιτυχία", "Το καύσιμο καταχωρήθηκε επιτυχώς!")
+            if pump_update_failed:
+                messagebox.showwarning("⚠️ Προειδοποίηση",
+                                       "Το καύσιμο καταχωρήθηκε, αλλά η ένδειξη αντλίας δεν ενημερώθηκε!")
+            else:
+                messagebox.showinfo("✅ Επιτυχία", "Το καύσιμο καταχωρήθηκε επιτυχώς!")
             
         except Exception as e:
+            self.db.conn.rollback()
+            # Both caches may hold values from the rolled-back transaction
+            self.db.invalidate_tank_level()
+            self.db.invalidate_pump_reading()
             logging.error(f"Error adding fuel: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την καταχώρηση: {str(e)}")
 
@@ -2609,139 +3048,169 @@ class FleetManagerImproved(ValidationMixin):
         self.fuel_pump_reading_var.set("")
 
     def _refill_tank(self):
-        """Refill tank dialog"""
+        """Open the refill dialog, building it only on first use"""
+        # Rebuild if the theme changed since the dialog was constructed
+        if getattr(self, '_refill_dialog_theme', None) != self.current_theme:
+            if hasattr(self, '_refill_dialog'):
+                self._refill_dialog.destroy()
+                del self._refill_dialog
+        if not hasattr(self, '_refill_dialog'):
+            self._build_refill_dialog()
+
+        # Refresh the level info and reset the inputs for this open
+        current_level = self.db.get_tank_level()
+        self._refill_remaining = TANK_CAPACITY - current_level
+        self._refill_info_label.config(
+            text=f"🔵 Τρέχον Επίπεδο: {current_level:.1f}L\n"
+                 f"🛢️ Συνολική Χωρητικότητα: {TANK_CAPACITY:,.0f}L\n"
+                 f"✨ Διαθέσιμος Χώρος: {self._refill_remaining:.1f}L"
+        )
+        self._refill_liters_var.set("")
+        self._refill_notes_var.set("Ανεφοδιασμός κεντρικής δεξαμενής")
+
+        self._refill_dialog.deiconify()
+        self._refill_dialog.grab_set()
+        self._refill_liters_entry.focus()
+
+    def _build_refill_dialog(self):
+        """Build the reusable refill dialog (hidden between opens)"""
+        bg = THEMES[self.current_theme]["bg"]
+        fg = THEMES[self.current_theme]["fg"]
+        self._refill_dialog_theme = self.current_theme
+
         dialog = tk.Toplevel(self.root)
+        self._refill_dialog = dialog
         dialog.title("⛽ Ανεφοδιασμός Δεξαμενής")
         dialog.geometry("400x300")
         dialog.resizable(False, False)
-        dialog.configure(bg=THEMES[self.current_theme]["bg"])
-        
-        # Center the dialog
+        dialog.configure(bg=bg)
         dialog.transient(self.root)
-        dialog.grab_set()
-        
+        dialog.withdraw()
+        # Closing hides the dialog so the widgets survive for the next open
+        dialog.protocol("WM_DELETE_WINDOW", self._close_refill_dialog)
+
         # Main frame
-        main_frame = tk.Frame(dialog, bg=THEMES[self.current_theme]["bg"])
+        main_frame = tk.Frame(dialog, bg=bg)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Title
-        title_label = tk.Label(main_frame, text="⛽ Ανεφοδιασμός Δεξαμενής", 
+        title_label = tk.Label(main_frame, text="⛽ Ανεφοδιασμός Δεξαμενής",
                               font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["bg"])
+                              bg=bg)
         title_label.pack(pady=(0, 20))
-        
-        # Current level info
-        try:
-            self.db.cursor.execute(
-                "SELECT SUM(CASE WHEN type = 'fill' THEN liters ELSE -liters END) FROM tank"
-            )
-            current_level = self.db.cursor.fetchone()[0] or 0
-            remaining_capacity = TANK_CAPACITY - current_level
-            
-            info_text = f"🔵 Τρέχον Επίπεδο: {current_level:.1f}L\n🛢️ Συνολική Χωρητικότητα: {TANK_CAPACITY:,.0f}L\n✨ Διαθέσιμος Χώρος: {remaining_capacity:.1f}L"
-            info_label = tk.Label(main_frame, text=info_text, font=FONT_NORMAL,
-                                 fg=THEMES[self.current_theme]["fg"],
-                                 bg=THEMES[self.current_theme]["bg"], justify="left")
-            info_label.pack(pady=(0, 20))
-        except:
-            current_level = 0
-            remaining_capacity = TANK_CAPACITY
-        
+
+        # Current level info (text refreshed on every open)
+        self._refill_info_label = tk.Label(main_frame, text="", font=FONT_NORMAL,
+                                           fg=fg, bg=bg, justify="left")
+        self._refill_info_label.pack(pady=(0, 20))
+
         # Input frame
-        input_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        input_frame = tk.Frame(main_frame, bg=bg)
         input_frame.pack(pady=10)
-        
+
         tk.Label(input_frame, text="⛽ Λίτρα Ανεφοδιασμού:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"], 
-                fg=THEMES[self.current_theme]["fg"]).pack(anchor="w", pady=(0, 5))
-        
-        liters_var = tk.StringVar()
-        liters_entry = tk.Entry(input_frame, textvariable=liters_var, font=FONT_NORMAL,
-                               width=20, relief="flat", borderwidth=1, highlightthickness=1)
-        liters_entry.pack(pady=(0, 10))
-        liters_entry.focus()
-        
+                bg=bg, fg=fg).pack(anchor="w", pady=(0, 5))
+
+        self._refill_liters_var = tk.StringVar()
+        self._refill_liters_entry = tk.Entry(input_frame, textvariable=self._refill_liters_var,
+                                             font=FONT_NORMAL, width=20, relief="flat",
+                                             borderwidth=1, highlightthickness=1)
+        self._refill_liters_entry.pack(pady=(0, 10))
+
         tk.Label(input_frame, text="📝 Σημειώσεις:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"], 
-                fg=THEMES[self.current_theme]["fg"]).pack(anchor="w", pady=(10, 5))
-        
-        notes_var = tk.StringVar(value="Ανεφοδιασμός κεντρικής δεξαμενής")
-        notes_entry = tk.Entry(input_frame, textvariable=notes_var, font=FONT_NORMAL,
-                              width=20, relief="flat", borderwidth=1, highlightthickness=1)
+                bg=bg, fg=fg).pack(anchor="w", pady=(10, 5))
+
+        self._refill_notes_var = tk.StringVar(value="Ανεφοδιασμός κεντρικής δεξαμενής")
+        notes_entry = tk.Entry(input_frame, textvariable=self._refill_notes_var,
+                               font=FONT_NORMAL, width=20, relief="flat",
+                               borderwidth=1, highlightthickness=1)
         notes_entry.pack(pady=(0, 20))
-        
-        def confirm_refill():
-            try:
-                liters_str = liters_var.get()
-                notes = notes_var.get() or "Ανεφοδιασμός δεξαμενής"
-                
-                if not liters_str:
-                    messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε τα λίτρα!")
-                    return
-                
-                liters = float(liters_str)
-                if liters <= 0:
-                    messagebox.showerror("❌ Σφάλμα", "Τα λίτρα πρέπει να είναι θετικός αριθμός!")
-                    return
-                
-                if liters > remaining_capacity:
-                    messagebox.showerror("❌ Σφάλμα", 
-                                       f"Δεν χωράνε {liters:.1f}L!\nΜέγιστα διαθέσιμα: {remaining_capacity:.1f}L")
-                    return
-                
-                # Add refill to tank
-                self.db.cursor.execute("""
-                    INSERT INTO tank (date, liters, type, notes)
-                    VALUES (?, ?, 'fill', ?)
-                """, (datetime.now().strftime("%Y-%m-%d"), liters, notes))
-                
-                self.db.conn.commit()
-                self._update_tank_level()
-                
-                messagebox.showinfo("✅ Επιτυχία", f"Η δεξαμενή ανεφοδιάστηκε με {liters:.1f}L!")
-                dialog.destroy()
-                
-            except ValueError:
-                messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε έγκυρο αριθμό λίτρων!")
-            except Exception as e:
-                logging.error(f"Error refilling tank: {e}")
-                messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τον ανεφοδιασμό: {str(e)}")
-        
+
         # Buttons
-        btn_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        btn_frame = tk.Frame(main_frame, bg=bg)
         btn_frame.pack(pady=20)
-        
-        ModernButton(btn_frame, text="✅ Ανεφοδιασμός", style="success", 
-                    command=confirm_refill).pack(side="left", padx=5)
-        ModernButton(btn_frame, text="❌ Ακύρωση", style="danger", 
-                    command=dialog.destroy).pack(side="left", padx=5)
-        
+
+        ModernButton(btn_frame, text="✅ Ανεφοδιασμός", style="success",
+                    command=self._confirm_refill).pack(side="left", padx=5)
+        ModernButton(btn_frame, text="❌ Ακύρωση", style="danger",
+                    command=self._close_refill_dialog).pack(side="left", padx=5)
+
         # Enter key binding
-        dialog.bind('<Return>', lambda e: confirm_refill())
+        dialog.bind('<Return>', lambda e: self._confirm_refill())
+
+    def _close_refill_dialog(self):
+        """Hide the refill dialog, keeping it alive for reuse"""
+        self._refill_dialog.grab_release()
+        self._refill_dialog.withdraw()
+
+    def _confirm_refill(self):
+        """Validate and record a tank refill from the dialog inputs"""
+        try:
+            liters_str = self._refill_liters_var.get()
+            notes = self._refill_notes_var.get() or "Ανεφοδιασμός δεξαμενής"
+
+            if not liters_str:
+                messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε τα λίτρα!")
+                return
+
+            liters = float(liters_str)
+            if liters <= 0:
+                messagebox.showerror("❌ Σφάλμα", "Τα λίτρα πρέπει να είναι θετικός αριθμός!")
+                return
+
+            if liters > self._refill_remaining:
+                messagebox.showerror("❌ Σφάλμα",
+                                   f"Δεν χωράνε {liters:.1f}L!\nΜέγιστα διαθέσιμα: {self._refill_remaining:.1f}L")
+                return
+
+            # Add refill to tank and keep the cached level in sync; the
+            # connection context manager wraps both writes in one BEGIN/COMMIT
+            with self.db.conn:
+                self.db.conn.execute(
+                    _SQL_INSERT_TANK_FILL,
+                    (date.today().isoformat(), liters, notes)
+                )
+                self.db.adjust_tank_level(liters)
+
+            self._bump_db_generation()
+            self._update_tank_level()
+
+            messagebox.showinfo("✅ Επιτυχία", f"Η δεξαμενή ανεφοδιάστηκε με {liters:.1f}L!")
+            self._close_refill_dialog()
+
+        except ValueError:
+            messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε έγκυρο αριθμό λίτρων!")
+        except Exception as e:
+            self.db.invalidate_tank_level()
+            logging.error(f"Error refilling tank: {e}")
+            messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τον ανεφοδιασμό: {str(e)}")
 
     def _show_tank_history(self):
         """Show tank history"""
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+
         dialog = tk.Toplevel(self.root)
         dialog.title("📋 Ιστορικό Δεξαμενής")
         dialog.geometry("700x500")
-        dialog.configure(bg=THEMES[self.current_theme]["bg"])
-        
+        dialog.configure(bg=bg)
+
         # Center the dialog
         dialog.transient(self.root)
         dialog.grab_set()
-        
+
         # Main frame
-        main_frame = tk.Frame(dialog, bg=THEMES[self.current_theme]["bg"])
+        main_frame = tk.Frame(dialog, bg=bg)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Title
-        title_label = tk.Label(main_frame, text="📋 Ιστορικό Κινήσεων Δεξαμενής", 
-                              font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["bg"])
+        title_label = tk.Label(main_frame, text="📋 Ιστορικό Κινήσεων Δεξαμενής",
+                              font=FONT_TITLE, fg=theme["accent"],
+                              bg=bg)
         title_label.pack(pady=(0, 20))
-        
+
         # Tree for history
-        tree_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        tree_frame = tk.Frame(main_frame, bg=bg)
         tree_frame.pack(fill="both", expand=True)
         
         tree = ttk.Treeview(tree_frame, columns=("date", "type", "liters", "notes"), 
@@ -2758,22 +3227,32 @@ class FleetManagerImproved(ValidationMixin):
         tree.column("liters", width=100, anchor="center")
         tree.column("notes", width=300, anchor="w")
         
-        # Load data
+        # Row styling lives in tags configured once; the insert loop only
+        # picks a tag per row instead of building emoji strings
+        tree.tag_configure('fill', foreground=theme["success"])
+        tree.tag_configure('consume', foreground=theme["danger"])
+        type_labels = {'fill': "Ανεφοδιασμός", 'consume': "Κατανάλωση"}
+
+        # Load data in fetchmany batches so a long history never blocks
+        # on one big fetchall
         try:
             self.db.cursor.execute("""
-                SELECT date, type, liters, notes 
-                FROM tank 
+                SELECT date, type, liters, notes
+                FROM tank
                 ORDER BY date DESC, id DESC
             """)
-            
-            for row in self.db.cursor.fetchall():
-                type_display = "📈 Ανεφοδιασμός" if row[1] == 'fill' else "📉 Κατανάλωση"
-                tree.insert("", "end", values=(
-                    row[0],  # date
-                    type_display,  # type
-                    f"{row[2]:.1f}L",  # liters
-                    row[3] or ""  # notes
-                ))
+
+            tk_call = tree.tk.call
+            widget = tree._w
+            while True:
+                rows = self.db.cursor.fetchmany(512)
+                if not rows:
+                    break
+                for row in rows:
+                    tag = 'fill' if row[1] == 'fill' else 'consume'
+                    tk_call(widget, 'insert', '', 'end',
+                            '-values', (row[0], type_labels[tag], f"{row[2]:.1f}L", row[3] or ""),
+                            '-tags', (tag,))
         except Exception as e:
             logging.error(f"Error loading tank history: {e}")
         
@@ -2799,131 +3278,141 @@ class FleetManagerImproved(ValidationMixin):
 
     def _update_pump_reading(self):
         """Update pump reading dialog"""
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+
         dialog = tk.Toplevel(self.root)
         dialog.title("📊 Ενημέρωση Μετρητή Αντλίας")
         dialog.geometry("450x350")
         dialog.resizable(False, False)
-        dialog.configure(bg=THEMES[self.current_theme]["bg"])
-        
+        dialog.configure(bg=bg)
+
         # Center the dialog
         dialog.transient(self.root)
         dialog.grab_set()
-        
+
         # Main frame
-        main_frame = tk.Frame(dialog, bg=THEMES[self.current_theme]["bg"])
+        main_frame = tk.Frame(dialog, bg=bg)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Title
-        title_label = tk.Label(main_frame, text="📊 Ενημέρωση Μετρητή Αντλίας", 
-                              font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["bg"])
+        title_label = tk.Label(main_frame, text="📊 Ενημέρωση Μετρητή Αντλίας",
+                              font=FONT_TITLE, fg=theme["accent"],
+                              bg=bg)
         title_label.pack(pady=(0, 20))
-        
+
         # Current reading info
         try:
             current_reading = self.db.get_pump_reading()
             info_text = f"🔵 Τρέχουσα Μέτρηση: {current_reading:,.0f} λίτρα"
             info_label = tk.Label(main_frame, text=info_text, font=FONT_NORMAL,
-                                 fg=THEMES[self.current_theme]["fg"],
-                                 bg=THEMES[self.current_theme]["bg"])
+                                 fg=fg, bg=bg)
             info_label.pack(pady=(0, 20))
         except:
             current_reading = 0
-        
+
         # Input frame
-        input_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        input_frame = tk.Frame(main_frame, bg=bg)
         input_frame.pack(pady=10)
-        
+
         tk.Label(input_frame, text="📊 Νέα Μέτρηση:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"], 
-                fg=THEMES[self.current_theme]["fg"]).pack(anchor="w", pady=(0, 5))
-        
+                bg=bg, fg=fg).pack(anchor="w", pady=(0, 5))
+
         new_reading_var = tk.StringVar()
         new_reading_entry = tk.Entry(input_frame, textvariable=new_reading_var, font=FONT_NORMAL,
                                     width=20, relief="flat", borderwidth=1, highlightthickness=1)
         new_reading_entry.pack(pady=(0, 10))
         new_reading_entry.focus()
-        
+
         tk.Label(input_frame, text="📝 Σημειώσεις:", font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"], 
-                fg=THEMES[self.current_theme]["fg"]).pack(anchor="w", pady=(10, 5))
+                bg=bg, fg=fg).pack(anchor="w", pady=(10, 5))
         
         notes_var = tk.StringVar(value="Ενημέρωση μετρητή αντλίας")
         notes_entry = tk.Entry(input_frame, textvariable=notes_var, font=FONT_NORMAL,
                               width=20, relief="flat", borderwidth=1, highlightthickness=1)
         notes_entry.pack(pady=(0, 20))
         
-        def confirm_update():
-            try:
-                new_reading_str = new_reading_var.get()
-                notes = notes_var.get() or "Ενημέρωση μετρητή"
-                
-                if not new_reading_str:
-                    messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε τη νέα μέτρηση!")
-                    return
-                
-                new_reading = float(new_reading_str)
-                
-                if new_reading < current_reading:
-                    messagebox.showerror("❌ Σφάλμα", 
-                                       f"Η νέα μέτρηση ({new_reading:,.0f}) δεν μπορεί να είναι μικρότερη από την τρέχουσα ({current_reading:,.0f})!")
-                    return
-                
-                liters_dispensed = new_reading - current_reading
-                
-                if liters_dispensed > 0:
-                    # Update pump reading
-                    if self.db.update_pump_reading(new_reading, liters_dispensed, notes=notes):
-                        self._update_pump_display()
-                        messagebox.showinfo("✅ Επιτυχία", 
-                                          f"Ο μετρητής ενημερώθηκε!\nΔιανομή: {liters_dispensed:,.1f}L")
-                        dialog.destroy()
-                    else:
-                        messagebox.showerror("❌ Σφάλμα", "Σφάλμα κατά την ενημέρωση!")
-                else:
-                    messagebox.showwarning("⚠️ Προειδοποίηση", "Δεν υπάρχει αλλαγή στη μέτρηση!")
-                
-            except ValueError:
-                messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε έγκυρο αριθμό!")
-            except Exception as e:
-                logging.error(f"Error updating pump reading: {e}")
-                messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την ενημέρωση: {str(e)}")
-        
+        # Bound method instead of a closure: the hot validation path runs
+        # on plain LOAD_FAST/LOAD_ATTR instead of LOAD_DEREF cell lookups
+        confirm = lambda: self._confirm_pump_update(dialog, new_reading_var,
+                                                    notes_var, current_reading)
+
         # Buttons
-        btn_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        btn_frame = tk.Frame(main_frame, bg=bg)
         btn_frame.pack(pady=20)
-        
-        ModernButton(btn_frame, text="✅ Ενημέρωση", style="success", 
-                    command=confirm_update).pack(side="left", padx=5)
-        ModernButton(btn_frame, text="❌ Ακύρωση", style="danger", 
+
+        ModernButton(btn_frame, text="✅ Ενημέρωση", style="success",
+                    command=confirm).pack(side="left", padx=5)
+        ModernButton(btn_frame, text="❌ Ακύρωση", style="danger",
                     command=dialog.destroy).pack(side="left", padx=5)
-        
+
         # Enter key binding
-        dialog.bind('<Return>', lambda e: confirm_update())
+        dialog.bind('<Return>', lambda e: confirm())
+
+    def _confirm_pump_update(self, dialog, new_reading_var, notes_var, current_reading):
+        """Validate and apply a new pump reading from the update dialog"""
+        try:
+            new_reading_str = new_reading_var.get()
+            notes = notes_var.get() or "Ενημέρωση μετρητή"
+
+            if not new_reading_str:
+                messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε τη νέα μέτρηση!")
+                return
+
+            new_reading = float(new_reading_str)
+
+            if new_reading < current_reading:
+                messagebox.showerror("❌ Σφάλμα",
+                                   f"Η νέα μέτρηση ({new_reading:,.0f}) δεν μπορεί να είναι μικρότερη από την τρέχουσα ({current_reading:,.0f})!")
+                return
+
+            liters_dispensed = new_reading - current_reading
+
+            if liters_dispensed > 0:
+                # Update pump reading
+                if self.db.update_pump_reading(new_reading, liters_dispensed, notes=notes):
+                    self._update_pump_display()
+                    messagebox.showinfo("✅ Επιτυχία",
+                                      f"Ο μετρητής ενημερώθηκε!\nΔιανομή: {liters_dispensed:,.1f}L")
+                    dialog.destroy()
+                else:
+                    messagebox.showerror("❌ Σφάλμα", "Σφάλμα κατά την ενημέρωση!")
+            else:
+                messagebox.showwarning("⚠️ Προειδοποίηση", "Δεν υπάρχει αλλαγή στη μέτρηση!")
+
+        except ValueError:
+            messagebox.showerror("❌ Σφάλμα", "Παρακαλώ εισάγετε έγκυρο αριθμό!")
+        except Exception as e:
+            logging.error(f"Error updating pump reading: {e}")
+            messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την ενημέρωση: {str(e)}")
 
     def _show_pump_history(self):
         """Show pump history"""
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+
         dialog = tk.Toplevel(self.root)
         dialog.title("📋 Ιστορικό Αντλίας")
         dialog.geometry("800x500")
-        dialog.configure(bg=THEMES[self.current_theme]["bg"])
-        
+        dialog.configure(bg=bg)
+
         # Center the dialog
         dialog.transient(self.root)
         dialog.grab_set()
-        
+
         # Main frame
-        main_frame = tk.Frame(dialog, bg=THEMES[self.current_theme]["bg"])
+        main_frame = tk.Frame(dialog, bg=bg)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Title
-        title_label = tk.Label(main_frame, text="📋 Ιστορικό Κινήσεων Αντλίας", 
-                              font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                              bg=THEMES[self.current_theme]["bg"])
+        title_label = tk.Label(main_frame, text="📋 Ιστορικό Κινήσεων Αντλίας",
+                              font=FONT_TITLE, fg=theme["accent"],
+                              bg=bg)
         title_label.pack(pady=(0, 20))
-        
+
         # Tree for history
-        tree_frame = tk.Frame(main_frame, bg=THEMES[self.current_theme]["bg"])
+        tree_frame = tk.Frame(main_frame, bg=bg)
         tree_frame.pack(fill="both", expand=True)
         
         tree = ttk.Treeview(tree_frame, columns=("date", "reading", "dispensed", "vehicle", "driver", "notes"), 
@@ -2944,18 +3433,17 @@ class FleetManagerImproved(ValidationMixin):
         tree.column("driver", width=120, anchor="center")
         tree.column("notes", width=200, anchor="w")
         
-        # Load data
+        # Load data: format first, then one bulk pass over the Tcl boundary
         try:
-            history = self.db.get_pump_history()
-            for row in history:
-                tree.insert("", "end", values=(
-                    row[0],  # date
-                    f"{row[1]:,.0f}",  # reading
-                    f"{row[2]:.1f}L",  # liters_dispensed
-                    row[3] or "",  # vehicle_plate
-                    row[4] or "",  # driver_name
-                    row[5] or ""  # notes
-                ))
+            self._bulk_insert_rows(tree, [
+                (row[0],  # date
+                 f"{row[1]:,.0f}",  # reading
+                 f"{row[2]:.1f}L",  # liters_dispensed
+                 row[3] or "",  # vehicle_plate
+                 row[4] or "",  # driver_name
+                 row[5] or "")  # notes
+                for row in self.db.get_pump_history()
+            ])
         except Exception as e:
             logging.error(f"Error loading pump history: {e}")
         
@@ -2974,6 +3462,9 @@ class FleetManagerImproved(ValidationMixin):
         """Update pump reading display"""
         try:
             current_reading = self.db.get_pump_reading()
+            if getattr(self, '_pump_display_reading', None) == current_reading:
+                return
+            self._pump_display_reading = current_reading
             self.pump_reading_label.config(
                 text=f"📊 Τρέχουσα Μέτρηση: {current_reading:,.0f} λίτρα"
             )
@@ -2983,8 +3474,9 @@ class FleetManagerImproved(ValidationMixin):
 
     def _load_fuel(self):
         """Load fuel records with cost information"""
-        for item in self.tree_fuel.get_children():
-            self.tree_fuel.delete(item)
+        children = self.tree_fuel.get_children()
+        if children:
+            self.tree_fuel.delete(*children)
         
         try:
             self.db.cursor.execute("""
@@ -2995,17 +3487,21 @@ class FleetManagerImproved(ValidationMixin):
                 ORDER BY f.date DESC, f.id DESC
             """)
             
-            for row in self.db.cursor.fetchall():
-                # Format the display values
-                display_row = (
-                    row[0],  # date
-                    row[1],  # driver
-                    row[2],  # vehicle
-                    f"{row[3]:.1f}",  # liters
-                    f"{row[4]:.0f}" if row[4] else "",  # mileage
-                    format_currency(row[5]) if row[5] else "0.00 €"  # cost
-                )
-                self.tree_fuel.insert("", "end", values=display_row)
+            # Bind the format methods once and build all display tuples in a
+            # single comprehension pass; the currency case is inlined since
+            # format_currency is just an f-string behind a function call
+            fmt_liters = "{:.1f}".format
+            fmt_km = "{:.0f}".format
+            display_rows = [
+                (row[0],  # date
+                 row[1],  # driver
+                 row[2],  # vehicle
+                 fmt_liters(row[3]),
+                 fmt_km(row[4]) if row[4] else "",
+                 f"{row[5]:.2f} €" if row[5] else "0.00 €")
+                for row in self.db.cursor.fetchall()
+            ]
+            self._bulk_insert_rows(self.tree_fuel, display_rows)
             
             # Update tank level display
             self._update_tank_level()
@@ -3017,22 +3513,31 @@ class FleetManagerImproved(ValidationMixin):
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη φόρτωση καυσίμων: {str(e)}")
 
     def _load_fuel_combos(self):
-        """Load drivers and vehicles into fuel comboboxes"""
+        """Load drivers and vehicles into fuel comboboxes
+
+        Reuses the cached name -> id maps when a data change has already
+        rebuilt them via _refresh_movement_combos; only queries when the
+        caches do not exist yet (first tab build).
+        """
         try:
-            # Load drivers
-            self.db.cursor.execute("SELECT name, surname FROM drivers ORDER BY name, surname")
-            drivers = [f"{row[0]} {row[1]}" for row in self.db.cursor.fetchall()]
-            
-            if hasattr(self, 'fuel_driver_combo'):
-                self.fuel_driver_combo.set_values(drivers)
-            
-            # Load vehicles  
-            self.db.cursor.execute("SELECT plate FROM vehicles ORDER BY plate")
-            vehicles = [row[0] for row in self.db.cursor.fetchall()]
-            
-            if hasattr(self, 'fuel_vehicle_combo'):
-                self.fuel_vehicle_combo.set_values(vehicles)
-                
+            if not hasattr(self, 'driver_ids') or not hasattr(self, 'vehicle_ids'):
+                self.db.cursor.execute("SELECT id, name, surname FROM drivers ORDER BY name, surname")
+                self.driver_ids = {f"{row[1]} {row[2]}": row[0] for row in self.db.cursor.fetchall()}
+
+                self.db.cursor.execute("SELECT id, plate FROM vehicles ORDER BY plate")
+                self.vehicle_ids = {row[1]: row[0] for row in self.db.cursor.fetchall()}
+
+            # EAFP: the combos exist on every call after the tab is built
+            try:
+                self.fuel_driver_combo.set_values(list(self.driver_ids.keys()))
+            except AttributeError:
+                pass
+
+            try:
+                self.fuel_vehicle_combo.set_values(list(self.vehicle_ids.keys()))
+            except AttributeError:
+                pass
+
         except Exception as e:
             logging.error(f"Error loading fuel combos: {e}")
     
@@ -3042,28 +3547,26 @@ class FleetManagerImproved(ValidationMixin):
         """Load purposes into the tree"""
         try:
             # Clear existing items
-            for item in self.tree_purposes.get_children():
-                self.tree_purposes.delete(item)
+            children = self.tree_purposes.get_children()
+            if children:
+                self.tree_purposes.delete(*children)
             
             # Get search and filter criteria
-            search_term = self.purposes_search_var.get().lower()
+            search_term = self.purposes_search_var.get().strip()
             category_filter = self.purpose_filter_var.get()
             show_inactive = self.show_inactive_var.get()
-            
-            # Get purposes from database
+
+            # Get purposes from database (search is filtered SQL-side)
             category = None if category_filter == "all" else category_filter
-            purposes = self.db.get_purposes(category=category, active_only=not show_inactive)
-            
+            purposes = self.db.get_purposes(category=category, active_only=not show_inactive,
+                                            search_term=search_term or None)
+
             for purpose in purposes:
                 purpose_id, name, description, category, active = purpose
-                
-                # Apply search filter
-                if search_term and search_term not in name.lower() and search_term not in (description or "").lower():
-                    continue
-                
+
                 # Format data for display
                 active_text = "✅ Ναι" if active else "❌ Όχι"
-                
+
                 self.tree_purposes.insert("", "end", iid=purpose_id, values=(
                     name, description or "", category, active_text
                 ))
@@ -3214,13 +3717,16 @@ class FleetManagerImproved(ValidationMixin):
             # Get active purposes
             purpose_names = self.db.get_purpose_names(active_only=True)
             
-            # Update movement tab combobox
-            if hasattr(self, 'mov_purpose_combobox'):
+            # EAFP: both combos exist once their tabs are built
+            try:
                 self.mov_purpose_combobox.set_values(purpose_names)
-            
-            # Update vehicle tab combobox
-            if hasattr(self, 'ent_vpurpose'):
+            except AttributeError:
+                pass
+
+            try:
                 self.ent_vpurpose.set_values(purpose_names)
+            except AttributeError:
+                pass
                 
         except Exception as e:
             logging.error(f"Error updating purpose combos: {e}")
@@ -3247,11 +3753,12 @@ class FleetManagerImproved(ValidationMixin):
                     ORDER BY m.date DESC
                 """)
                 
-                headers = ["Ημερομηνία", "Οδηγός", "Όχημα", "Χλμ Αναχ.", "Χλμ Επιστρ.", 
+                headers = ["Ημερομηνία", "Οδηγός", "Όχημα", "Χλμ Αναχ.", "Χλμ Επιστρ.",
                           "Διαδρομή", "Σκοπός", "Σύνολο Χλμ", "Αρ. Κίνησης"]
-                data = self.db.cursor.fetchall()
-                
-                if export_to_csv(data, headers, filename):
+
+                # Hand the cursor itself to the writer: rows stream from
+                # SQLite into the file without an intermediate list
+                if export_to_csv(self.db.cursor, headers, filename):
                     self.status_bar.set_status("Κινήσεις εξήχθησαν επιτυχώς")
                     
         except Exception as e:
@@ -3277,9 +3784,8 @@ class FleetManagerImproved(ValidationMixin):
                 """)
                 
                 headers = ["Ημερομηνία", "Οδηγός", "Όχημα", "Λίτρα", "Χιλιόμετρα", "Κόστος"]
-                data = self.db.cursor.fetchall()
-                
-                if export_to_csv(data, headers, filename):
+
+                if export_to_csv(self.db.cursor, headers, filename):
                     self.status_bar.set_status("Καύσιμα εξήχθησαν επιτυχώς")
                     
         except Exception as e:
@@ -3291,63 +3797,71 @@ class FleetManagerImproved(ValidationMixin):
         try:
             month = int(self.month_var.get())
             year = int(self.year_var.get())
-            
-            data = self._get_monthly_data(month, year)
-            
+
             filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
                 initialname=f"monthly_report_{year}_{month:02d}.csv"
             )
-            
+
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                data = self._get_monthly_data(month, year)
+                # The query returns one row per vehicle even for an idle
+                # month (LEFT JOIN from vehicles), so check for activity,
+                # not just for rows
+                if not any(v.total_movements or v.fuel_refills for v in data):
+                    messagebox.showinfo("ℹ️ Πληροφορία", "Δεν υπάρχουν δεδομένα για αυτόν τον μήνα")
+                    return
+
+                totals = {'movements': 0, 'km': 0.0, 'fuel': 0.0}
+
+                def vehicle_rows():
+                    # Stream one formatted row at a time while tallying totals,
+                    # so no second row list is ever materialized
+                    for vehicle in data:
+                        totals['movements'] += vehicle.total_movements
+                        totals['km'] += vehicle.total_km
+                        totals['fuel'] += vehicle.total_fuel
+                        yield [
+                            vehicle.plate,
+                            vehicle.brand,
+                            vehicle.type,
+                            vehicle.total_movements,
+                            f"{vehicle.total_km:.1f}",
+                            f"{vehicle.min_km:.0f}",
+                            f"{vehicle.max_km:.0f}",
+                            f"{vehicle.total_fuel:.1f}",
+                            vehicle.fuel_refills,
+                            f"{vehicle.avg_fuel_per_refill:.1f}",
+                            f"{vehicle.efficiency_km_per_liter:.2f}"
+                        ]
+
+                with open(filename, 'w', newline='', encoding='utf-8-sig',
+                          buffering=1 << 20) as csvfile:
                     writer = csv.writer(csvfile)
-                    
+
                     # Header
                     writer.writerow([f"ΜΗΝΙΑΙΑ ΑΝΑΦΟΡΑ - {month:02d}/{year}"])
                     writer.writerow([f"Δημιουργήθηκε: {datetime.now().strftime('%d/%m/%Y %H:%M')}"])
                     writer.writerow([])
-                    
+
                     # Individual vehicle data
                     writer.writerow(["ΣΤΟΙΧΕΙΑ ΑΝΑ ΟΧΗΜΑ"])
                     writer.writerow([
-                        "Πινακίδα", "Μάρκα", "Τύπος", "Κινήσεις", "Σύνολο Χλμ", 
-                        "Ελάχιστα Χλμ", "Μέγιστα Χλμ", "Σύνολο Καυσίμων (L)", 
+                        "Πινακίδα", "Μάρκα", "Τύπος", "Κινήσεις", "Σύνολο Χλμ",
+                        "Ελάχιστα Χλμ", "Μέγιστα Χλμ", "Σύνολο Καυσίμων (L)",
                         "Ανεφοδιασμοί", "Μέσος Όρος/Ανεφοδιασμό", "Απόδοση (χλμ/L)"
                     ])
-                    
-                    total_km = 0
-                    total_fuel = 0
-                    total_movements = 0
-                    
-                    for vehicle in data:
-                        writer.writerow([
-                            vehicle['plate'],
-                            vehicle['brand'],
-                            vehicle['type'],
-                            vehicle['total_movements'],
-                            f"{vehicle['total_km']:.1f}",
-                            f"{vehicle['min_km']:.0f}",
-                            f"{vehicle['max_km']:.0f}",
-                            f"{vehicle['total_fuel']:.1f}",
-                            vehicle['fuel_refills'],
-                            f"{vehicle['avg_fuel_per_refill']:.1f}",
-                            f"{vehicle['efficiency_km_per_liter']:.2f}"
-                        ])
-                        
-                        total_km += vehicle['total_km']
-                        total_fuel += vehicle['total_fuel']
-                        total_movements += vehicle['total_movements']
-                    
+                    writer.writerows(vehicle_rows())
+
                     # Summary
                     writer.writerow([])
                     writer.writerow(["ΣΥΝΟΛΙΚΑ ΣΤΟΙΧΕΙΑ"])
-                    writer.writerow(["Συνολικές Κινήσεις", total_movements])
-                    writer.writerow(["Συνολικά Χιλιόμετρα", f"{total_km:.1f}"])
-                    writer.writerow(["Συνολικά Καύσιμα", f"{total_fuel:.1f}"])
-                    if total_fuel > 0:
-                        writer.writerow(["Μέση Απόδοση", f"{total_km/total_fuel:.2f} χλμ/L"])
+                    writer.writerow(["Συνολικές Κινήσεις", totals['movements']])
+                    writer.writerow(["Συνολικά Χιλιόμετρα", f"{totals['km']:.1f}"])
+                    writer.writerow(["Συνολικά Καύσιμα", f"{totals['fuel']:.1f}"])
+                    if totals['fuel'] > 0:
+                        writer.writerow(["Μέση Απόδοση", f"{totals['km']/totals['fuel']:.2f} χλμ/L"])
                 
                 messagebox.showinfo("✅ Επιτυχία", f"Η μηνιαία αναφορά εξήχθη σε: {filename}")
                 self.status_bar.set_status("Μηνιαία αναφορά εξήχθη επιτυχώς")
@@ -3367,19 +3881,26 @@ class FleetManagerImproved(ValidationMixin):
             
             month = int(self.month_var.get())
             year = int(self.year_var.get())
-            
-            data = self._get_monthly_data(month, year)
-            
+
             filename = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
                 filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
                 initialname=f"monthly_report_{year}_{month:02d}.xlsx"
             )
-            
+
             if filename:
-                wb = Workbook()
-                ws = wb.active
-                ws.title = f"Αναφορά {month:02d}-{year}"
+                data = self._get_monthly_data(month, year)
+                # The query returns one row per vehicle even for an idle
+                # month (LEFT JOIN from vehicles), so check for activity,
+                # not just for rows
+                if not any(v.total_movements or v.fuel_refills for v in data):
+                    messagebox.showinfo("ℹ️ Πληροφορία", "Δεν υπάρχουν δεδομένα για αυτόν τον μήνα")
+                    return
+
+                # Write-only mode streams rows straight to XML instead of
+                # keeping the whole workbook in memory
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet(f"Αναφορά {month:02d}-{year}")
                 
                 # Header
                 ws.append([f"ΜΗΝΙΑΙΑ ΑΝΑΦΟΡΑ - {month:02d}/{year}"])
@@ -3400,22 +3921,22 @@ class FleetManagerImproved(ValidationMixin):
                 
                 for vehicle in data:
                     ws.append([
-                        vehicle['plate'],
-                        vehicle['brand'],
-                        vehicle['type'],
-                        vehicle['total_movements'],
-                        vehicle['total_km'],
-                        vehicle['min_km'],
-                        vehicle['max_km'],
-                        vehicle['total_fuel'],
-                        vehicle['fuel_refills'],
-                        vehicle['avg_fuel_per_refill'],
-                        vehicle['efficiency_km_per_liter']
+                        vehicle.plate,
+                        vehicle.brand,
+                        vehicle.type,
+                        vehicle.total_movements,
+                        vehicle.total_km,
+                        vehicle.min_km,
+                        vehicle.max_km,
+                        vehicle.total_fuel,
+                        vehicle.fuel_refills,
+                        vehicle.avg_fuel_per_refill,
+                        vehicle.efficiency_km_per_liter
                     ])
                     
-                    total_km += vehicle['total_km']
-                    total_fuel += vehicle['total_fuel']
-                    total_movements += vehicle['total_movements']
+                    total_km += vehicle.total_km
+                    total_fuel += vehicle.total_fuel
+                    total_movements += vehicle.total_movements
                 
                 # Summary
                 ws.append([])
@@ -3450,58 +3971,37 @@ class FleetManagerImproved(ValidationMixin):
             )
             
             if filename:
-                wb = Workbook()
-                
-                # Movements sheet
-                ws1 = wb.active
-                ws1.title = "Κινήσεις"
-                ws1.append(["Ημερομηνία", "Οδηγός", "Όχημα", "Χλμ Αναχ.", "Χλμ Επιστρ.", "Διαδρομή", "Σκοπός", "Σύνολο Χλμ", "Αρ. Κίνησης"])
-                
-                self.db.cursor.execute("""
-                    SELECT m.date, d.name || ' ' || d.surname, v.plate, 
-                           m.start_km, m.end_km, m.route, m.purpose,
-                           (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)),
-                           COALESCE(m.movement_number, 0)
-                    FROM movements m
-                    JOIN drivers d ON m.driver_id = d.id
-                    JOIN vehicles v ON m.vehicle_id = v.id
-                    ORDER BY m.date DESC
-                """)
-                
-                for row in self.db.cursor.fetchall():
-                    ws1.append(row)
-                
-                # Fuel sheet
-                ws2 = wb.create_sheet("Καύσιμα")
-                ws2.append(["Ημερομηνία", "Οδηγός", "Όχημα", "Λίτρα", "Χιλιόμετρα", "Κόστος"])
-                
-                self.db.cursor.execute("""
-                    SELECT f.date, d.name || ' ' || d.surname, v.plate, f.liters, f.mileage, f.cost
-                    FROM fuel f
-                    JOIN drivers d ON f.driver_id = d.id
-                    JOIN vehicles v ON f.vehicle_id = v.id
-                    ORDER BY f.date DESC
-                """)
-                
-                for row in self.db.cursor.fetchall():
-                    ws2.append(row)
-                
-                # Vehicles sheet
-                ws3 = wb.create_sheet("Οχήματα")
-                ws3.append(["Πινακίδα", "Μάρκα", "Τύπος", "Σημειώσεις"])
-                
-                self.db.cursor.execute("SELECT plate, brand, vtype, purpose FROM vehicles ORDER BY plate")
-                for row in self.db.cursor.fetchall():
-                    ws3.append(row)
-                
-                # Drivers sheet
-                ws4 = wb.create_sheet("Οδηγοί")
-                ws4.append(["Όνομα", "Επώνυμο", "Σημειώσεις"])
-                
-                self.db.cursor.execute("SELECT name, surname, notes FROM drivers ORDER BY name, surname")
-                for row in self.db.cursor.fetchall():
-                    ws4.append(row)
-                
+                # The four sheet queries are independent reads; run them on
+                # separate read-only connections in parallel (SQLite releases
+                # the GIL inside step), then fill the sheets sequentially
+                # since openpyxl is not thread-safe
+                sheet_specs = [
+                    ("Κινήσεις",
+                     ["Ημερομηνία", "Οδηγός", "Όχημα", "Χλμ Αναχ.", "Χλμ Επιστρ.", "Διαδρομή", "Σκοπός", "Σύνολο Χλμ", "Αρ. Κίνησης"],
+                     _SQL_EXPORT_MOVEMENTS),
+                    ("Καύσιμα",
+                     ["Ημερομηνία", "Οδηγός", "Όχημα", "Λίτρα", "Χιλιόμετρα", "Κόστος"],
+                     _SQL_EXPORT_FUEL),
+                    ("Οχήματα",
+                     ["Πινακίδα", "Μάρκα", "Τύπος", "Σημειώσεις"],
+                     "SELECT plate, brand, vtype, purpose FROM vehicles ORDER BY plate"),
+                    ("Οδηγοί",
+                     ["Όνομα", "Επώνυμο", "Σημειώσεις"],
+                     "SELECT name, surname, notes FROM drivers ORDER BY name, surname"),
+                ]
+
+                with ThreadPoolExecutor(max_workers=len(sheet_specs)) as pool:
+                    futures = [pool.submit(self._fetch_rows_readonly, spec[2])
+                               for spec in sheet_specs]
+                    results = [f.result() for f in futures]
+
+                wb = Workbook(write_only=True)
+                for (title, headers, _), rows in zip(sheet_specs, results):
+                    ws = wb.create_sheet(title)
+                    ws.append(headers)
+                    for row in rows:
+                        ws.append(row)
+
                 wb.save(filename)
                 messagebox.showinfo("✅ Επιτυχία", f"Τα δεδομένα εξήχθησαν σε: {filename}")
                 self.status_bar.set_status("Γενική αναφορά Excel εξήχθη επιτυχώς")
@@ -3510,152 +4010,128 @@ class FleetManagerImproved(ValidationMixin):
             logging.error(f"Error exporting Excel: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την εξαγωγή: {str(e)}")
 
+    @staticmethod
+    def _fetch_rows_readonly(sql):
+        """Run one SELECT on a private read-only connection (worker thread)"""
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        try:
+            # mmap/temp_store are per-connection; the main connection's
+            # pragmas don't carry over to these short-lived readers
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def _bump_db_generation(self):
+        """Invalidate cached report/statistics results after a data write"""
+        self._db_generation += 1
+        # Entries keyed with older generations can never be served again
+        self._monthly_cache.clear()
+        self._stats_cache = None
+
     def _get_monthly_data(self, month, year):
         """Get comprehensive monthly data for vehicles"""
-        month_str = f"{year}-{month:02d}"
-        
-        # Get movements data for the month
-        movements_query = """
-            SELECT v.plate, v.brand, v.vtype,
-                   COUNT(m.id) as total_movements,
-                   SUM(COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) as total_km,
-                   MIN(m.start_km) as min_km,
-                   MAX(COALESCE(m.end_km, m.start_km)) as max_km
-            FROM vehicles v
-            LEFT JOIN movements m ON v.id = m.vehicle_id 
-                AND m.date LIKE ?
-                AND m.end_km IS NOT NULL
-            GROUP BY v.id, v.plate, v.brand, v.vtype
-            ORDER BY v.plate
-        """
-        
-        # Get fuel data for the month
-        fuel_query = """
-            SELECT v.plate,
-                   SUM(f.liters) as total_fuel,
-                   COUNT(f.id) as fuel_refills,
-                   AVG(f.liters) as avg_fuel_per_refill
-            FROM vehicles v
-            LEFT JOIN fuel f ON v.id = f.vehicle_id 
-                AND f.date LIKE ?
-            GROUP BY v.id, v.plate
-            ORDER BY v.plate
-        """
-        
-        self.db.cursor.execute(movements_query, (f"{month_str}%",))
-        movements_data = {row[0]: row for row in self.db.cursor.fetchall()}
-        
-        self.db.cursor.execute(fuel_query, (f"{month_str}%",))
-        fuel_data = {row[0]: row for row in self.db.cursor.fetchall()}
-        
-        # Combine data
-        combined_data = []
-        for plate in movements_data:
-            movement_row = movements_data[plate]
-            fuel_row = fuel_data.get(plate, (plate, 0, 0, 0))
-            
-            # Calculate efficiency (km per liter)
-            efficiency = 0
-            if fuel_row[1] > 0 and movement_row[4] > 0:
-                efficiency = movement_row[4] / fuel_row[1]
-            
-            combined_row = {
-                'plate': plate,
-                'brand': movement_row[1],
-                'type': movement_row[2],
-                'total_movements': movement_row[3],
-                'total_km': movement_row[4] or 0,
-                'min_km': movement_row[5] or 0,
-                'max_km': movement_row[6] or 0,
-                'total_fuel': fuel_row[1] or 0,
-                'fuel_refills': fuel_row[2] or 0,
-                'avg_fuel_per_refill': fuel_row[3] or 0,
-                'efficiency_km_per_liter': efficiency
-            }
-            combined_data.append(combined_row)
-        
+        cache_key = (month, year, self._db_generation)
+        cached = self._monthly_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # One statement: SQLite pre-aggregates movements and fuel per
+        # vehicle in CTEs and joins them, replacing the former two-query
+        # fetch plus Python-side dict merge
+        start, end = _month_bounds(year, month)
+        self.db.cursor.execute(_SQL_MONTHLY_VEHICLE_DATA, (start, end, start, end))
+
+        combined_data = [
+            VehicleMonthRow(
+                plate, brand, vtype, total_movements, total_km, min_km,
+                max_km, total_fuel, fuel_refills, avg_refill,
+                total_km / total_fuel if total_fuel > 0 and total_km > 0 else 0)
+            for (plate, brand, vtype, total_movements, total_km,
+                 min_km, max_km, total_fuel, fuel_refills, avg_refill) in self.db.cursor
+        ]
+
+        self._monthly_cache[cache_key] = combined_data
         return combined_data
 
     def _update_statistics(self):
-        """Update the statistics display"""
-        try:
+        """Refresh the statistics display without blocking the UI"""
+        now = datetime.now()
+        cache_key = (now.month, now.year, self._db_generation)
+        if self._stats_cache and self._stats_cache[0] == cache_key:
             self.stats_text.delete(1.0, tk.END)
-            
+            self.stats_text.insert(tk.END, self._stats_cache[1])
+            return
+
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, "Υπολογισμός στατιστικών...")
+        # The aggregate queries run on the I/O pool; only the final text
+        # update touches Tk, via after() polling on the main thread
+        future = self._io_pool.submit(self._compute_stats_worker)
+        self.root.after(100, lambda: self._poll_statistics(future, cache_key))
+
+    def _poll_statistics(self, future, cache_key):
+        """Paint the statistics text once the worker has finished"""
+        if not future.done():
+            self.root.after(100, lambda: self._poll_statistics(future, cache_key))
+            return
+
+        try:
+            stats_content = future.result()
+            self._stats_cache = (cache_key, stats_content)
+        except Exception as e:
+            logging.error(f"Error updating statistics: {e}")
+            stats_content = f"Σφάλμα στην ανάκτηση στατιστικών: {str(e)}"
+
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, stats_content)
+
+    @staticmethod
+    def _compute_stats_worker():
+        """Run the statistics queries on a private connection (worker thread)"""
+        # sqlite3 objects are single-thread; open a short-lived read connection
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            # Per-connection read pragmas; WAL mode itself persists in the DB
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            cursor = conn.cursor()
+
             # Current month data
             current_month = datetime.now().month
             current_year = datetime.now().year
-            
-            stats_content = f"ΣΤΑΤΙΣΤΙΚΑ ΣΤΟΙΧΕΙΑ - {current_month:02d}/{current_year}\n"
-            stats_content += "=" * 50 + "\n\n"
-            
-            # Total vehicles
-            self.db.cursor.execute("SELECT COUNT(*) FROM vehicles")
-            total_vehicles = self.db.cursor.fetchone()[0]
-            stats_content += f"Συνολικά Οχήματα: {total_vehicles}\n"
-            
-            # Total drivers
-            self.db.cursor.execute("SELECT COUNT(*) FROM drivers")
-            total_drivers = self.db.cursor.fetchone()[0]
-            stats_content += f"Συνολικοί Οδηγοί: {total_drivers}\n\n"
-            
-            # Current month movements
-            month_str = f"{current_year}-{current_month:02d}"
-            self.db.cursor.execute("""
-                SELECT COUNT(*) FROM movements 
-                WHERE date LIKE ? AND end_km IS NOT NULL
-            """, (f"{month_str}%",))
-            month_movements = self.db.cursor.fetchone()[0]
-            stats_content += f"Κινήσεις τρέχοντος μήνα: {month_movements}\n"
-            
-            # Current month kilometers
-            self.db.cursor.execute("""
-                SELECT SUM(COALESCE(end_km, 0) - COALESCE(start_km, 0)) 
-                FROM movements 
-                WHERE date LIKE ? AND end_km IS NOT NULL
-            """, (f"{month_str}%",))
-            month_km = self.db.cursor.fetchone()[0] or 0
-            stats_content += f"Χιλιόμετρα τρέχοντος μήνα: {month_km:.1f} χλμ\n"
-            
-            # Current month fuel
-            self.db.cursor.execute("""
-                SELECT SUM(liters) FROM fuel 
-                WHERE date LIKE ?
-            """, (f"{month_str}%",))
-            month_fuel = self.db.cursor.fetchone()[0] or 0
-            stats_content += f"Καύσιμα τρέχοντος μήνα: {month_fuel:.1f} L\n\n"
-            
-            # Active movements (not returned)
-            self.db.cursor.execute("SELECT COUNT(*) FROM movements WHERE end_km IS NULL")
-            active_movements = self.db.cursor.fetchone()[0]
-            stats_content += f"Ενεργές κινήσεις (δεν έχουν επιστρέψει): {active_movements}\n"
-            
-            # Tank level
-            self.db.cursor.execute("SELECT SUM(CASE WHEN type = 'fill' THEN liters ELSE -liters END) FROM tank")
-            tank_level = self.db.cursor.fetchone()[0] or 0
-            stats_content += f"Επίπεδο δεξαμενής: {tank_level:.1f} L\n\n"
-            
-            # Top 5 vehicles by distance this month
-            stats_content += "ΤΟΠ 5 ΟΧΗΜΑΤΑ (ΧΙΛΙΟΜΕΤΡΑ ΜΗΝΑ):\n"
-            stats_content += "-" * 30 + "\n"
-            
-            self.db.cursor.execute("""
-                SELECT v.plate, SUM(COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) as total_km
-                FROM vehicles v
-                LEFT JOIN movements m ON v.id = m.vehicle_id 
-                    AND m.date LIKE ? AND m.end_km IS NOT NULL
-                GROUP BY v.id, v.plate
-                ORDER BY total_km DESC
-                LIMIT 5
-            """, (f"{month_str}%",))
-            
-            for i, (plate, km) in enumerate(self.db.cursor.fetchall(), 1):
-                stats_content += f"{i}. {plate}: {km:.1f} χλμ\n"
-            
-            self.stats_text.insert(tk.END, stats_content)
-            
-        except Exception as e:
-            logging.error(f"Error updating statistics: {e}")
-            self.stats_text.insert(tk.END, f"Σφάλμα στην ανάκτηση στατιστικών: {str(e)}")
+
+            # All scalar figures in one round-trip: each subquery runs once
+            # and the whole row comes back with a single fetchone
+            month_start, month_end = _month_bounds(current_year, current_month)
+            cursor.execute(_SQL_STATS_SCALARS, (month_start, month_end))
+            (total_vehicles, total_drivers, month_movements, month_km,
+             month_fuel, active_movements, tank_level) = cursor.fetchone()
+
+            # Collect fragments and join once: O(n) instead of quadratic
+            # string reallocation
+            parts = [
+                f"ΣΤΑΤΙΣΤΙΚΑ ΣΤΟΙΧΕΙΑ - {current_month:02d}/{current_year}\n",
+                "=" * 50 + "\n\n",
+                f"Συνολικά Οχήματα: {total_vehicles}\n",
+                f"Συνολικοί Οδηγοί: {total_drivers}\n\n",
+                f"Κινήσεις τρέχοντος μήνα: {month_movements}\n",
+                f"Χιλιόμετρα τρέχοντος μήνα: {month_km:.1f} χλμ\n",
+                f"Καύσιμα τρέχοντος μήνα: {month_fuel:.1f} L\n\n",
+                f"Ενεργές κινήσεις (δεν έχουν επιστρέψει): {active_movements}\n",
+                f"Επίπεδο δεξαμενής: {tank_level:.1f} L\n\n",
+                "ΤΟΠ 5 ΟΧΗΜΑΤΑ (ΧΙΛΙΟΜΕΤΡΑ ΜΗΝΑ):\n",
+                "-" * 30 + "\n",
+            ]
+
+            cursor.execute(_SQL_STATS_TOP5, (month_start, month_end))
+            parts.extend(f"{i}. {plate}: {km:.1f} χλμ\n"
+                         for i, (plate, km) in enumerate(cursor.fetchall(), 1))
+
+            return "".join(parts)
+        finally:
+            conn.close()
     
     # Context menu methods for vehicles
     def _show_vehicle_context_menu(self, event):
@@ -3682,22 +4158,28 @@ class FleetManagerImproved(ValidationMixin):
         if not plate:
             return
 
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+        accent = theme["accent"]
+        danger = theme["danger"]
+
         history_window = tk.Toplevel(self.root)
         history_window.title(f"Ιστορικό Κινήσεων - {plate}")
         history_window.geometry("900x600")
-        history_window.configure(bg=THEMES[self.current_theme]["bg"])
+        history_window.configure(bg=bg)
 
-        title_frame = tk.Frame(history_window, bg=THEMES[self.current_theme]["bg"])
+        title_frame = tk.Frame(history_window, bg=bg)
         title_frame.pack(fill="x", padx=10, pady=5)
         tk.Label(
             title_frame,
             text=f"📋 Ιστορικό Κινήσεων: {plate}",
             font=FONT_TITLE,
-            fg=THEMES[self.current_theme]["accent"],
-            bg=THEMES[self.current_theme]["bg"],
+            fg=accent,
+            bg=bg,
         ).pack()
 
-        tree_frame = tk.Frame(history_window, bg=THEMES[self.current_theme]["bg"])
+        tree_frame = tk.Frame(history_window, bg=bg)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
         tree = ttk.Treeview(
@@ -3726,55 +4208,20 @@ class FleetManagerImproved(ValidationMixin):
         scrollbar.pack(side="right", fill="y")
 
         try:
-            self.db.cursor.execute(
-                """
-                SELECT m.date, d.name || ' ' || d.surname, COALESCE(m.movement_number, 0),
-                       m.start_km, m.end_km,
-                       (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) as total_km,
-                       m.route, m.purpose
-                FROM movements m
-                JOIN drivers d ON m.driver_id = d.id
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE v.plate = ?
-                ORDER BY m.date DESC, m.id DESC
-                """,
-                (plate,),
-            )
-            for row in self.db.cursor.fetchall():
-                formatted_row = (
-                    row[0],
-                    row[1],
-                    f"{row[2]:04d}" if row[2] > 0 else "---",
-                    f"{row[3]:.0f}" if row[3] else "",
-                    f"{row[4]:.0f}" if row[4] else "Δεν επέστρεψε",
-                    f"{row[5]:.1f}" if row[5] > 0 else "",
-                    row[6] or "",
-                    row[7] or "",
-                )
-                tree.insert("", "end", values=formatted_row)
+            self.db.cursor.execute(_SQL_VEHICLE_MOVEMENTS, (plate,))
+            # Rows arrive display-ready from SQL; one bulk pass so the
+            # scrollbar callback never fires mid-fill
+            self._bulk_insert_rows(tree, self.db.cursor)
         except Exception as e:
             logging.error(f"Error loading vehicle history: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα στην ανάκτηση δεδομένων: {str(e)}")
 
-        stats_frame = tk.Frame(history_window, bg=THEMES[self.current_theme]["bg"])
+        stats_frame = tk.Frame(history_window, bg=bg)
         stats_frame.pack(fill="x", padx=10, pady=5)
 
         try:
-            self.db.cursor.execute(
-                """
-                SELECT COUNT(*) as total_movements,
-                       SUM(COALESCE(end_km, 0) - COALESCE(start_km, 0)) as total_km,
-                       AVG(COALESCE(end_km, 0) - COALESCE(start_km, 0)) as avg_km
-                FROM movements m
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE v.plate = ? AND m.end_km IS NOT NULL
-                """,
-                (plate,),
-            )
-            result = self.db.cursor.fetchone()
-            total_movements = result[0] or 0
-            total_km = result[1] or 0
-            avg_km = result[2] or 0
+            self.db.cursor.execute(_SQL_VEHICLE_MOVEMENT_TOTALS, (plate,))
+            total_movements, total_km, avg_km = self.db.cursor.fetchone()
 
             stats_text = (
                 f"📊 Σύνολο Κινήσεων: {total_movements} | Σύνολο Χιλιόμετρα: {total_km:.1f} χλμ | "
@@ -3784,16 +4231,16 @@ class FleetManagerImproved(ValidationMixin):
                 stats_frame,
                 text=stats_text,
                 font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"],
-                fg=THEMES[self.current_theme]["fg"],
+                bg=bg,
+                fg=fg,
             ).pack()
         except Exception as e:
             logging.error(f"Error calculating vehicle statistics: {e}")
             tk.Label(
                 stats_frame,
                 text="Σφάλμα στον υπολογισμό στατιστικών",
-                fg=THEMES[self.current_theme]["danger"],
-                bg=THEMES[self.current_theme]["bg"],
+                fg=danger,
+                bg=bg,
             ).pack()
 
     def _show_vehicle_fuel_history(self):
@@ -3801,22 +4248,27 @@ class FleetManagerImproved(ValidationMixin):
         plate = self._get_selected_vehicle_plate()
         if not plate:
             return
+
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+        accent = theme["accent"]
         
         # Create fuel history window
         fuel_window = tk.Toplevel(self.root)
         fuel_window.title(f"Ιστορικό Καυσίμων - {plate}")
         fuel_window.geometry("800x500")
-        fuel_window.configure(bg=THEMES[self.current_theme]["bg"])
+        fuel_window.configure(bg=bg)
         
         # Title
-        title_frame = tk.Frame(fuel_window, bg=THEMES[self.current_theme]["bg"])
+        title_frame = tk.Frame(fuel_window, bg=bg)
         title_frame.pack(fill="x", padx=10, pady=5)
         tk.Label(title_frame, text=f"⛽ Ιστορικό Καυσίμων: {plate}", 
-                font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                bg=THEMES[self.current_theme]["bg"]).pack()
+                font=FONT_TITLE, fg=accent,
+                bg=bg).pack()
         
         # Create treeview for fuel records
-        tree_frame = tk.Frame(fuel_window, bg=THEMES[self.current_theme]["bg"])
+        tree_frame = tk.Frame(fuel_window, bg=bg)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         fuel_tree = ttk.Treeview(tree_frame, columns=("date", "driver", "liters", "mileage", "cost"), show="headings")
@@ -3839,34 +4291,21 @@ class FleetManagerImproved(ValidationMixin):
         
         # Load fuel data
         try:
-            self.db.cursor.execute("""
-                SELECT f.date, d.name || ' ' || d.surname, f.liters, f.mileage, f.cost
-                FROM fuel f
-                JOIN drivers d ON f.driver_id = d.id
-                JOIN vehicles v ON f.vehicle_id = v.id
-                WHERE v.plate = ?
-                ORDER BY f.date DESC
-            """, (plate,))
-            
-            total_fuel = 0
-            total_cost = 0
-            for row in self.db.cursor.fetchall():
-                display_row = (
-                    row[0], row[1], f"{row[2]:.1f}", 
-                    f"{row[3]:.0f}" if row[3] else "",
-                    format_currency(row[4]) if row[4] else "0.00 €"
-                )
-                fuel_tree.insert("", "end", values=display_row)
-                total_fuel += row[2]
-                total_cost += row[4] if row[4] else 0
+            self.db.cursor.execute(_SQL_VEHICLE_FUEL, (plate,))
+
+            self._bulk_insert_rows(fuel_tree, self.db.cursor)
+
+            # Totals come from SQLite's C SUM instead of per-row Python adds
+            self.db.cursor.execute(_SQL_VEHICLE_FUEL_TOTALS, (plate,))
+            total_fuel, total_cost = self.db.cursor.fetchone()
                 
             # Statistics
-            stats_frame = tk.Frame(fuel_window, bg=THEMES[self.current_theme]["bg"])
+            stats_frame = tk.Frame(fuel_window, bg=bg)
             stats_frame.pack(fill="x", padx=10, pady=5)
             stats_text = f"📊 Συνολικά Καύσιμα: {total_fuel:.1f} λίτρα | Συνολικό Κόστος: {format_currency(total_cost)}"
             tk.Label(stats_frame, text=stats_text, font=FONT_NORMAL,
-                    bg=THEMES[self.current_theme]["bg"], 
-                    fg=THEMES[self.current_theme]["fg"]).pack()
+                    bg=bg, 
+                    fg=fg).pack()
                     
         except Exception as e:
             logging.error(f"Error loading vehicle fuel history: {e}")
@@ -3877,27 +4316,33 @@ class FleetManagerImproved(ValidationMixin):
         plate = self._get_selected_vehicle_plate()
         if not plate:
             return
+
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+        accent = theme["accent"]
+        entry_bg = theme["entry_bg"]
         
         # Create statistics window
         stats_window = tk.Toplevel(self.root)
         stats_window.title(f"Στατιστικά Οχήματος - {plate}")
         stats_window.geometry("600x500")
-        stats_window.configure(bg=THEMES[self.current_theme]["bg"])
+        stats_window.configure(bg=bg)
         
         # Title
-        title_frame = tk.Frame(stats_window, bg=THEMES[self.current_theme]["bg"])
+        title_frame = tk.Frame(stats_window, bg=bg)
         title_frame.pack(fill="x", padx=10, pady=5)
         tk.Label(title_frame, text=f"📈 Στατιστικά: {plate}", 
-                font=FONT_TITLE, fg=THEMES[self.current_theme]["accent"],
-                bg=THEMES[self.current_theme]["bg"]).pack()
+                font=FONT_TITLE, fg=accent,
+                bg=bg).pack()
         
         # Text widget for statistics
-        text_frame = tk.Frame(stats_window, bg=THEMES[self.current_theme]["bg"])
+        text_frame = tk.Frame(stats_window, bg=bg)
         text_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         stats_text = tk.Text(text_frame, font=("Courier", 10), wrap=tk.WORD,
-                            bg=THEMES[self.current_theme]["entry_bg"], 
-                            fg=THEMES[self.current_theme]["fg"],
+                            bg=entry_bg, 
+                            fg=fg,
                             relief="flat", borderwidth=1)
         stats_text.pack(fill="both", expand=True)
         
@@ -3911,46 +4356,29 @@ class FleetManagerImproved(ValidationMixin):
             self.db.cursor.execute("SELECT brand, vtype, purpose FROM vehicles WHERE plate = ?", (plate,))
             vehicle_info = self.db.cursor.fetchone()
             
-            stats_content = f"ΣΤΑΤΙΣΤΙΚΑ ΟΧΗΜΑΤΟΣ: {plate}\n"
-            stats_content += "=" * 50 + "\n\n"
-            
+            # Collect fragments and join once instead of growing a string
+            parts = [f"ΣΤΑΤΙΣΤΙΚΑ ΟΧΗΜΑΤΟΣ: {plate}\n", "=" * 50 + "\n\n"]
+
             if vehicle_info:
-                stats_content += f"Μάρκα: {vehicle_info[0] or 'Δεν έχει οριστεί'}\n"
-                stats_content += f"Τύπος: {vehicle_info[1] or 'Δεν έχει οριστεί'}\n"
-                stats_content += f"Σκοπός: {vehicle_info[2] or 'Δεν έχει οριστεί'}\n\n"
-            
+                parts.append(f"Μάρκα: {vehicle_info[0] or 'Δεν έχει οριστεί'}\n")
+                parts.append(f"Τύπος: {vehicle_info[1] or 'Δεν έχει οριστεί'}\n")
+                parts.append(f"Σκοπός: {vehicle_info[2] or 'Δεν έχει οριστεί'}\n\n")
+
             # Movement statistics
-            self.db.cursor.execute("""
-                SELECT COUNT(*) as total_movements,
-                       SUM(COALESCE(end_km, 0) - COALESCE(start_km, 0)) as total_km,
-                       AVG(COALESCE(end_km, 0) - COALESCE(start_km, 0)) as avg_km,
-                       MIN(start_km) as min_km,
-                       MAX(COALESCE(end_km, start_km)) as max_km
-                FROM movements m
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE v.plate = ? AND m.end_km IS NOT NULL
-            """, (plate,))
+            self.db.cursor.execute(_SQL_VEHICLE_STATS, (plate,))
             movement_stats = self.db.cursor.fetchone()
             if movement_stats:
-                total_movements = movement_stats[0] or 0
-                total_km = movement_stats[1] or 0
-                avg_km = movement_stats[2] or 0
-                min_km = movement_stats[3] or 0
-                max_km = movement_stats[4] or 0
-                stats_content += f"Συνολικές Κινήσεις (ολοκληρωμένες): {total_movements}\n"
-                stats_content += f"Συνολικά Χιλιόμετρα: {total_km:.1f} χλμ\n"
-                stats_content += f"Μέσος Όρος Χλμ/Κίνηση: {avg_km:.1f} χλμ\n"
-                stats_content += f"Από Χλμ: {min_km:.0f} έως {max_km:.0f}\n\n"
+                total_movements, total_km, avg_km, min_km, max_km = movement_stats
+                parts.append(f"Συνολικές Κινήσεις (ολοκληρωμένες): {total_movements}\n")
+                parts.append(f"Συνολικά Χιλιόμετρα: {total_km:.1f} χλμ\n")
+                parts.append(f"Μέσος Όρος Χλμ/Κίνηση: {avg_km:.1f} χλμ\n")
+                parts.append(f"Από Χλμ: {min_km:.0f} έως {max_km:.0f}\n\n")
             # Active movements (not returned)
-            self.db.cursor.execute("""
-                SELECT COUNT(*) FROM movements m
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE v.plate = ? AND m.end_km IS NULL
-            """, (plate,))
-            active_movements = self.db.cursor.fetchone()[0] or 0
-            stats_content += f"Ενεργές κινήσεις: {active_movements}\n\n"
-
-            stats_text.insert(tk.END, stats_content)
+            self.db.cursor.execute(_SQL_VEHICLE_ACTIVE_COUNT, (plate,))
+            active_movements = self.db.cursor.fetchone()[0]
+            parts.append(f"Ενεργές κινήσεις: {active_movements}\n\n")
+
+            stats_text.insert(tk.END, "".join(parts))
         except Exception as e:
             logging.error(f"Error calculating vehicle statistics: {e}")
             stats_text.insert(tk.END, f"Σφάλμα στατιστικών: {e}")
@@ -3979,29 +4407,32 @@ class FleetManagerImproved(ValidationMixin):
             
             # Create photo viewer window
             if PIL_AVAILABLE:
+                theme = THEMES[self.current_theme]
+                bg = theme["bg"]
+                fg = theme["fg"]
                 photo_window = tk.Toplevel(self.root)
                 photo_window.title(f"Φωτογραφία Οχήματος - {plate}")
-                photo_window.configure(bg=THEMES[self.current_theme]["bg"])
-                
-                # Load and resize image
-                from PIL import Image, ImageTk
-                pil_image = Image.open(photo_path)
-                pil_image.thumbnail((600, 400), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(pil_image)
-                
-                label = tk.Label(photo_window, image=photo, bg=THEMES[self.current_theme]["bg"])
-                label.image = photo  # Keep a reference
+                photo_window.configure(bg=bg)
+
+                # Window opens instantly with a placeholder; the file read,
+                # decode and resize run on the I/O pool and the finished
+                # image is swapped in from the Tk thread
+                label = tk.Label(photo_window, text="Φόρτωση φωτογραφίας...",
+                                 font=FONT_NORMAL, bg=bg, fg=fg)
                 label.pack(padx=10, pady=10)
-                
+
                 # Add vehicle info
                 info_label = tk.Label(
-                    photo_window, 
+                    photo_window,
                     text=f"Όχημα: {plate}",
                     font=FONT_NORMAL,
-                    bg=THEMES[self.current_theme]["bg"],
-                    fg=THEMES[self.current_theme]["fg"]
+                    bg=bg,
+                    fg=fg
                 )
                 info_label.pack(pady=5)
+
+                future = self._io_pool.submit(self._decode_photo, photo_path)
+                self.root.after(50, lambda: self._poll_photo_decode(future, label))
             else:
                 messagebox.showinfo("📷 Φωτογραφία", f"Φωτογραφία οχήματος {plate}: {photo_path}")
                 
@@ -4009,6 +4440,33 @@ class FleetManagerImproved(ValidationMixin):
             logging.error(f"Error viewing vehicle photo: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την προβολή φωτογραφίας: {str(e)}")
 
+    @staticmethod
+    def _decode_photo(photo_path):
+        """Load and downscale a vehicle photo (worker thread, no Tk calls)"""
+        # Prefer the pre-rendered thumbnail; decode/resize only if missing
+        thumb_path = photo_path + ".thumb.jpg"
+        if os.path.exists(thumb_path):
+            return Image.open(thumb_path)
+        pil_image = Image.open(photo_path)
+        pil_image.thumbnail((600, 400), Image.Resampling.LANCZOS)
+        return pil_image
+
+    def _poll_photo_decode(self, future, label):
+        """Swap the decoded photo into the viewer once the worker is done"""
+        if not future.done():
+            self.root.after(50, lambda: self._poll_photo_decode(future, label))
+            return
+        if not label.winfo_exists():
+            return
+        try:
+            # ImageTk.PhotoImage must be created on the Tk thread
+            photo = ImageTk.PhotoImage(future.result())
+            label.configure(image=photo, text="")
+            label.image = photo  # Keep a reference
+        except Exception as e:
+            logging.error(f"Error decoding vehicle photo: {e}")
+            label.configure(text="Σφάλμα φόρτωσης φωτογραφίας")
+
     def _add_movement(self):
         """Add new movement with improved validation"""
         try:
@@ -4057,32 +4515,36 @@ class FleetManagerImproved(ValidationMixin):
                 messagebox.showerror("❌ Σφάλμα", "Μη έγκυρο όχημα!")
                 return
             
-            # Check if vehicle is already active
-            if self._is_vehicle_active(vehicle_id):
+            # One round-trip: open-movement check and next counter value
+            self.db.cursor.execute(_SQL_ACTIVE_AND_NEXT_NUMBER, (vehicle_id,))
+            is_active, movement_number = self.db.cursor.fetchone()
+            # A just-enqueued insert may not have committed yet, so the
+            # counter in the DB can lag what we already handed out
+            movement_number = max(movement_number, self._last_claimed_movement_number + 1)
+
+            if is_active:
                 if not ConfirmDialog(
                     self.root,
                     "⚠️ Προειδοποίηση",
                     f"Το όχημα {vehicle} έχει ήδη ενεργή κίνηση!\nΘέλετε να συνεχίσετε;"
                 ).show():
                     return
-            
-            # Get movement number
-            movement_number = self.db.get_next_movement_number()
-            
-            # Insert movement
-            self.db.cursor.execute("""
-                INSERT INTO movements (movement_number, vehicle_id, driver_id, date, start_km, route, purpose)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (movement_number, vehicle_id, driver_id, date, km_value, route, purpose))
-            
-            self.db.conn.commit()
-            
-            # Clear form
+
+            # Insert movement and claim the counter in one queued
+            # transaction; the writer thread owns the commit so the UI
+            # never waits on the fsync
+            self._last_claimed_movement_number = movement_number
+            self._enqueue_db_write([
+                (_SQL_INSERT_MOVEMENT,
+                 (movement_number, vehicle_id, driver_id, date, km_value, route, purpose)),
+                (_SQL_CLAIM_MOVEMENT_COUNTER,
+                 (str(movement_number), datetime.now().isoformat())),
+            ])
+
+            # Clear form; the tree refreshes via _after_db_write when the
+            # batch commits
             self._clear_movement_form()
-            
-            # Refresh data immediately
-            self._load_movements()
-            
+
             # Update status
             self.status_bar.set_status(f"Κίνηση #{movement_number:04d} δημιουργήθηκε επιτυχώς")
             
@@ -4101,6 +4563,90 @@ class FleetManagerImproved(ValidationMixin):
             logging.error(f"Error adding movement: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την καταχώρηση κίνησης:\n{str(e)}")
 
+    def _add_movements_bulk(self, rows):
+        """Insert many movements in one transaction
+
+        `rows` is an iterable of (movement_number, vehicle_id, driver_id,
+        date, start_km, route, purpose) tuples. One commit (one fsync)
+        covers the whole batch instead of one per row, which is what makes
+        scripted imports fast. The caller is expected to refresh the trees
+        and bump the cache generation afterwards.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self.db.conn:
+            self.db.cursor.executemany(_SQL_INSERT_MOVEMENT, rows)
+        self._bump_db_generation()
+        return len(rows)
+
+    def _enqueue_db_write(self, ops):
+        """Hand one atomic batch of (sql, params) writes to the writer thread
+
+        The caller returns immediately; the commit fsync happens off the
+        Tk thread and the movements view refreshes via root.after once
+        the batch has landed.
+        """
+        self._db_write_queue.put(list(ops))
+
+    def _db_writer_loop(self):
+        """Writer thread: apply queued write batches on a private connection
+
+        Batches that pile up while a commit is in flight are drained and
+        committed together under BEGIN IMMEDIATE. Short reads stay
+        synchronous on the main connection (WAL lets them run alongside).
+        A None sentinel (enqueued by _on_close) stops the loop once
+        everything queued before it has been committed.
+        """
+        conn = sqlite3.connect(DB_PATH)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        shutting_down = False
+        while not shutting_down:
+            batches = [self._db_write_queue.get()]
+            while True:
+                try:
+                    batches.append(self._db_write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            shutting_down = any(batch is None for batch in batches)
+            batches = [batch for batch in batches if batch is not None]
+            if not batches:
+                continue
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for batch in batches:
+                    for sql, params in batch:
+                        conn.execute(sql, params)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"Error applying queued DB writes: {e}")
+                if not shutting_down:
+                    # The user already saw an optimistic acknowledgement;
+                    # tell them the write was in fact lost
+                    self.root.after(0, self._on_db_write_failed, str(e))
+            if not shutting_down:
+                self.root.after(0, self._after_db_write)
+        conn.close()
+
+    def _after_db_write(self):
+        """Tk-thread follow-up once a queued write batch has committed"""
+        self._bump_db_generation()
+        self._load_movements()
+
+    def _on_db_write_failed(self, message):
+        """Tk-thread notification that a queued write batch rolled back
+
+        Runs before _after_db_write reloads the movement lists, so the
+        optimistically acknowledged row is gone again by the time the
+        user dismisses the dialog.
+        """
+        self.status_bar.set_status("Σφάλμα εγγραφής στη βάση!", "error")
+        messagebox.showerror("❌ Σφάλμα",
+                             f"Η καταχώρηση δεν αποθηκεύτηκε:\n{message}")
+
     def _generate_and_print_movement_document(self, movement_number, date, driver, vehicle, start_km, route, purpose):
         """Generate and print movement document"""
         try:
@@ -4119,40 +4665,76 @@ class FleetManagerImproved(ValidationMixin):
             # Create year and month directories
             year_dir = os.path.join(movements_dir, year)
             month_dir = os.path.join(year_dir, month)
-            
-            # Ensure directories exist
-            os.makedirs(month_dir, exist_ok=True)
-            
+
             # Save to organized file structure
             filename = f"movement_{movement_number:04d}_{date}.txt"
             filepath = os.path.join(month_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(doc_content)
-            
-            # Show success message with file location
-            messagebox.showinfo("✅ Έγγραφο Δημιουργήθηκε", 
-                               f"Το έγγραφο κίνησης αποθηκεύθηκε:\n{filepath}\n\n"
-                               f"Το αρχείο θα ανοίξει για εκτύπωση.")
-            
-            # Open file for printing
-            try:
-                os.startfile(filepath)  # Windows
-            except AttributeError:
-                try:
-                    import subprocess
-                    subprocess.run(['xdg-open', filepath])  # Linux
-                except:
-                    try:
-                        subprocess.run(['open', filepath])  # macOS
-                    except:
-                        pass
-            
-            log_user_action("Movement document generated", f"File: {filename}")
-            
+
+            # Write off the Tk thread; success message and print dialog
+            # follow once the file is on disk
+            future = self._io_pool.submit(self._write_movement_document, month_dir, filepath, doc_content)
+            self.root.after(50, lambda: self._poll_document_write(future, filepath, filename))
+
+        except Exception as e:
+            logging.error(f"Error generating movement document: {e}")
+            messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη δημιουργία εγγράφου:\n{str(e)}")
+
+    def _write_movement_document(self, month_dir, filepath, doc_content):
+        """Write one movement document (runs on the I/O pool)"""
+        if month_dir not in self._created_month_dirs:
+            os.makedirs(month_dir, exist_ok=True)
+            self._created_month_dirs.add(month_dir)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(doc_content)
+
+    def _poll_document_write(self, future, filepath, filename):
+        """Finish the document flow on the Tk thread once the write lands"""
+        if not future.done():
+            self.root.after(50, lambda: self._poll_document_write(future, filepath, filename))
+            return
+        try:
+            future.result()
         except Exception as e:
             logging.error(f"Error generating movement document: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη δημιουργία εγγράφου:\n{str(e)}")
+            return
+
+        # Show success message with file location
+        messagebox.showinfo("✅ Έγγραφο Δημιουργήθηκε",
+                           f"Το έγγραφο κίνησης αποθηκεύθηκε:\n{filepath}\n\n"
+                           f"Το αρχείο θα ανοίξει για εκτύπωση.")
+
+        # Open file for printing
+        self._open_external(filepath)
+
+        log_user_action("Movement document generated", f"File: {filename}")
+
+    @staticmethod
+    def _open_external(path):
+        """Open a file or folder with the platform's default application
+
+        Fire-and-forget: Popen with detached stdio, so a cold viewer
+        start never stalls the Tk event loop (os.startfile is already
+        non-blocking on Windows). Returns False when no opener worked.
+        """
+        try:
+            os.startfile(path)  # Windows
+            return True
+        except AttributeError:
+            pass  # not Windows
+        except OSError:
+            return False
+        for opener in ('xdg-open', 'open'):  # Linux, macOS
+            try:
+                subprocess.Popen([opener, path],
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
+                return True
+            except OSError:
+                continue
+        return False
 
     def _create_movement_document_content(self, movement_number, date, driver, vehicle, start_km, route, purpose):
         """Create the content for movement document"""
@@ -4162,48 +4744,21 @@ class FleetManagerImproved(ValidationMixin):
             formatted_date = date_obj.strftime("%d/%m/%Y")
         except:
             formatted_date = date
-        
-        # Create document content
-        content = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    ΕΓΓΡΑΦΟ ΚΙΝΗΣΗΣ ΟΧΗΜΑΤΟΣ                                ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
- ΑΡΙΘΜΟΣ ΚΙΝΗΣΗΣ: {movement_number:04d}
-📅 ΗΜΕΡΟΜΗΝΙΑ: {formatted_date}
-👤 ΟΔΗΓΟΣ: {driver}
-🚗 ΟΧΗΜΑ: {vehicle}
-️ ΧΙΛΙΟΜΕΤΡΑ ΑΝΑΧΩΡΗΣΗΣ: {start_km:,} χλμ
-🗺️ ΔΙΑΔΡΟΜΗ: {route or 'Δεν έχει καθοριστεί'}
- ΣΚΟΠΟΣ: {purpose or 'Δεν ορίστηκε'}
-
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                              ΥΠΟΓΡΑΦΕΣ                                     ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-👤 Υπογραφή Οδηγού: _________________    📅 Ημερομηνία: _________________
-
- Υπογραφή Υπευθύνου: _________________    📅 Ημερομηνία: _________________
-
-══════════════════════════════════════════════════════════════════════════════════
-
-📋 ΣΗΜΕΙΩΣΕΙΣ:
-• Το παρόν έγγραφο πρέπει να συμπληρωθεί κατά την επιστροφή του οχήματος
-• Χιλιόμετρα επιστροφής: _________________ χλμ
-• Συνολικά χιλιόμετρα: _________________ χλμ
-• Καύσιμα που καταναλώθηκε: _________________ L
 
-══════════════════════════════════════════════════════════════════════════════════
-
-📅 Δημιουργήθηκε: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
-🖥️ Εφαρμογή: Fleet Management System v2.0
-"""
-        
-        return content
+        return _MOVEMENT_DOC_TMPL.format(
+            movement_number=movement_number,
+            formatted_date=formatted_date,
+            driver=driver,
+            vehicle=vehicle,
+            start_km=start_km,
+            route=route or 'Δεν έχει καθοριστεί',
+            purpose=purpose or 'Δεν ορίστηκε',
+            created=datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
+        )
 
     def _clear_movement_form(self):
         """Clear movement form"""
-        self.mov_date_var.set(datetime.now().strftime("%Y-%m-%d"))
+        self.mov_date_var.set(date.today().isoformat())
         self.mov_driver_combo.set("")
         self.mov_vehicle_combo.set("")
         self.mov_start_km_var.set("")
@@ -4224,15 +4779,19 @@ class FleetManagerImproved(ValidationMixin):
             return
         
         try:
-            self.db.cursor.execute("""
-                SELECT MAX(COALESCE(end_km, start_km)) 
-                FROM movements 
-                WHERE vehicle_id = ? AND (end_km IS NOT NULL OR start_km IS NOT NULL)
-            """, (vehicle_id,))
-            
-            result = self.db.cursor.fetchone()
-            if result and result[0]:
-                self.mov_start_km_var.set(str(result[0]))
+            # Top-1 over idx_movements_vehicle_km: one index descent
+            # instead of aggregating every row of the vehicle. The cache
+            # key carries the generation so writes invalidate it for free.
+            cache_key = (vehicle_id, self._db_generation)
+            last_km = self._last_km_cache.get(cache_key)
+            if last_km is None:
+                self.db.cursor.execute(_SQL_LAST_KM, (vehicle_id,))
+                result = self.db.cursor.fetchone()
+                last_km = result[0] if result else 0
+                self._last_km_cache = {cache_key: last_km}
+
+            if last_km:
+                self.mov_start_km_var.set(str(last_km))
                 self.status_bar.set_status(f"Αυτόματη συμπλήρωση χιλιομέτρων για {vehicle}")
         except Exception as e:
             logging.error(f"Error auto-filling km: {e}")
@@ -4249,25 +4808,29 @@ class FleetManagerImproved(ValidationMixin):
                                "Ο φάκελος 'Κινήσεις' θα δημιουργηθεί όταν δημιουργήσετε την πρώτη κίνηση.")
             return
         
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        accent = theme["accent"]
+
         # Create browse window
         browse_window = tk.Toplevel(self.root)
         browse_window.title("📁 Περιήγηση Κινήσεων")
         browse_window.geometry("800x600")
-        browse_window.configure(bg=THEMES[self.current_theme]["bg"])
-        
+        browse_window.configure(bg=bg)
+
         # Title
-        title_frame = tk.Frame(browse_window, bg=THEMES[self.current_theme]["bg"])
+        title_frame = tk.Frame(browse_window, bg=bg)
         title_frame.pack(fill="x", padx=10, pady=5)
         tk.Label(
             title_frame,
             text="📁 Περιήγηση Αποθηκευμένων Κινήσεων",
             font=FONT_TITLE,
-            fg=THEMES[self.current_theme]["accent"],
-            bg=THEMES[self.current_theme]["bg"],
+            fg=accent,
+            bg=bg,
         ).pack()
-        
+
         # Create treeview for folder structure
-        tree_frame = tk.Frame(browse_window, bg=THEMES[self.current_theme]["bg"])
+        tree_frame = tk.Frame(browse_window, bg=bg)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         tree = ttk.Treeview(tree_frame, columns=("type", "count"), show="tree headings")
@@ -4291,46 +4854,46 @@ class FleetManagerImproved(ValidationMixin):
             # Root folder
             root_id = tree.insert("", "end", text="📁 Κινήσεις", values=("Φάκελος", ""), open=True)
             
-            # Get years
-            years = sorted([d for d in os.listdir(movements_dir) 
-                           if os.path.isdir(os.path.join(movements_dir, d))], reverse=True)
-            
+            # Get years (scandir: directory-vs-file comes from the dirent
+            # data, no stat call per entry)
+            with os.scandir(movements_dir) as it:
+                years = sorted((e.name for e in it if e.is_dir()), reverse=True)
+
             total_files = 0
             for year in years:
                 year_path = os.path.join(movements_dir, year)
-                months = sorted([d for d in os.listdir(year_path) 
-                               if os.path.isdir(os.path.join(year_path, d))])
-                
+                with os.scandir(year_path) as it:
+                    months = sorted(e.name for e in it if e.is_dir())
+
                 year_count = 0
                 year_id = tree.insert(root_id, "end", text=f"📅 {year}", values=("Έτος", ""), open=True)
-                
+
                 for month in months:
                     month_path = os.path.join(year_path, month)
-                    files = [f for f in os.listdir(month_path) if f.endswith('.txt')]
+                    with os.scandir(month_path) as it:
+                        files = [e.name for e in it
+                                 if e.name.endswith('.txt') and e.is_file()]
                     month_count = len(files)
                     year_count += month_count
                     total_files += month_count
                     
-                    # Greek month names
-                    month_names = {
-                        "01": "Ιανουάριος", "02": "Φεβρουάριος", "03": "Μάρτιος",
-                        "04": "Απρίλιος", "05": "Μάιος", "06": "Ιούνιος",
-                        "07": "Ιούλιος", "08": "Αύγουστος", "09": "Σεπτέμβριος",
-                        "10": "Οκτώβριος", "11": "Νοέμβριος", "12": "Δεκέμβριος"
-                    }
-                    month_name = month_names.get(month, month)
+                    try:
+                        month_name = _GREEK_MONTHS[int(month) - 1]
+                    except (ValueError, IndexError):
+                        month_name = month
                     
                     month_id = tree.insert(year_id, "end", 
                                          text=f"📂 {month_name} ({month})", 
                                          values=("Μήνας", f"{month_count} κινήσεις"))
                     
-                    # Add files
+                    # Add files; the path doubles as the iid so the
+                    # double-click handler needs no tag lookup
                     for file in sorted(files):
                         file_path = os.path.join(month_path, file)
-                        tree.insert(month_id, "end", 
-                                   text=f"📄 {file}", 
-                                   values=("Κίνηση", ""),
-                                   tags=(file_path,))
+                        tree.insert(month_id, "end",
+                                   iid=file_path,
+                                   text=f"📄 {file}",
+                                   values=("Κίνηση", ""))
                 
                 # Update year count
                 tree.set(year_id, "count", f"{year_count} κινήσεις")
@@ -4344,32 +4907,27 @@ class FleetManagerImproved(ValidationMixin):
         
         # Double-click to open file
         def on_double_click(event):
-            item = tree.selection()[0]
-            tags = tree.item(item, 'tags')
-            if tags and os.path.isfile(tags[0]):
-                try:
-                    os.startfile(tags[0])  # Windows
-                except:
-                    try:
-                        import subprocess
-                        subprocess.run(['xdg-open', tags[0]])  # Linux
-                    except:
-                        try:
-                            subprocess.run(['open', tags[0]])  # macOS
-                        except:
-                            messagebox.showinfo("📄 Αρχείο", f"Αρχείο: {tags[0]}")
+            selection = tree.selection()
+            if not selection:
+                return
+            # File nodes carry their path as the iid; folder nodes have
+            # auto-generated iids that fail the isfile check
+            path = selection[0]
+            if os.path.isfile(path):
+                if not self._open_external(path):
+                    messagebox.showinfo("📄 Αρχείο", f"Αρχείο: {path}")
         
         tree.bind("<Double-1>", on_double_click)
         
         # Buttons frame
-        buttons_frame = tk.Frame(browse_window, bg=THEMES[self.current_theme]["bg"])
+        buttons_frame = tk.Frame(browse_window, bg=bg)
         buttons_frame.pack(fill="x", padx=10, pady=5)
         
         ModernButton(
             buttons_frame,
             text="📂 Άνοιγμα Φακέλου Κινήσεων",
             style="info",
-            command=lambda: os.startfile(movements_dir) if os.path.exists(movements_dir) else None
+            command=lambda: self._open_external(movements_dir) if os.path.exists(movements_dir) else None
         ).pack(side="left", padx=5)
         
         ModernButton(
@@ -4383,72 +4941,104 @@ class FleetManagerImproved(ValidationMixin):
         """Load movements with improved filtering and performance"""
         try:
             # Clear trees
-            for item in self.tree_active.get_children():
-                self.tree_active.delete(item)
-            for item in self.tree_completed.get_children():
-                self.tree_completed.delete(item)
+            active_children = self.tree_active.get_children()
+            if active_children:
+                self.tree_active.delete(*active_children)
+            completed_children = self.tree_completed.get_children()
+            if completed_children:
+                self.tree_completed.delete(*completed_children)
             
             # Get search terms
-            active_search = self.active_search_var.get().lower() if hasattr(self, 'active_search_var') else ""
-            completed_search = self.completed_search_var.get().lower() if hasattr(self, 'completed_search_var') else ""
-            
-            # Load active movements (not returned)
-            self.db.cursor.execute("""
-                SELECT m.id, COALESCE(m.movement_number, 0), m.date, 
-                       d.name || ' ' || d.surname as driver, v.plate, 
-                       m.start_km, m.route, m.purpose
-                FROM movements m
-                JOIN drivers d ON m.driver_id = d.id
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE m.end_km IS NULL
-                ORDER BY m.date DESC, m.id DESC
-            """)
-            
-            for row in self.db.cursor.fetchall():
-                # Apply search filter
+            active_search = self.active_search_var.get().strip() if hasattr(self, 'active_search_var') else ""
+            completed_search = self.completed_search_var.get().strip() if hasattr(self, 'completed_search_var') else ""
+
+            # Both SELECTs inside one read transaction: the page cache stays
+            # warm and the shared lock is taken once. The query strings come
+            # from module constants so each variant stays one statement-cache
+            # entry (search is filtered SQL-side via _SQL_MOVEMENT_SEARCH).
+            self.db.conn.execute("BEGIN")
+            try:
+                query = _SQL_ACTIVE_MOVEMENTS
+                params = []
                 if active_search:
-                    searchable_text = f"{row[2]} {row[3]} {row[4]} {row[6]} {row[7]}".lower()
-                    if active_search not in searchable_text:
-                        continue
-                
-                mov_num_display = f"{row[1]:04d}" if row[1] > 0 else "---"
-                display_values = (mov_num_display,) + row[2:]
-                self.tree_active.insert("", "end", values=display_values, tags=(row[0],))
-            
-            # Load completed movements (today only)
-            today = datetime.now().strftime("%Y-%m-%d")
-            self.db.cursor.execute("""
-                SELECT m.id, COALESCE(m.movement_number, 0), m.date, 
-                       d.name || ' ' || d.surname as driver, v.plate, 
-                       m.start_km, m.end_km, m.route, m.purpose,
-                       (COALESCE(m.end_km, 0) - COALESCE(m.start_km, 0)) as total_km
-                FROM movements m
-                JOIN drivers d ON m.driver_id = d.id
-                JOIN vehicles v ON m.vehicle_id = v.id
-                WHERE m.end_km IS NOT NULL AND m.date = ?
-                ORDER BY m.id DESC
-            """, (today,))
-            
-            for row in self.db.cursor.fetchall():
-                # Apply search filter
+                    query += _SQL_MOVEMENT_SEARCH
+                    params.append(f"%{active_search.casefold()}%")
+                query += " ORDER BY m.date DESC, m.id DESC"
+                self.db.cursor.execute(query, params)
+                active_rows = self.db.cursor.fetchall()
+
+                # Load completed movements (today only)
+                today = date.today().isoformat()
+                query = _SQL_COMPLETED_TODAY
+                params = [today]
                 if completed_search:
-                    searchable_text = f"{row[2]} {row[3]} {row[4]} {row[7]} {row[8]}".lower()
-                    if completed_search not in searchable_text:
-                        continue
-                
-                mov_num_display = f"{row[1]:04d}" if row[1] > 0 else "---"
-                display_values = (mov_num_display,) + row[2:]
-                self.tree_completed.insert("", "end", values=display_values, tags=(row[0],))
-            
+                    query += _SQL_MOVEMENT_SEARCH
+                    params.append(f"%{completed_search.casefold()}%")
+                query += " ORDER BY m.id DESC"
+                self.db.cursor.execute(query, params)
+                completed_rows = self.db.cursor.fetchall()
+            finally:
+                self.db.conn.execute("COMMIT")
+
+            self._fill_movement_tree(self.tree_active, active_rows)
+            self._fill_movement_tree(self.tree_completed, completed_rows)
+
             self.status_bar.set_status("Κινήσεις ενημερώθηκαν")
             
         except Exception as e:
             logging.error(f"Error loading movements: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά τη φόρτωση κινήσεων: {str(e)}")
     
+    @staticmethod
+    def _fill_movement_tree(tree, rows):
+        """Bulk-insert movement rows into one tree
+
+        Like _bulk_insert_rows, but each item's iid is the movement's DB
+        id (row[0]), so selection handlers can go straight from item to
+        row without scanning. Display formatting (zero-padded number,
+        '---') is done by the SELECT, not per row in Python.
+
+        Up to _FILL_CHUNK rows go in synchronously; anything beyond that
+        is appended in after_idle slices so a huge backlog never freezes
+        the UI for the full fill. An epoch marker on the tree cancels
+        pending slices when a newer fill starts.
+        """
+        epoch = getattr(tree, '_fill_epoch', 0) + 1
+        tree._fill_epoch = epoch
+        tk_call = tree.tk.call
+        widget = tree._w
+        chunk = FleetManagerImproved._FILL_CHUNK
+
+        def insert_slice(start):
+            if tree._fill_epoch != epoch or not tree.winfo_exists():
+                return
+            end = start + chunk
+            scroll_cmd = tree['yscrollcommand']
+            tree.configure(yscrollcommand='')
+            try:
+                for row in rows[start:end]:
+                    tk_call(widget, 'insert', '', 'end',
+                            '-id', str(row[0]),
+                            '-values', row[1:])
+            finally:
+                tree.configure(yscrollcommand=scroll_cmd)
+            if end < len(rows):
+                tree.after_idle(lambda: insert_slice(end))
+            else:
+                tree.yview_moveto(tree.yview()[0])
+
+        insert_slice(0)
+
     # Utility methods
     def _get_driver_id(self, driver_name):
-        """Get driver ID from name"""
+        """Get driver ID from name (cached map first, SQL as fallback)"""
+        if not getattr(self, 'driver_ids', None):
+            # Cache not built yet (e.g. combos never loaded) — build it once
+            # instead of parsing and querying per lookup
+            self._refresh_movement_combos()
+        cached = self.driver_ids.get(driver_name)
+        if cached is not None:
+            return cached
         try:
             parts = driver_name.split(' ', 1)
             if len(parts) == 2:
@@ -4462,9 +5052,14 @@ class FleetManagerImproved(ValidationMixin):
         except Exception as e:
             logging.error(f"Error getting driver ID: {e}")
         return None
-    
+
     def _get_vehicle_id(self, plate):
-        """Get vehicle ID from plate"""
+        """Get vehicle ID from plate (cached map first, SQL as fallback)"""
+        if not getattr(self, 'vehicle_ids', None):
+            self._refresh_movement_combos()
+        cached = self.vehicle_ids.get(plate)
+        if cached is not None:
+            return cached
         try:
             self.db.cursor.execute("SELECT id FROM vehicles WHERE plate = ?", (plate,))
             result = self.db.cursor.fetchone()
@@ -4489,16 +5084,26 @@ class FleetManagerImproved(ValidationMixin):
         """Refresh all data in the application"""
         try:
             progress = ProgressDialog(self.root, "Ανανέωση Δεδομένων", "Φόρτωση δεδομένων...")
-            
+
+            # The combo SELECTs don't depend on the movements ones: fetch
+            # them on read-only connections while the Tk thread loads and
+            # paints the movement trees. Tank level is an O(1) cache read.
+            drivers_future = self._io_pool.submit(
+                self._fetch_rows_readonly,
+                "SELECT id, name, surname FROM drivers ORDER BY name, surname")
+            vehicles_future = self._io_pool.submit(
+                self._fetch_rows_readonly,
+                "SELECT id, plate FROM vehicles ORDER BY plate")
+
             progress.update_message("Φόρτωση κινήσεων...")
             self._load_movements()
-            
+
             progress.update_message("Φόρτωση οχημάτων...")
-            self._refresh_movement_combos()
-            
+            self._apply_movement_combo_rows(drivers_future.result(), vehicles_future.result())
+
             progress.update_message("Ενημέρωση δεξαμενής...")
             self._update_tank_level()
-            
+
             progress.close()
             self.status_bar.set_status("Όλα τα δεδομένα ανανεώθηκαν")
             
@@ -4511,40 +5116,56 @@ class FleetManagerImproved(ValidationMixin):
     def _refresh_movement_combos(self):
         """Refresh movement combo boxes"""
         try:
-            # Get drivers
             self.db.cursor.execute("SELECT id, name, surname FROM drivers ORDER BY name, surname")
+            driver_rows = self.db.cursor.fetchall()
+            self.db.cursor.execute("SELECT id, plate FROM vehicles ORDER BY plate")
+            vehicle_rows = self.db.cursor.fetchall()
+            self._apply_movement_combo_rows(driver_rows, vehicle_rows)
+        except Exception as e:
+            logging.error(f"Error refreshing combos: {e}")
+
+    def _apply_movement_combo_rows(self, driver_rows, vehicle_rows):
+        """Rebuild the id caches and combo values from fetched rows"""
+        try:
             drivers = []
             self.driver_ids = {}
-            
-            for row in self.db.cursor.fetchall():
+            for row in driver_rows:
                 driver_text = f"{row[1]} {row[2]}"
                 drivers.append(driver_text)
                 self.driver_ids[driver_text] = row[0]
-            
-            # Get vehicles
-            self.db.cursor.execute("SELECT id, plate FROM vehicles ORDER BY plate")
+
             vehicles = []
             self.vehicle_ids = {}
-            
-            for row in self.db.cursor.fetchall():
+            for row in vehicle_rows:
                 vehicles.append(row[1])
                 self.vehicle_ids[row[1]] = row[0]
-            
+
             # Update combo boxes
             self.mov_driver_combo.set_values(drivers)
             self.mov_vehicle_combo.set_values(vehicles)
-            
+
+            # Keep the fuel tab combos in step from the same result set,
+            # so update/delete paths can no longer leave them stale
+            try:
+                self.fuel_driver_combo.set_values(drivers)
+                self.fuel_vehicle_combo.set_values(vehicles)
+            except AttributeError:
+                pass
+
         except Exception as e:
             logging.error(f"Error refreshing combos: {e}")
     
     def _update_tank_level(self):
         """Update tank level display"""
         try:
-            self.db.cursor.execute(
-                "SELECT SUM(CASE WHEN type = 'fill' THEN liters ELSE -liters END) FROM tank"
-            )
-            level = self.db.cursor.fetchone()[0] or 0
-            
+            level = self.db.get_tank_level()
+
+            # _load_fuel calls this unconditionally; skip the widget churn
+            # when neither the level nor the theme has changed
+            if getattr(self, '_tank_display_state', None) == (level, self.current_theme):
+                return
+            self._tank_display_state = (level, self.current_theme)
+
             # Calculate percentage
             percentage = (level / TANK_CAPACITY) * 100 if TANK_CAPACITY > 0 else 0
             
@@ -4618,8 +5239,18 @@ class FleetManagerImproved(ValidationMixin):
             # Update root window
             self.root.configure(bg=theme["bg"])
             
-            # Update all widgets recursively
-            self._update_widget_theme(self.root, theme)
+            # ttk widgets retint through their shared styles: one
+            # configure per style, no per-widget traffic
+            self._configure_fleet_styles()
+            if getattr(self, '_analytics_built', False):
+                self._analytics_canvas.configure(bg=theme["frame_bg"])
+
+            # First switch walks the tree (and registers what it finds);
+            # later switches iterate the registered widgets directly
+            if self._themed_widgets:
+                self._apply_theme_to_registered(theme)
+            else:
+                self._update_widget_theme(self.root, theme)
             
             # Update menu bar to reflect new theme
             self._create_menu_bar()
@@ -4639,26 +5270,93 @@ class FleetManagerImproved(ValidationMixin):
             logging.error(f"Error changing theme: {e}")
             self.status_bar.set_status("Σφάλμα αλλαγής θέματος", "error")
     
+    def _configure_fleet_styles(self):
+        """(Re)configure the Fleet.* ttk styles for the current theme
+
+        ttk widgets share these style objects, so a theme switch is one
+        configure per style and Tk repaints every instance itself.
+        """
+        theme = THEMES[self.current_theme]
+        frame_bg = theme["frame_bg"]
+        style = ttk.Style()
+        style.configure("Fleet.TFrame", background=frame_bg)
+        style.configure("Fleet.Metric.TFrame", background=frame_bg,
+                        relief="ridge", borderwidth=1)
+        style.configure("Fleet.TLabel", background=frame_bg,
+                        foreground=theme["fg"], font=FONT_NORMAL)
+        style.configure("Fleet.Muted.TLabel", background=frame_bg,
+                        foreground=theme["text_muted"], font=FONT_NORMAL)
+        style.configure("Fleet.MetricTitle.TLabel", background=frame_bg,
+                        foreground=theme["text_muted"], font=FONT_SMALL)
+        style.configure("Fleet.Metric.TLabel", background=frame_bg,
+                        foreground=theme["accent"], font=FONT_NORMAL)
+        style.configure("Fleet.TLabelframe", background=frame_bg)
+        style.configure("Fleet.TLabelframe.Label", background=frame_bg,
+                        foreground=theme["accent"], font=FONT_SUBTITLE)
+
+    @staticmethod
+    def _theme_options_by_class(theme):
+        """Per-class configure options for a theme, computed once per apply"""
+        return {
+            "Frame": {"bg": theme["bg"]},
+            "Toplevel": {"bg": theme["bg"]},
+            "Label": {"bg": theme["bg"], "fg": theme["fg"]},
+            "Button": {"bg": theme["button_bg"], "fg": theme["button_fg"]},
+            "Entry": {"bg": theme["entry_bg"], "fg": theme["fg"]},
+        }
+
     def _update_widget_theme(self, widget, theme):
-        """Recursively update widget themes"""
-        try:
-            widget_class = widget.winfo_class()
-            
-            if widget_class in ["Frame", "Toplevel"]:
-                widget.configure(bg=theme["bg"])
-            elif widget_class == "Label":
-                widget.configure(bg=theme["bg"], fg=theme["fg"])
-            elif widget_class == "Button":
-                widget.configure(bg=theme["button_bg"], fg=theme["button_fg"])
-            elif widget_class == "Entry":
-                widget.configure(bg=theme["entry_bg"], fg=theme["fg"])
-            
-            # Update children
-            for child in widget.winfo_children():
-                self._update_widget_theme(child, theme)
-                
-        except Exception as e:
-            logging.error(f"Error updating widget theme: {e}")
+        """Update widget themes with an iterative walk
+
+        One explicit stack instead of a Python call per widget. The walk
+        doubles as discovery: every themeable widget it touches lands in
+        self._themed_widgets, so subsequent theme switches skip the
+        winfo_children() round-trips and iterate the registry instead.
+        Builders of long-lived lazy widgets (cached dialogs) call this on
+        their subtree once at build time to get registered.
+        """
+        options_by_class = self._theme_options_by_class(theme)
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            try:
+                options = options_by_class.get(w.winfo_class())
+                if options:
+                    w.configure(**options)
+                    self._themed_widgets.add(w)
+                stack.extend(w.winfo_children())
+            except Exception as e:
+                logging.error(f"Error updating widget theme: {e}")
+
+    def _register_themed(self, widget):
+        """Register a subtree's themeable widgets for later theme switches
+
+        Called by builders of long-lived lazy widgets (cached dialogs,
+        analytics frames) so they are covered even when built after the
+        registry-populating walk. No configure here — they are already
+        painted in the current theme.
+        """
+        themeable = self._theme_options_by_class(THEMES[self.current_theme])
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            try:
+                if w.winfo_class() in themeable:
+                    self._themed_widgets.add(w)
+                stack.extend(w.winfo_children())
+            except Exception as e:
+                logging.error(f"Error registering themed widget: {e}")
+
+    def _apply_theme_to_registered(self, theme):
+        """Apply a theme to the registered widgets without a tree walk"""
+        options_by_class = self._theme_options_by_class(theme)
+        for w in list(self._themed_widgets):
+            try:
+                options = options_by_class.get(w.winfo_class())
+                if options:
+                    w.configure(**options)
+            except Exception as e:
+                logging.error(f"Error updating widget theme: {e}")
     
     # System methods
     def _backup_database(self):
@@ -4674,14 +5372,43 @@ class FleetManagerImproved(ValidationMixin):
             )
             
             if backup_path:
-                if self.db.backup_database(backup_path):
-                    messagebox.showinfo("✅ Επιτυχία", f"Backup δημιουργήθηκε επιτυχώς:\n{backup_path}")
-                    self.status_bar.set_status("Backup ολοκληρώθηκε")
-                else:
-                    messagebox.showerror("❌ Σφάλμα", "Αποτυχία δημιουργίας backup!")
+                # The copy runs off the UI thread; progress and the final
+                # messagebox come back through root.after
+                self.status_bar.set_status("Δημιουργία backup...")
+                threading.Thread(target=self._run_backup, args=(backup_path,),
+                                 daemon=True).start()
         except Exception as e:
             logging.error(f"Backup error: {e}")
             messagebox.showerror("❌ Σφάλμα", f"Σφάλμα backup: {str(e)}")
+
+    def _run_backup(self, backup_path):
+        """Worker thread: online backup, posting progress to the UI"""
+        try:
+            self.db.backup_database_online(
+                backup_path,
+                progress=lambda remaining, total: self.root.after(
+                    0, self._on_backup_progress, remaining, total))
+        except Exception as e:
+            logging.error(f"Backup error: {e}")
+            self.root.after(0, self._on_backup_done, backup_path, False)
+        else:
+            self.root.after(0, self._on_backup_done, backup_path, True)
+
+    def _on_backup_progress(self, remaining, total):
+        """Show incremental backup progress in the status bar"""
+        if total:
+            percent = 100 * (total - remaining) // total
+            self.status_bar.set_status(f"Δημιουργία backup... {percent}%")
+
+    def _on_backup_done(self, backup_path, success):
+        """Completion handler for the background backup (Tk thread)"""
+        if success:
+            self.db.set_setting('last_backup', datetime.now().isoformat())
+            messagebox.showinfo("✅ Επιτυχία", f"Backup δημιουργήθηκε επιτυχώς:\n{backup_path}")
+            self.status_bar.set_status("Backup ολοκληρώθηκε")
+        else:
+            messagebox.showerror("❌ Σφάλμα", "Αποτυχία δημιουργίας backup!")
+            self.status_bar.set_status("Σφάλμα backup", "error")
     
     def _show_system_stats(self):
         """Show comprehensive system statistics"""
@@ -4695,6 +5422,13 @@ class FleetManagerImproved(ValidationMixin):
     
     def _show_help(self):
         """Show help dialog"""
+        # Static content: build the window once, then just re-show it
+        window = getattr(self, '_help_window', None)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return
+
         help_text = """
 🚗 ΟΔΗΓΙΕΣ ΧΡΗΣΗΣ ΣΥΣΤΗΜΑΤΟΣ ΔΙΑΧΕΙΡΙΣΗΣ ΣΤΟΛΟΥ
 
@@ -4724,6 +5458,10 @@ class FleetManagerImproved(ValidationMixin):
         text_widget.pack(fill="both", expand=True)
         text_widget.insert(tk.END, help_text)
         text_widget.config(state=tk.DISABLED)
+
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._register_themed(help_window)
+        self._help_window = help_window
     
     def _show_about(self):
         """Show about dialog"""
@@ -4752,94 +5490,130 @@ class FleetManagerImproved(ValidationMixin):
 
         item = selection[0]
         values = self.tree_active.item(item, "values")
-        movement_num = values[0]
-        start_km = values[4]
-
-        # Παράθυρο για καταχώρηση χλμ επιστροφής
-        def submit():
-            end_km = entry_end_km.get().strip()
-            if not end_km.isdigit() or int(end_km) < int(start_km):
-                messagebox.showerror("❌ Σφάλμα", "Τα χλμ επιστροφής πρέπει να είναι αριθμός και >= χλμ αναχώρησης!")
-                return
-            try:
-                self.db.cursor.execute(
-                    "UPDATE movements SET end_km=? WHERE movement_number=?",
-                    (int(end_km), movement_num)
-                )
-                self.db.conn.commit()
-                top.destroy()
-                self._load_movements()
-                self.status_bar.set_status(f"Η κίνηση {movement_num} έκλεισε επιτυχώς.")
-                messagebox.showinfo("✅ Επιτυχία", "Η κίνηση έκλεισε επιτυχώς!")
-            except Exception as e:
-                messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την ενημέρωση: {str(e)}")
+        # The dialog is shared across edits, so the selected movement lives
+        # on self where the submit handler picks it up
+        self._closing_movement = (int(item), values[0], values[4])
+
+        dialog = getattr(self, '_close_movement_dialog', None)
+        if dialog is None or not dialog.winfo_exists():
+            self._build_close_movement_dialog()
+            dialog = self._close_movement_dialog
+
+        movement_num = self._closing_movement[1]
+        start_km = self._closing_movement[2]
+        self._close_movement_title.config(text=f"📝 Κλείσιμο Κίνησης #{movement_num}")
+        self._close_movement_start.config(text=f"🛣️ Χλμ Αναχώρησης: {start_km}")
+        self._close_movement_entry.delete(0, 'end')
+
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.focus_set()
+        self._close_movement_entry.focus_set()
+
+    def _build_close_movement_dialog(self):
+        """Build the close-movement dialog (once; reused across edits)
+
+        Each Toplevel/Entry/button and every lambda binding registers Tcl
+        commands that tkinter never fully releases, so recreating the
+        dialog per close leaks over a long session. Build it once and
+        withdraw()/deiconify() instead; handlers are bound methods, not
+        per-open lambdas.
+        """
+        theme = THEMES[self.current_theme]
+        bg = theme["bg"]
+        fg = theme["fg"]
+        accent = theme["accent"]
 
         top = tk.Toplevel(self.root)
         top.title("Κλείσιμο Κίνησης")
         top.geometry("300x180")
-        top.configure(bg=THEMES[self.current_theme]["bg"])
-        top.grab_set()
-        
-        # Center the window
+        top.configure(bg=bg)
         top.transient(self.root)
-        top.focus_set()
-        
+        top.withdraw()
+
         # Title label
-        title_label = tk.Label(top, 
-                              text=f"📝 Κλείσιμο Κίνησης #{movement_num}", 
-                              font=FONT_SUBTITLE,
-                              bg=THEMES[self.current_theme]["bg"],
-                              fg=THEMES[self.current_theme]["accent"])
+        title_label = tk.Label(top, text="", font=FONT_SUBTITLE,
+                              bg=bg, fg=accent)
         title_label.pack(padx=10, pady=(10, 5))
-        
+
         # Start km info
-        tk.Label(top, 
-                text=f"🛣️ Χλμ Αναχώρησης: {start_km}", 
-                font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"],
-                fg=THEMES[self.current_theme]["fg"]).pack(padx=10, pady=(2, 2))
-        
+        start_label = tk.Label(top, text="", font=FONT_NORMAL,
+                              bg=bg, fg=fg)
+        start_label.pack(padx=10, pady=(2, 2))
+
         # End km input
-        tk.Label(top, 
-                text="🏁 Χλμ Επιστροφής:", 
+        tk.Label(top,
+                text="🏁 Χλμ Επιστροφής:",
                 font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["bg"],
-                fg=THEMES[self.current_theme]["fg"]).pack(padx=10, pady=(2, 2))
-        
-        entry_end_km = tk.Entry(top, 
+                bg=bg, fg=fg).pack(padx=10, pady=(2, 2))
+
+        entry_end_km = tk.Entry(top,
                                font=FONT_NORMAL,
-                               bg=THEMES[self.current_theme]["entry_bg"],
-                               fg=THEMES[self.current_theme]["fg"],
+                               bg=theme["entry_bg"],
+                               fg=fg,
                                relief="flat",
                                borderwidth=1,
                                highlightthickness=1,
-                               highlightcolor=THEMES[self.current_theme]["accent"])
+                               highlightcolor=accent)
         entry_end_km.pack(padx=10, pady=(2, 10), fill="x")
-        entry_end_km.focus_set()
-        
+
         # Add tooltip
         if hasattr(self, 'tooltip_manager'):
             self.tooltip_manager.add_tooltip(entry_end_km, "Πληκτρολογήστε τα χιλιόμετρα επιστροφής και πατήστε Enter")
-        
+
         # Bind Enter key to submit
-        entry_end_km.bind('<Return>', lambda event: submit())
-        entry_end_km.bind('<KP_Enter>', lambda event: submit())  # Numeric keypad Enter
-        
+        entry_end_km.bind('<Return>', self._submit_close_movement)
+        entry_end_km.bind('<KP_Enter>', self._submit_close_movement)  # Numeric keypad Enter
+
         # Buttons frame
-        buttons_frame = tk.Frame(top, bg=THEMES[self.current_theme]["bg"])
+        buttons_frame = tk.Frame(top, bg=bg)
         buttons_frame.pack(fill="x", padx=10, pady=(0, 10))
-        
-        btn_submit = ModernButton(buttons_frame, 
-                                 text="✅ Καταχώρηση", 
-                                 style="success", 
-                                 command=submit)
+
+        btn_submit = ModernButton(buttons_frame,
+                                 text="✅ Καταχώρηση",
+                                 style="success",
+                                 command=self._submit_close_movement)
         btn_submit.pack(side="left", padx=(0, 5))
-        
-        btn_cancel = ModernButton(buttons_frame, 
-                                 text="❌ Ακύρωση", 
-                                 style="secondary", 
-                                 command=top.destroy)
+
+        btn_cancel = ModernButton(buttons_frame,
+                                 text="❌ Ακύρωση",
+                                 style="secondary",
+                                 command=self._hide_close_movement_dialog)
         btn_cancel.pack(side="right", padx=(5, 0))
+
+        top.protocol("WM_DELETE_WINDOW", self._hide_close_movement_dialog)
+        self._register_themed(top)
+
+        self._close_movement_dialog = top
+        self._close_movement_title = title_label
+        self._close_movement_start = start_label
+        self._close_movement_entry = entry_end_km
+
+    def _hide_close_movement_dialog(self):
+        """Hide (not destroy) the close-movement dialog for reuse"""
+        self._close_movement_dialog.grab_release()
+        self._close_movement_dialog.withdraw()
+
+    def _submit_close_movement(self, event=None):
+        """Submit handler for the close-movement dialog"""
+        movement_id, movement_num, start_km = self._closing_movement
+        end_km = self._close_movement_entry.get().strip()
+        if not end_km.isdigit() or int(end_km) < int(start_km):
+            messagebox.showerror("❌ Σφάλμα", "Τα χλμ επιστροφής πρέπει να είναι αριθμός και >= χλμ αναχώρησης!")
+            return
+        try:
+            # Queued like _add_movement: the writer thread owns the
+            # fsync and rapid closes coalesce into one transaction.
+            # The id is the movement's DB id, so this also closes
+            # rows that never got a movement number.
+            self._enqueue_db_write([
+                (_SQL_CLOSE_MOVEMENT, (int(end_km), movement_id)),
+            ])
+            self._hide_close_movement_dialog()
+            self.status_bar.set_status(f"Η κίνηση {movement_num} έκλεισε επιτυχώς.")
+            messagebox.showinfo("✅ Επιτυχία", "Η κίνηση έκλεισε επιτυχώς!")
+        except Exception as e:
+            messagebox.showerror("❌ Σφάλμα", f"Σφάλμα κατά την ενημέρωση: {str(e)}")
     
     def _edit_completed_movement(self, event):
         """Edit completed movement"""
@@ -4851,7 +5625,11 @@ class FleetManagerImproved(ValidationMixin):
         """Load drivers for analytics selection"""
         try:
             drivers = self.db.get_all_drivers()
-            driver_names = [f"{driver[1]} (ID: {driver[0]})" for driver in drivers]
+            # Display string -> id, so selections resolve with a dict hit
+            # instead of re-parsing the "(ID: n)" suffix
+            self._driver_name_to_id = {
+                f"{driver[1]} (ID: {driver[0]})": driver[0] for driver in drivers}
+            driver_names = list(self._driver_name_to_id)
             self.analytics_driver_combo.set_values(driver_names)
             if driver_names:
                 self.analytics_driver_combo.set(driver_names[0])
@@ -4868,7 +5646,10 @@ class FleetManagerImproved(ValidationMixin):
                 messagebox.showwarning("Προειδοποίηση", "Παρακαλώ επιλέξτε οδηγό")
                 return
             
-            driver_id = int(selected_driver.split("ID: ")[1].split(")")[0])
+            driver_id = self._driver_name_to_id.get(selected_driver)
+            if driver_id is None:
+                # Hand-edited combo text: fall back to parsing the suffix
+                driver_id = int(selected_driver.split("ID: ")[1].split(")")[0])
             
             # Get date range
             start_date = self.analytics_start_date.get() if self.analytics_start_date.get() else None
@@ -4889,168 +5670,180 @@ class FleetManagerImproved(ValidationMixin):
     
     def _display_driver_analytics(self, analytics):
         """Display driver analytics in the UI"""
-        # Clear previous results
-        for widget in self.summary_frame.winfo_children():
-            widget.destroy()
-        for widget in self.details_frame.winfo_children():
-            widget.destroy()
-        
+        # Containers are built once and reused; each refresh only swaps the
+        # text/rows in. Destroying and recreating canvas, scrollbar and
+        # LabelFrames per click is a Tcl object creation storm.
+        if not getattr(self, '_analytics_built', False):
+            self._build_analytics_widgets()
+            self._analytics_built = True
+
+        self._analytics_info.config(text=f"👤 {analytics['driver_name']}")
+
+        metric_values = (
+            str(analytics['total_movements']),
+            f"{analytics['total_kilometers']:,.0f} km",
+            f"{analytics['total_fuel_liters']:.1f} L",
+            f"{analytics['total_fuel_cost']:.2f} €",
+            f"{analytics['avg_consumption_km_per_liter']:.2f} km/L",
+            f"{analytics['avg_cost_per_km']:.3f} €/km",
+        )
+        for label, value in zip(self._analytics_metric_labels, metric_values):
+            label.config(text=value)
+
+        # Most used vehicles: fixed pool of three labels, surplus hidden
+        vehicle_rows = analytics['most_used_vehicles'][:3]
+        for label, vehicle in zip(self._analytics_vehicle_labels, vehicle_rows):
+            label.config(text=f"🚗 {vehicle['plate']} - {vehicle['usage_count']} κινήσεις - {vehicle['total_km']:,.0f} km")
+            label.pack(anchor="w", padx=10, pady=2)
+        for label in self._analytics_vehicle_labels[len(vehicle_rows):]:
+            label.pack_forget()
+
+        monthly_rows = analytics['monthly_breakdown'][:6]
+        monthly_tree = self._analytics_monthly_tree
+        monthly_tree.delete(*monthly_tree.get_children())
+        if monthly_rows:
+            monthly_tree.configure(height=len(monthly_rows))
+            for month_data in monthly_rows:
+                monthly_tree.insert("", "end", values=(
+                    month_data['month'], month_data['movements'],
+                    f"{month_data['kilometers']:,.0f}",
+                    f"{month_data['fuel_liters']:.1f}"))
+
+        # Re-pack in canonical order; a frame that was pack_forget'ed would
+        # otherwise come back below its siblings
+        self._analytics_vehicles.pack_forget()
+        self._analytics_monthly.pack_forget()
+        if vehicle_rows:
+            self._analytics_vehicles.pack(fill="x", padx=10, pady=10)
+        if monthly_rows:
+            self._analytics_monthly.pack(fill="x", padx=10, pady=10)
+
+        # Update scroll region
+        self._analytics_content.update_idletasks()
+        self._analytics_canvas.configure(scrollregion=self._analytics_canvas.bbox("all"))
+
+        # Details Tab - Purpose breakdown
+        self._display_purpose_breakdown(analytics['purpose_breakdown'])
+
+    def _build_analytics_widgets(self):
+        """Build the analytics result widgets (once, on first display)
+
+        All ttk with Fleet.* styles: a theme switch retints them with one
+        style.configure per style instead of touching each widget.
+        """
         # Summary Tab
         summary_canvas = tk.Canvas(self.summary_frame, bg=THEMES[self.current_theme]["frame_bg"])
         summary_scrollbar = ttk.Scrollbar(self.summary_frame, orient="vertical", command=summary_canvas.yview)
         summary_canvas.configure(yscrollcommand=summary_scrollbar.set)
-        
-        summary_content = tk.Frame(summary_canvas, bg=THEMES[self.current_theme]["frame_bg"])
+
+        summary_content = ttk.Frame(summary_canvas, style="Fleet.TFrame")
         summary_canvas.create_window((0, 0), window=summary_content, anchor="nw")
-        
+        self._analytics_canvas = summary_canvas
+        self._analytics_content = summary_content
+
         # Driver info
-        info_frame = tk.LabelFrame(summary_content, text=f"👤 {analytics['driver_name']}", 
-                                  font=FONT_SUBTITLE, bg=THEMES[self.current_theme]["frame_bg"],
-                                  fg=THEMES[self.current_theme]["accent"])
+        info_frame = ttk.LabelFrame(summary_content, text="",
+                                    style="Fleet.TLabelframe")
         info_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Key metrics in a grid
-        metrics_frame = tk.Frame(info_frame, bg=THEMES[self.current_theme]["frame_bg"])
+        self._analytics_info = info_frame
+
+        # Key metrics in a grid; values are filled in on each refresh
+        metrics_frame = ttk.Frame(info_frame, style="Fleet.TFrame")
         metrics_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Row 1
-        self._create_metric_label(metrics_frame, "🚗 Συνολικές Κινήσεις", 
-                                 str(analytics['total_movements']), 0, 0)
-        self._create_metric_label(metrics_frame, "📏 Συνολικά Χιλιόμετρα", 
-                                 f"{analytics['total_kilometers']:,.0f} km", 0, 1)
-        
-        # Row 2
-        self._create_metric_label(metrics_frame, "⛽ Συνολικά Καύσιμα", 
-                                 f"{analytics['total_fuel_liters']:.1f} L", 1, 0)
-        self._create_metric_label(metrics_frame, "💰 Συνολικό Κόστος", 
-                                 f"{analytics['total_fuel_cost']:.2f} €", 1, 1)
-        
-        # Row 3
-        self._create_metric_label(metrics_frame, "📊 Μέση Κατανάλωση", 
-                                 f"{analytics['avg_consumption_km_per_liter']:.2f} km/L", 2, 0)
-        self._create_metric_label(metrics_frame, "💸 Κόστος/km", 
-                                 f"{analytics['avg_cost_per_km']:.3f} €/km", 2, 1)
-        
+
+        metric_titles = ("🚗 Συνολικές Κινήσεις", "📏 Συνολικά Χιλιόμετρα",
+                         "⛽ Συνολικά Καύσιμα", "💰 Συνολικό Κόστος",
+                         "📊 Μέση Κατανάλωση", "💸 Κόστος/km")
+        self._analytics_metric_labels = [
+            self._create_metric_label(metrics_frame, title, "", i // 2, i % 2)
+            for i, title in enumerate(metric_titles)]
+
         # Most used vehicles
-        if analytics['most_used_vehicles']:
-            vehicles_frame = tk.LabelFrame(summary_content, text="🚙 Πιο Συχνά Χρησιμοποιούμενα Οχήματα", 
-                                          font=FONT_SUBTITLE, bg=THEMES[self.current_theme]["frame_bg"],
-                                          fg=THEMES[self.current_theme]["accent"])
-            vehicles_frame.pack(fill="x", padx=10, pady=10)
-            
-            for i, vehicle in enumerate(analytics['most_used_vehicles'][:3]):
-                vehicle_info = f"🚗 {vehicle['plate']} - {vehicle['usage_count']} κινήσεις - {vehicle['total_km']:,.0f} km"
-                tk.Label(vehicles_frame, text=vehicle_info, font=FONT_NORMAL,
-                        bg=THEMES[self.current_theme]["frame_bg"],
-                        fg=THEMES[self.current_theme]["fg"]).pack(anchor="w", padx=10, pady=2)
-        
-        # Monthly breakdown
-        if analytics['monthly_breakdown']:
-            monthly_frame = tk.LabelFrame(summary_content, text="📅 Μηνιαία Στοιχεία", 
-                                         font=FONT_SUBTITLE, bg=THEMES[self.current_theme]["frame_bg"],
-                                         fg=THEMES[self.current_theme]["accent"])
-            monthly_frame.pack(fill="x", padx=10, pady=10)
-            
-            # Headers
-            headers_frame = tk.Frame(monthly_frame, bg=THEMES[self.current_theme]["frame_bg"])
-            headers_frame.pack(fill="x", padx=10, pady=5)
-            
-            tk.Label(headers_frame, text="Μήνας", font=FONT_NORMAL, width=10,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0)
-            tk.Label(headers_frame, text="Κινήσεις", font=FONT_NORMAL, width=10,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=1)
-            tk.Label(headers_frame, text="Χιλιόμετρα", font=FONT_NORMAL, width=12,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=2)
-            tk.Label(headers_frame, text="Καύσιμα (L)", font=FONT_NORMAL, width=12,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=3)
-            
-            # Data rows
-            for i, month_data in enumerate(analytics['monthly_breakdown'][:6]):
-                row_frame = tk.Frame(monthly_frame, bg=THEMES[self.current_theme]["frame_bg"])
-                row_frame.pack(fill="x", padx=10, pady=1)
-                
-                tk.Label(row_frame, text=month_data['month'], font=FONT_SMALL, width=10,
-                        bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0)
-                tk.Label(row_frame, text=str(month_data['movements']), font=FONT_SMALL, width=10,
-                        bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=1)
-                tk.Label(row_frame, text=f"{month_data['kilometers']:,.0f}", font=FONT_SMALL, width=12,
-                        bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=2)
-                tk.Label(row_frame, text=f"{month_data['fuel_liters']:.1f}", font=FONT_SMALL, width=12,
-                        bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=3)
-        
-        # Update scroll region
-        summary_content.update_idletasks()
-        summary_canvas.configure(scrollregion=summary_canvas.bbox("all"))
-        
+        self._analytics_vehicles = ttk.LabelFrame(
+            summary_content, text="🚙 Πιο Συχνά Χρησιμοποιούμενα Οχήματα",
+            style="Fleet.TLabelframe")
+        self._analytics_vehicle_labels = [
+            ttk.Label(self._analytics_vehicles, text="", style="Fleet.TLabel")
+            for _ in range(3)]
+
+        # Monthly breakdown: one Treeview instead of a Frame + four Labels
+        # per row (rows are Tcl items, not widgets)
+        self._analytics_monthly = ttk.LabelFrame(
+            summary_content, text="📅 Μηνιαία Στοιχεία",
+            style="Fleet.TLabelframe")
+        monthly_tree = ttk.Treeview(
+            self._analytics_monthly,
+            columns=("month", "movements", "km", "fuel"),
+            show="headings")
+        for col, text, width in (("month", "Μήνας", 90),
+                                 ("movements", "Κινήσεις", 80),
+                                 ("km", "Χιλιόμετρα", 100),
+                                 ("fuel", "Καύσιμα (L)", 100)):
+            monthly_tree.heading(col, text=text)
+            monthly_tree.column(col, width=width, anchor="center")
+        monthly_tree.pack(fill="x", padx=10, pady=5)
+        self._analytics_monthly_tree = monthly_tree
+
         # Pack canvas and scrollbar
         summary_canvas.pack(side="left", fill="both", expand=True)
         summary_scrollbar.pack(side="right", fill="y")
-        
-        # Details Tab - Purpose breakdown
-        self._display_purpose_breakdown(analytics['purpose_breakdown'])
-    
+
+        # Details Tab
+        self._purpose_empty_label = ttk.Label(
+            self.details_frame, text="Δεν υπάρχουν δεδομένα σκοπών",
+            style="Fleet.Muted.TLabel")
+        self._purpose_frame = ttk.LabelFrame(
+            self.details_frame, text="🎯 Ανάλυση ανά Σκοπό",
+            style="Fleet.TLabelframe")
+
+        # One Treeview instead of a Frame + four Labels per purpose
+        purpose_tree = ttk.Treeview(
+            self._purpose_frame,
+            columns=("purpose", "count", "km", "pct"),
+            show="headings")
+        for col, text, width in (("purpose", "Σκοπός", 180),
+                                 ("count", "Κινήσεις", 80),
+                                 ("km", "Χιλιόμετρα", 100),
+                                 ("pct", "Ποσοστό", 80)):
+            purpose_tree.heading(col, text=text)
+            purpose_tree.column(col, width=width, anchor="center")
+        purpose_tree.column("purpose", anchor="w")
+        purpose_tree.pack(fill="both", expand=True, padx=10, pady=5)
+        self._purpose_tree = purpose_tree
+
     def _create_metric_label(self, parent, title, value, row, col):
-        """Create a metric display label"""
-        metric_frame = tk.Frame(parent, bg=THEMES[self.current_theme]["frame_bg"], relief="ridge", bd=1)
+        """Create a metric display pair; returns the value label"""
+        metric_frame = ttk.Frame(parent, style="Fleet.Metric.TFrame")
         metric_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
         parent.grid_columnconfigure(col, weight=1)
-        
-        tk.Label(metric_frame, text=title, font=FONT_SMALL,
-                bg=THEMES[self.current_theme]["frame_bg"], 
-                fg=THEMES[self.current_theme]["text_muted"]).pack(pady=(5, 0))
-        tk.Label(metric_frame, text=value, font=FONT_NORMAL,
-                bg=THEMES[self.current_theme]["frame_bg"], 
-                fg=THEMES[self.current_theme]["accent"]).pack(pady=(0, 5))
-    
+
+        ttk.Label(metric_frame, text=title,
+                  style="Fleet.MetricTitle.TLabel").pack(pady=(5, 0))
+        value_label = ttk.Label(metric_frame, text=value,
+                                style="Fleet.Metric.TLabel")
+        value_label.pack(pady=(0, 5))
+        return value_label
+
     def _display_purpose_breakdown(self, purpose_data):
         """Display purpose breakdown in details tab"""
-        # Clear details frame
-        for widget in self.details_frame.winfo_children():
-            widget.destroy()
-        
+        if not getattr(self, '_analytics_built', False):
+            self._build_analytics_widgets()
+            self._analytics_built = True
+
         if not purpose_data:
-            tk.Label(self.details_frame, text="Δεν υπάρχουν δεδομένα σκοπών", 
-                    font=FONT_NORMAL, bg=THEMES[self.current_theme]["frame_bg"],
-                    fg=THEMES[self.current_theme]["text_muted"]).pack(pady=20)
+            self._purpose_frame.pack_forget()
+            self._purpose_empty_label.pack(pady=20)
             return
-        
-        # Purpose breakdown
-        purpose_frame = tk.LabelFrame(self.details_frame, text="🎯 Ανάλυση ανά Σκοπό", 
-                                     font=FONT_SUBTITLE, bg=THEMES[self.current_theme]["frame_bg"],
-                                     fg=THEMES[self.current_theme]["accent"])
-        purpose_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Headers
-        headers_frame = tk.Frame(purpose_frame, bg=THEMES[self.current_theme]["frame_bg"])
-        headers_frame.pack(fill="x", padx=10, pady=5)
-        
-        tk.Label(headers_frame, text="Σκοπός", font=FONT_NORMAL, width=20,
-                bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0)
-        tk.Label(headers_frame, text="Κινήσεις", font=FONT_NORMAL, width=10,
-                bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=1)
-        tk.Label(headers_frame, text="Χιλιόμετρα", font=FONT_NORMAL, width=12,
-                bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=2)
-        tk.Label(headers_frame, text="Ποσοστό", font=FONT_NORMAL, width=10,
-                bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=3)
-        
-        # Calculate total for percentages
-        total_movements = sum(p['count'] for p in purpose_data)
-        
-        # Data rows
-        for i, purpose in enumerate(purpose_data):
-            row_frame = tk.Frame(purpose_frame, bg=THEMES[self.current_theme]["frame_bg"])
-            row_frame.pack(fill="x", padx=10, pady=1)
-            
-            percentage = (purpose['count'] / total_movements * 100) if total_movements > 0 else 0
-            
-            tk.Label(row_frame, text=purpose['purpose'], font=FONT_SMALL, width=20,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=0, sticky="w")
-            tk.Label(row_frame, text=str(purpose['count']), font=FONT_SMALL, width=10,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=1)
-            tk.Label(row_frame, text=f"{purpose['total_km']:,.0f}", font=FONT_SMALL, width=12,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=2)
-            tk.Label(row_frame, text=f"{percentage:.1f}%", font=FONT_SMALL, width=10,
-                    bg=THEMES[self.current_theme]["frame_bg"], fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=3)
+
+        self._purpose_empty_label.pack_forget()
+        self._purpose_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        purpose_tree = self._purpose_tree
+        purpose_tree.delete(*purpose_tree.get_children())
+        for purpose in purpose_data:
+            purpose_tree.insert("", "end", values=(
+                purpose['purpose'], purpose['count'],
+                f"{purpose['total_km']:,.0f}", f"{purpose['percentage']:.1f}%"))
     
     def _show_all_drivers_summary(self):
         """Show summary for all drivers"""
@@ -5074,67 +5867,53 @@ class FleetManagerImproved(ValidationMixin):
     
     def _display_drivers_comparison(self, summary):
         """Display comparison of all drivers"""
+        theme = THEMES[self.current_theme]
+        frame_bg = theme["frame_bg"]
+        accent = theme["accent"]
+        muted = theme["text_muted"]
+
         # Clear comparison frame
         for widget in self.comparison_frame.winfo_children():
             widget.destroy()
         
         if not summary:
             tk.Label(self.comparison_frame, text="Δεν υπάρχουν δεδομένα", 
-                    font=FONT_NORMAL, bg=THEMES[self.current_theme]["frame_bg"],
-                    fg=THEMES[self.current_theme]["text_muted"]).pack(pady=20)
+                    font=FONT_NORMAL, bg=frame_bg,
+                    fg=muted).pack(pady=20)
             return
         
-        # Create scrollable frame
-        canvas = tk.Canvas(self.comparison_frame, bg=THEMES[self.current_theme]["frame_bg"])
-        scrollbar = ttk.Scrollbar(self.comparison_frame, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        content_frame = tk.Frame(canvas, bg=THEMES[self.current_theme]["frame_bg"])
-        canvas.create_window((0, 0), window=content_frame, anchor="nw")
-        
         # Title
-        title_label = tk.Label(content_frame, text="👥 Σύγκριση Όλων των Οδηγών", 
-                              font=FONT_SUBTITLE, bg=THEMES[self.current_theme]["frame_bg"],
-                              fg=THEMES[self.current_theme]["accent"])
+        title_label = tk.Label(self.comparison_frame, text="👥 Σύγκριση Όλων των Οδηγών",
+                              font=FONT_SUBTITLE, bg=frame_bg,
+                              fg=accent)
         title_label.pack(pady=10)
-        
-        # Headers
-        headers_frame = tk.Frame(content_frame, bg=THEMES[self.current_theme]["frame_bg"])
-        headers_frame.pack(fill="x", padx=10, pady=5)
-        
-        headers = ["Όνομα", "Κινήσεις", "Χιλιόμετρα", "Καύσιμα (L)", "Κόστος (€)", "Κατανάλωση"]
-        widths = [20, 10, 12, 12, 12, 12]
-        
-        for i, (header, width) in enumerate(zip(headers, widths)):
-            tk.Label(headers_frame, text=header, font=FONT_NORMAL, width=width,
-                    bg=THEMES[self.current_theme]["frame_bg"], 
-                    fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=i, padx=2)
-        
-        # Data rows
-        for i, driver in enumerate(summary):
-            row_frame = tk.Frame(content_frame, bg=THEMES[self.current_theme]["frame_bg"])
-            row_frame.pack(fill="x", padx=10, pady=1)
-            
-            values = [
-                driver['driver_name'],
-                str(driver['total_movements']),
-                f"{driver['total_kilometers']:,.0f}",
-                f"{driver['total_fuel_liters']:.1f}",
-                f"{driver['total_fuel_cost']:.2f}",
-                f"{driver['avg_consumption']:.2f}"
-            ]
-            
-            for j, (value, width) in enumerate(zip(values, widths)):
-                tk.Label(row_frame, text=value, font=FONT_SMALL, width=width,
-                        bg=THEMES[self.current_theme]["frame_bg"], 
-                        fg=THEMES[self.current_theme]["fg"]).grid(row=0, column=j, padx=2, sticky="w")
-        
-        # Update scroll region
-        content_frame.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
+
+        # One Treeview instead of a scrollable canvas of per-row Frames
+        # with six Labels each; the Treeview scrolls itself
+        columns = ("name", "movements", "km", "fuel", "cost", "consumption")
+        headers = ("Όνομα", "Κινήσεις", "Χιλιόμετρα", "Καύσιμα (L)", "Κόστος (€)", "Κατανάλωση")
+        widths = (180, 80, 100, 100, 100, 100)
+
+        tree = ttk.Treeview(self.comparison_frame, columns=columns, show="headings")
+        scrollbar = ttk.Scrollbar(self.comparison_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+
+        for col, header, width in zip(columns, headers, widths):
+            tree.heading(col, text=header)
+            tree.column(col, width=width, anchor="center")
+        tree.column("name", anchor="w")
+
+        self._bulk_insert_rows(tree, [
+            (driver['driver_name'],
+             driver['total_movements'],
+             f"{driver['total_kilometers']:,.0f}",
+             f"{driver['total_fuel_liters']:.1f}",
+             f"{driver['total_fuel_cost']:.2f}",
+             f"{driver['avg_consumption']:.2f}")
+            for driver in summary
+        ])
+
+        tree.pack(side="left", fill="both", expand=True, padx=10, pady=5)
         scrollbar.pack(side="right", fill="y")
     
     def _on_close(self):
@@ -5148,7 +5927,13 @@ class FleetManagerImproved(ValidationMixin):
             ).show():
                 
                 log_user_action("Application closing")
-                
+
+                # Flush queued writes first: the writer is a daemon thread
+                # and would die with the process, losing batches the UI
+                # has already acknowledged
+                self._db_write_queue.put(None)
+                self._db_writer_thread.join(timeout=5.0)
+
                 # Close database connection
                 if self.db:
                     self.db.close()
@@ -5160,25 +5945,46 @@ class FleetManagerImproved(ValidationMixin):
             logging.error(f"Error during application close: {e}")
             self.root.destroy()
 
+    _NAMED_FONTS = (
+        ("FleetBig", 'FONT_BIG'),
+        ("FleetNormal", 'FONT_NORMAL'),
+        ("FleetSmall", 'FONT_SMALL'),
+        ("FleetTitle", 'FONT_TITLE'),
+        ("FleetSubtitle", 'FONT_SUBTITLE'),
+    )
+
     def _update_font_sizes(self, screen_width, screen_height):
-        """Update font sizes based on screen dimensions"""
+        """Create or resize the named Fleet fonts for this screen
+
+        The FONT_* globals are rebound to the font *names*: Tk resolves a
+        name on every draw, so configuring the named font updates all
+        referring widgets in one Tcl call. Rewriting the tuples never
+        touched existing widgets — they captured the tuple at creation —
+        and mutating BUTTON_STYLES per call is likewise unnecessary once
+        it points at the name.
+        """
         from config import get_adaptive_font_sizes
-        
-        # Get adaptive font sizes
+
         font_sizes = get_adaptive_font_sizes(screen_width, screen_height)
-        
-        # Update global font variables
+
         global FONT_BIG, FONT_NORMAL, FONT_SMALL, FONT_TITLE, FONT_SUBTITLE
-        FONT_BIG = font_sizes['FONT_BIG']
-        FONT_NORMAL = font_sizes['FONT_NORMAL']
-        FONT_SMALL = font_sizes['FONT_SMALL']
-        FONT_TITLE = font_sizes['FONT_TITLE']
-        FONT_SUBTITLE = font_sizes['FONT_SUBTITLE']
-        
-        # Update button styles with new font sizes
+        for name, key in self._NAMED_FONTS:
+            spec = font_sizes[key]
+            weight = "bold" if "bold" in spec else "normal"
+            try:
+                tkfont.nametofont(name).configure(
+                    family=spec[0], size=spec[1], weight=weight)
+            except tk.TclError:
+                tkfont.Font(root=self.root, name=name, family=spec[0],
+                            size=spec[1], weight=weight)
+        FONT_BIG, FONT_NORMAL, FONT_SMALL, FONT_TITLE, FONT_SUBTITLE = (
+            "FleetBig", "FleetNormal", "FleetSmall", "FleetTitle", "FleetSubtitle")
+
+        # ModernButton reads its font from BUTTON_STYLES; point it at the
+        # named font so later size changes reach existing buttons too
         for style in BUTTON_STYLES.values():
-            style['font'] = FONT_NORMAL
-        
+            style['font'] = "FleetNormal"
+
         logging.info(f"Font sizes updated for {screen_width}x{screen_height} screen")
 
     def _get_adaptive_column_widths(self, base_widths):
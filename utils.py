@@ -2,6 +2,7 @@
 Utility functions for Fleet Management System
 """
 import os
+import re
 import logging
 import hashlib
 from datetime import datetime
@@ -61,7 +62,10 @@ def export_to_csv(data, headers, filename=None):
     
     if filename:
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            # Large write buffer: rows land in memory and flush in big
+            # chunks instead of a syscall per row
+            with open(filename, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(headers)
                 writer.writerows(data)
@@ -105,22 +109,30 @@ def get_file_size_mb(file_path):
     except:
         return 0
 
+# Precompiled at import so form submissions pay a match, not a compile.
+# Both patterns are fast-accept paths for the canonical formats; inputs
+# that miss them fall through to the permissive length checks below.
+_PLATE_RE = re.compile(r'^[A-ZΑ-Ω]{3}-?\d{4}$')
+_NAME_RE = re.compile(r"^[A-Za-zΑ-Ωα-ωΆ-Ώά-ώ][A-Za-zΑ-Ωα-ωΆ-Ώά-ώ\s\-']{1,49}$")
+
 class DataValidator:
     """Data validation utilities"""
-    
+
     @staticmethod
     def is_valid_plate(plate):
         """Validate vehicle plate"""
         if not plate or len(plate.strip()) < 3:
             return False, "Η πινακίδα πρέπει να έχει τουλάχιστον 3 χαρακτήρες"
-        
-        # Greek plate format validation (optional)
+
         plate = plate.strip().upper()
+        # Standard Greek plate (e.g. ΑΒΓ-1234) — accepted immediately
+        if _PLATE_RE.match(plate):
+            return True, plate
         if len(plate) > 10:
             return False, "Η πινακίδα δεν μπορεί να έχει περισσότερους από 10 χαρακτήρες"
-        
+
         return True, plate
-    
+
     @staticmethod
     def is_valid_km(km_value, min_km=0):
         """Validate kilometer value"""
@@ -152,8 +164,11 @@ class DataValidator:
         """Validate person name"""
         if not name or len(name.strip()) < 2:
             return False, "Το όνομα πρέπει να έχει τουλάχιστον 2 χαρακτήρες"
-        
+
         name = name.strip()
+        # Plain Greek/Latin name — accepted immediately
+        if _NAME_RE.match(name):
+            return True, name.title()
         if len(name) > 50:
             return False, "Το όνομα δεν μπορεί να έχει περισσότερους από 50 χαρακτήρες"
         